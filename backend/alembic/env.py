@@ -5,15 +5,21 @@ from alembic import context
 from sqlalchemy import pool
 from sqlalchemy.ext.asyncio import async_engine_from_config
 
+from app.config import settings
 from app.core.database import Base
 from app.models import *  # noqa: F401,F403 - import all models for metadata
 
 config = context.config
-if config.config_file_name is not None:
+# 연결을 넘겨받은 경우는 호출한 쪽의 로깅 설정을 그대로 둠
+if config.config_file_name is not None and "connection" not in config.attributes:
     fileConfig(config.config_file_name)
 
 target_metadata = Base.metadata
 
+# 넘겨받은 연결이 없으면 앱과 같은 DATABASE_URL 을 대상으로 함
+if "connection" not in config.attributes:
+    config.set_main_option("sqlalchemy.url", settings.DATABASE_URL.replace("%", "%%"))
+
 
 def run_migrations_offline() -> None:
     url = config.get_main_option("sqlalchemy.url")
@@ -45,6 +51,11 @@ async def run_async_migrations():
 
 
 def run_migrations_online() -> None:
+    # 이미 열린 연결을 넘겨받으면 그 연결에서 실행 (테스트, init 스크립트)
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        do_run_migrations(connection)
+        return
     asyncio.run(run_async_migrations())
 
 
@@ -0,0 +1,47 @@
+"""hot path indexes on trades, trade_logs and trade_sessions
+
+Revision ID: 0001_hot_path_indexes
+Revises:
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001_hot_path_indexes"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 테이블은 init_db(create_all)가 만들고, 새 DB 에는 모델에 선언된 인덱스가 이미 있음
+INDEXES = [
+    ("ix_trade_logs_user_created", "trade_logs", ["user_id", "created_at", "id"]),
+    (
+        "ix_trade_logs_user_category_created",
+        "trade_logs",
+        ["user_id", "category", "created_at", "id"],
+    ),
+    (
+        "ix_trade_logs_user_level_created",
+        "trade_logs",
+        ["user_id", "level", "created_at", "id"],
+    ),
+    ("ix_trades_user_created", "trades", ["user_id", "created_at", "id"]),
+    ("ix_trades_session_id", "trades", ["session_id"]),
+    ("ix_trade_sessions_user_status", "trade_sessions", ["user_id", "status"]),
+    ("ix_trade_sessions_user_created", "trade_sessions", ["user_id", "created_at"]),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, if_not_exists=True)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
@@ -0,0 +1,40 @@
+"""GIN index on trade_logs.metadata (PostgreSQL only)
+
+Revision ID: 0002_trade_log_metadata_gin
+Revises: 0001_hot_path_indexes
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002_trade_log_metadata_gin"
+down_revision: Union[str, None] = "0001_hot_path_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _is_postgres() -> bool:
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def upgrade() -> None:
+    if not _is_postgres():
+        return
+    op.create_index(
+        "ix_trade_logs_metadata_gin",
+        "trade_logs",
+        ["metadata"],
+        postgresql_using="gin",
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    if not _is_postgres():
+        return
+    op.drop_index("ix_trade_logs_metadata_gin", table_name="trade_logs", if_exists=True)
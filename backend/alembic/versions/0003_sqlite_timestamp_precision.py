@@ -0,0 +1,43 @@
+"""store microseconds in legacy SQLite created_at values
+
+Revision ID: 0003_sqlite_timestamp_precision
+Revises: 0002_trade_log_metadata_gin
+Create Date: 2026-10-19 00:00:00.000000
+
+Rows written by the ``CURRENT_TIMESTAMP`` server default are stored as
+'YYYY-MM-DD HH:MM:SS', while SQLAlchemy renders datetimes (and so keyset
+cursors) as 'YYYY-MM-DD HH:MM:SS.ffffff'. SQLite compares the two as text,
+so a cursor taken from a legacy row sorts after the row itself and paging
+repeats it. Padding the legacy values makes both forms compare correctly.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003_sqlite_timestamp_precision"
+down_revision: Union[str, None] = "0002_trade_log_metadata_gin"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# keyset 커서로 페이지를 넘기는 테이블
+TABLES = ["trade_logs", "trades"]
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    for table in TABLES:
+        op.execute(
+            sa.text(
+                f"UPDATE {table} SET created_at = created_at || '.000000' "
+                "WHERE length(created_at) = 19"
+            )
+        )
+
+
+def downgrade() -> None:
+    # 마이크로초가 붙은 값도 같은 시각이므로 되돌릴 것이 없음
+    pass
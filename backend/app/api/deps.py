@@ -1,17 +1,46 @@
+from dataclasses import dataclass
+from datetime import datetime
+
 from fastapi import Depends, Header
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
+from app.core.cache import TTLCache
 from app.core.database import get_db
 from app.core.exceptions import UnauthorizedError
 from app.core.security import decode_token
 from app.models.user import User
 
 
+@dataclass(frozen=True, slots=True)
+class CurrentUser:
+    """The authenticated user as endpoints see it: columns only, no relationships."""
+
+    id: int
+    username: str
+    created_at: datetime
+
+
+class PrincipalCache(TTLCache[int, CurrentUser]):
+    """Short-lived cache of users known to exist, keyed by id.
+
+    A valid access token only needs the database to confirm that its user
+    still exists; within ``ttl`` seconds that answer is reused, so most
+    authenticated requests cost no query at all.
+    """
+
+    def put(self, user: CurrentUser) -> None:
+        super().put(user.id, user)
+
+
+principal_cache = PrincipalCache(ttl=settings.AUTH_CACHE_SECONDS)
+
+
 async def get_current_user(
     authorization: str = Header(...),
     db: AsyncSession = Depends(get_db),
-) -> User:
+) -> CurrentUser:
     if not authorization.startswith("Bearer "):
         raise UnauthorizedError("Invalid authorization header")
 
@@ -24,9 +53,18 @@ async def get_current_user(
     if user_id is None:
         raise UnauthorizedError("Invalid token payload")
 
-    result = await db.execute(select(User).where(User.id == int(user_id)))
-    user = result.scalar_one_or_none()
-    if user is None:
+    user = principal_cache.get(int(user_id))
+    if user is not None:
+        return user
+
+    # 관계는 읽지 않고 필요한 컬럼만 조회
+    result = await db.execute(
+        select(User.id, User.username, User.created_at).where(User.id == int(user_id))
+    )
+    row = result.one_or_none()
+    if row is None:
         raise UnauthorizedError("User not found")
 
+    user = CurrentUser(id=row.id, username=row.username, created_at=row.created_at)
+    principal_cache.put(user)
     return user
@@ -3,16 +3,16 @@ from loguru import logger
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user
+from app.api.deps import CurrentUser, get_current_user
 from app.broker.kis_broker import KISBroker
 from app.core.database import get_db
 from app.core.exceptions import AppException, NotFoundError
 from app.core.security import encrypt_value
+from app.engine.ledger import ledgers
 from app.engine.manager import trading_manager
 from app.engine.state import SessionState
 from app.models.account import KISAccount
 from app.models.trade_session import TradeSession
-from app.models.user import User
 from app.schemas.account import (
     AccountCreate,
     AccountResponse,
@@ -25,6 +25,7 @@ from app.services.account_service import (
     get_user_accounts,
     mask_account_no,
 )
+from app.services.dashboard_service import invalidate_summary
 
 router = APIRouter()
 
@@ -43,7 +44,7 @@ def _to_response(account: KISAccount) -> AccountResponse:
 
 @router.get("", response_model=list[AccountResponse])
 async def list_accounts(
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     accounts = await get_user_accounts(db, current_user.id)
@@ -53,7 +54,7 @@ async def list_accounts(
 @router.post("", response_model=AccountResponse, status_code=status.HTTP_201_CREATED)
 async def create_account(
     body: AccountCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     try:
@@ -82,7 +83,7 @@ async def create_account(
 async def update_account(
     account_id: int,
     body: AccountUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     account = await get_account(db, account_id, current_user.id)
@@ -106,7 +107,7 @@ async def update_account(
 @router.delete("/{account_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_account(
     account_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     account = await get_account(db, account_id, current_user.id)
@@ -135,12 +136,14 @@ async def delete_account(
         )
 
     await db.delete(account)
+    ledgers.discard(account_id)
+    invalidate_summary(db, current_user.id)
 
 
 @router.post("/{account_id}/verify", response_model=AccountVerifyResponse)
 async def verify_account(
     account_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     account = await get_account(db, account_id, current_user.id)
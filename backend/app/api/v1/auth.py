@@ -3,7 +3,7 @@ from loguru import logger
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user
+from app.api.deps import CurrentUser, get_current_user
 from app.core.database import get_db
 from app.core.exceptions import ConflictError, UnauthorizedError
 from app.core.security import decode_token
@@ -22,7 +22,7 @@ router = APIRouter()
 
 @router.post("/register", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
 async def register(body: UserRegister, db: AsyncSession = Depends(get_db)):
-    existing = await db.execute(select(User).where(User.username == body.username))
+    existing = await db.execute(select(User.id).where(User.username == body.username))
     if existing.scalar_one_or_none():
         logger.bind(category="auth").warning(f"Registration failed: username '{body.username}' already exists")
         raise ConflictError("Username already taken")
@@ -54,5 +54,5 @@ async def refresh(body: RefreshRequest):
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_me(current_user: User = Depends(get_current_user)):
+async def get_me(current_user: CurrentUser = Depends(get_current_user)):
     return current_user
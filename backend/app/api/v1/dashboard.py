@@ -1,81 +1,107 @@
-from fastapi import APIRouter, Depends
+import asyncio
+from datetime import datetime, timedelta
+
+from fastapi import APIRouter, Depends, Query
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user
+from app.api.deps import CurrentUser, get_current_user
 from app.broker.kis_broker import KISBroker
-from app.core.database import get_db
-from app.models.user import User
+from app.core.database import async_session, get_db
+from app.engine.ledger import ledgers
+from app.market.store import KST
 from app.schemas.dashboard import (
+    DailyPnlItem,
     DashboardSummary,
     HoldingItem,
     HoldingsResponse,
     RecentTradeItem,
 )
 from app.services.account_service import get_decrypted_credentials, get_first_active_account
-from app.services.dashboard_service import (
-    get_active_session_count,
-    get_recent_trades,
-    get_today_trade_count,
-)
+from app.services.dashboard_service import get_recent_trades, get_summary_counts, summary_cache
+from app.services.pnl_service import get_daily_pnl
 
 router = APIRouter()
 
 
-@router.get("/summary", response_model=DashboardSummary)
-async def get_summary(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
-):
-    account = await get_first_active_account(db, current_user.id)
+async def _balance(user_id: int) -> tuple[float, float]:
+    """Total evaluation and profit of the user's first active account.
 
-    total_balance = 0.0
-    total_profit = 0.0
-    profit_rate = 0.0
+    Uses the shared ledger when a session keeps one for the account and
+    asks the broker otherwise. Runs on its own session so it can overlap
+    with the other summary queries.
+    """
+    async with async_session() as db:
+        account = await get_first_active_account(db, user_id)
+    if account is None:
+        return 0.0, 0.0
 
-    if account:
-        try:
-            creds = get_decrypted_credentials(account)
-            broker = KISBroker(**creds)
-            await broker.connect()
-            balance = await broker.get_balance()
-            if isinstance(balance, dict) and balance:
-                total_balance = float(balance.get("tot_evlu_amt", 0) or 0)
-                total_profit = float(balance.get("evlu_pfls_smtl_amt", 0) or 0)
-                if total_balance > 0:
-                    profit_rate = (total_profit / total_balance) * 100
-        except Exception as e:
-            logger.bind(category="dashboard").error(f"Failed to fetch balance: {e}")
+    ledger = ledgers.peek(account.id)
+    if ledger is not None:
+        summary = ledger.summary()
+        return summary["total"], summary["profit"]
+    try:
+        creds = get_decrypted_credentials(account)
+        broker = KISBroker(**creds)
+        await broker.connect()
+        balance = await broker.get_balance()
+        if isinstance(balance, dict) and balance:
+            return (
+                float(balance.get("tot_evlu_amt", 0) or 0),
+                float(balance.get("evlu_pfls_smtl_amt", 0) or 0),
+            )
+    except Exception as e:
+        logger.bind(category="dashboard").error(f"Failed to fetch balance: {e}")
+    return 0.0, 0.0
 
-    active_sessions = await get_active_session_count(db, current_user.id)
-    trades_today = await get_today_trade_count(db, current_user.id)
 
-    return DashboardSummary(
+@router.get("/summary", response_model=DashboardSummary)
+async def get_summary(
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    # 프론트가 계속 폴링하므로 몇 초간은 계산한 결과를 그대로 돌려줌
+    cached = summary_cache.get(current_user.id)
+    if cached is not None:
+        return cached
+
+    generation = summary_cache.generation(current_user.id)
+    (total_balance, total_profit), (active_sessions, trades_today) = await asyncio.gather(
+        _balance(current_user.id),
+        get_summary_counts(db, current_user.id),
+    )
+    summary = DashboardSummary(
         total_balance=total_balance,
         total_profit=total_profit,
-        profit_rate=profit_rate,
+        profit_rate=(total_profit / total_balance) * 100 if total_balance > 0 else 0.0,
         active_sessions=active_sessions,
         total_trades_today=trades_today,
     )
+    summary_cache.put_if_current(current_user.id, summary, generation)
+    return summary
 
 
 @router.get("/holdings", response_model=HoldingsResponse)
 async def get_holdings(
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     account = await get_first_active_account(db, current_user.id)
     if not account:
         return HoldingsResponse(holdings=[], total_evaluation=0)
 
-    try:
-        creds = get_decrypted_credentials(account)
-        broker = KISBroker(**creds)
-        await broker.connect()
-        holdings_raw = await broker.get_holdings()
-    except Exception as e:
-        logger.bind(category="dashboard").error(f"Failed to fetch holdings: {e}")
-        return HoldingsResponse(holdings=[], total_evaluation=0)
+    ledger = ledgers.peek(account.id)
+    if ledger is not None:
+        holdings_raw = ledger.holdings()
+    else:
+        try:
+            creds = get_decrypted_credentials(account)
+            broker = KISBroker(**creds)
+            await broker.connect()
+            holdings_raw = await broker.get_holdings()
+        except Exception as e:
+            logger.bind(category="dashboard").error(f"Failed to fetch holdings: {e}")
+            return HoldingsResponse(holdings=[], total_evaluation=0)
 
     holdings = []
     total_eval = 0.0
@@ -105,9 +131,21 @@ async def get_holdings(
     return HoldingsResponse(holdings=holdings, total_evaluation=total_eval)
 
 
+@router.get("/daily-pnl", response_model=list[DailyPnlItem])
+async def get_daily_pnl_endpoint(
+    days: int = Query(30, ge=1, le=366),
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """최근 며칠 간의 일별 실현손익 (daily_pnl 집계 테이블에서 조회)"""
+    end = datetime.now(KST).date()
+    rows = await get_daily_pnl(db, current_user.id, end - timedelta(days=days - 1), end)
+    return [DailyPnlItem(**row, net_pnl=row["realized_pnl"] - row["fees"]) for row in rows]
+
+
 @router.get("/recent-trades", response_model=list[RecentTradeItem])
 async def get_recent_trades_endpoint(
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     trades = await get_recent_trades(db, current_user.id, limit=20)
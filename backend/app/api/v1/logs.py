@@ -1,62 +1,240 @@
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import select
+import asyncio
+import json
+from typing import AsyncIterator
+
+from fastapi import APIRouter, Depends, Query, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user
-from app.core.database import get_db
+from app.api.deps import CurrentUser, get_current_user
+from app.core.database import async_session, get_db
+from app.core.export import MEDIA_TYPES, ExportFormat, encode_rows, gzip_chunks
+from app.core.log_archive import ArchivedLog, log_archive
+from app.core.pagination import (
+    DEFAULT_STREAM_BATCH,
+    decode_cursor,
+    iter_newest_first,
+    newest_first,
+    next_cursor,
+)
 from app.models.trade import Trade
 from app.models.trade_log import TradeLog
-from app.models.user import User
 from app.schemas.trading import TradeResponse
 
 router = APIRouter()
 
+# 다음 페이지 커서는 본문 형식을 바꾸지 않도록 헤더로 전달
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _trades_query(user_id: int) -> Select:
+    return select(Trade).where(Trade.user_id == user_id)
+
+
+def _logs_query(user_id: int, category: str | None, level: str | None) -> Select:
+    query = select(TradeLog).where(TradeLog.user_id == user_id)
+    if category:
+        query = query.where(TradeLog.category == category)
+    if level:
+        query = query.where(TradeLog.level == level)
+    return query
+
+
+# 내보내기 컬럼 (목록 응답과 같은 필드, 같은 순서)
+_TRADE_COLUMNS = [Trade.__table__.c[name] for name in TradeResponse.model_fields]
+_LOG_COLUMNS = [
+    TradeLog.id,
+    TradeLog.session_id,
+    TradeLog.level,
+    TradeLog.category,
+    TradeLog.message,
+    TradeLog.metadata_json.label("metadata"),
+    TradeLog.created_at,
+]
+
+
+def _log_dict(log: TradeLog | ArchivedLog) -> dict:
+    return {
+        "id": log.id,
+        "session_id": log.session_id,
+        "level": log.level,
+        "category": log.category,
+        "message": log.message,
+        "metadata": log.metadata_json,
+        "created_at": log.created_at.isoformat() if log.created_at else None,
+    }
+
 
 @router.get("/trades", response_model=list[TradeResponse])
 async def list_trades(
+    response: Response,
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
-    current_user: User = Depends(get_current_user),
+    cursor: str | None = Query(None, description="이전 응답의 X-Next-Cursor (있으면 page 무시)"),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    offset = (page - 1) * size
-    result = await db.execute(
-        select(Trade)
-        .where(Trade.user_id == current_user.id)
-        .order_by(Trade.created_at.desc())
-        .offset(offset)
-        .limit(size)
+    query = newest_first(_trades_query(current_user.id), Trade.created_at, Trade.id, cursor)
+    if not cursor:
+        query = query.offset((page - 1) * size)
+    result = await db.execute(query.limit(size))
+    trades = list(result.scalars().all())
+    if next_page := next_cursor(trades, size):
+        response.headers[NEXT_CURSOR_HEADER] = next_page
+    return trades
+
+
+@router.get("/trades/stream")
+async def stream_trades(current_user: CurrentUser = Depends(get_current_user)):
+    """The user's whole trade history, newest first, as NDJSON."""
+    rows = iter_newest_first(
+        async_session, _trades_query(current_user.id), Trade.created_at, Trade.id
     )
-    return list(result.scalars().all())
+
+    async def lines():
+        async for trade in rows:
+            yield TradeResponse.model_validate(trade).model_dump_json() + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
 
 
 @router.get("/logs")
 async def list_logs(
+    response: Response,
     page: int = Query(1, ge=1),
     size: int = Query(50, ge=1, le=200),
     category: str | None = Query(None),
     level: str | None = Query(None),
-    current_user: User = Depends(get_current_user),
+    cursor: str | None = Query(None, description="이전 응답의 X-Next-Cursor (있으면 page 무시)"),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    query = select(TradeLog).where(TradeLog.user_id == current_user.id)
-    if category:
-        query = query.where(TradeLog.category == category)
-    if level:
-        query = query.where(TradeLog.level == level)
-    query = query.order_by(TradeLog.created_at.desc()).offset((page - 1) * size).limit(size)
-
-    result = await db.execute(query)
-    logs = result.scalars().all()
-    return [
-        {
-            "id": log.id,
-            "session_id": log.session_id,
-            "level": log.level,
-            "category": log.category,
-            "message": log.message,
-            "metadata": log.metadata_json,
-            "created_at": log.created_at.isoformat() if log.created_at else None,
-        }
-        for log in logs
-    ]
+    filtered = _logs_query(current_user.id, category, level)
+    query = newest_first(filtered, TradeLog.created_at, TradeLog.id, cursor)
+    if not cursor:
+        query = query.offset((page - 1) * size)
+    result = await db.execute(query.limit(size))
+    logs: list[TradeLog | ArchivedLog] = list(result.scalars().all())
+
+    if len(logs) < size:
+        # DB 에 남은 최근 로그보다 오래된 것은 전부 압축 보관 파일에 있음
+        skip = 0
+        if not cursor and page > 1 and not logs:
+            hot = await db.scalar(select(func.count()).select_from(filtered.subquery()))
+            skip = (page - 1) * size - hot
+        logs += await asyncio.to_thread(
+            log_archive.query,
+            current_user.id,
+            category,
+            level,
+            decode_cursor(cursor) if cursor else None,
+            size - len(logs),
+            skip,
+        )
+
+    if next_page := next_cursor(logs, size):
+        response.headers[NEXT_CURSOR_HEADER] = next_page
+    return [_log_dict(log) for log in logs]
+
+
+@router.get("/logs/stream")
+async def stream_logs(
+    category: str | None = Query(None),
+    level: str | None = Query(None),
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    """The user's whole log history, newest first, as NDJSON."""
+    rows = iter_newest_first(
+        async_session,
+        _logs_query(current_user.id, category, level),
+        TradeLog.created_at,
+        TradeLog.id,
+    )
+
+    async def lines():
+        async for log in rows:
+            yield json.dumps(_log_dict(log), ensure_ascii=False) + "\n"
+        async for archived in _archived_batches(current_user.id, category, level):
+            for log in archived:
+                yield json.dumps(_log_dict(log), ensure_ascii=False) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+async def _archived_batches(
+    user_id: int, category: str | None, level: str | None
+) -> AsyncIterator[list[ArchivedLog]]:
+    """Archived logs newest first, read with the same keyset scheme one batch at a time."""
+    before = None
+    while True:
+        archived = await asyncio.to_thread(
+            log_archive.query, user_id, category, level, before, DEFAULT_STREAM_BATCH
+        )
+        if archived:
+            yield archived
+        if len(archived) < DEFAULT_STREAM_BATCH:
+            return
+        before = (archived[-1].created_at, archived[-1].id)
+
+
+async def _column_batches(query: Select) -> AsyncIterator[list[dict]]:
+    """Plain row dicts of ``query`` from one server-side cursor, a batch at a time."""
+    async with async_session() as db:
+        result = await db.stream(query.execution_options(yield_per=DEFAULT_STREAM_BATCH))
+        async for rows in result.mappings().partitions():
+            yield [dict(row) for row in rows]
+
+
+def _export_response(
+    batches: AsyncIterator[list[dict]], fmt: ExportFormat, query: Select, name: str, compress: bool
+) -> StreamingResponse:
+    body = encode_rows(batches, fmt, list(query.selected_columns.keys()))
+    filename = f"{name}.{fmt}"
+    media_type = MEDIA_TYPES[fmt]
+    if compress:
+        body, filename, media_type = gzip_chunks(body), filename + ".gz", "application/gzip"
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get("/trades/export")
+async def export_trades(
+    format: ExportFormat = Query("csv"),
+    gzip: bool = Query(False, description="gzip 으로 압축해서 내려받기"),
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    """Download the user's whole trade history, newest first."""
+    query = (
+        _trades_query(current_user.id)
+        .with_only_columns(*_TRADE_COLUMNS)
+        .order_by(Trade.created_at.desc(), Trade.id.desc())
+    )
+    return _export_response(_column_batches(query), format, query, "trades", gzip)
+
+
+@router.get("/logs/export")
+async def export_logs(
+    format: ExportFormat = Query("csv"),
+    gzip: bool = Query(False, description="gzip 으로 압축해서 내려받기"),
+    category: str | None = Query(None),
+    level: str | None = Query(None),
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    """Download the user's whole log history (archive included), newest first."""
+    query = (
+        _logs_query(current_user.id, category, level)
+        .with_only_columns(*_LOG_COLUMNS)
+        .order_by(TradeLog.created_at.desc(), TradeLog.id.desc())
+    )
+
+    async def batches():
+        async for rows in _column_batches(query):
+            yield rows
+        async for archived in _archived_batches(current_user.id, category, level):
+            yield [_log_dict(log) for log in archived]
+
+    return _export_response(batches(), format, query, "trade_logs", gzip)
@@ -1,13 +1,14 @@
+from functools import partial
+
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 
-from app.api.deps import get_current_user
+from app.api.deps import CurrentUser, get_current_user
 from app.broker.kis_broker import KISBroker
 from app.config import settings
 from app.core.database import get_db
 from app.core.exceptions import NotFoundError
-from app.models.user import User
 from app.schemas.market import (
     OHLCVResponse,
     PriceResponse,
@@ -19,6 +20,7 @@ from app.schemas.market import (
     PopularStockItem,
 )
 from app.services.account_service import get_decrypted_credentials, get_first_active_account
+from app.services.market_service import load_daily_history, with_today_bar
 
 router = APIRouter()
 
@@ -52,7 +54,7 @@ async def _get_public_broker() -> Optional[KISBroker]:
         return None
 
 
-async def _get_broker(db: AsyncSession, user: User) -> KISBroker:
+async def _get_broker(db: AsyncSession, user: CurrentUser) -> KISBroker:
     account = await get_first_active_account(db, user.id)
     if not account:
         raise NotFoundError("No active KIS account. Please add one in Settings.")
@@ -62,7 +64,7 @@ async def _get_broker(db: AsyncSession, user: User) -> KISBroker:
     return broker
 
 
-async def _get_broker_for_market_data(db: AsyncSession, user: User) -> KISBroker:
+async def _get_broker_for_market_data(db: AsyncSession, user: CurrentUser) -> KISBroker:
     """시장 데이터 조회용 브로커 - 공개 브로커 우선, 없으면 사용자 계좌 사용"""
     # 1. 공개 브로커 시도
     public_broker = await _get_public_broker()
@@ -86,7 +88,7 @@ async def _get_broker_for_market_data(db: AsyncSession, user: User) -> KISBroker
 @router.get("/price/{stock_code}", response_model=PriceResponse)
 async def get_price(
     stock_code: str,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     broker = await _get_broker(db, current_user)
@@ -97,20 +99,29 @@ async def get_price(
 @router.get("/ohlcv/{stock_code}", response_model=OHLCVResponse)
 async def get_ohlcv(
     stock_code: str,
-    period: str = Query("D", description="D=daily"),
+    period: str = Query("D", description="D=daily, W, M, 1m/5m/15m/60m=intraday"),
     count: int = Query(60, ge=1, le=200),
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    broker = await _get_broker(db, current_user)
-    data = await broker.get_ohlcv(stock_code, period, count)
+    if period != "D":
+        broker = await _get_broker(db, current_user)
+        data = await broker.get_ohlcv(stock_code, period, count)
+        return OHLCVResponse(stock_code=stock_code, data=data)
+
+    # 일봉은 로컬 저장소에서 조회하고, 부족한 구간만 브로커로 보충
+    get_broker = partial(_get_broker, db, current_user)
+    history = await load_daily_history(stock_code, count, get_broker)
+    # 거래일에는 시세로 만든 오늘 봉을 붙임 (저장소에는 마감된 날만 있음)
+    history = (await with_today_bar(history, stock_code, get_broker)).tail(count)
+    data = history.iloc[::-1].to_dict(orient="records")  # 최신순
     return OHLCVResponse(stock_code=stock_code, data=data)
 
 
 @router.get("/search", response_model=SearchResponse)
 async def search_stock(
     q: str = Query(..., min_length=1),
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
     # Simple in-memory search for popular Korean stocks
     stocks = [
@@ -151,7 +162,7 @@ async def search_stock(
 @router.get("/index/{index_type}", response_model=IndexResponse)
 async def get_market_index(
     index_type: str,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -180,7 +191,7 @@ async def get_popular_stocks(
     category: str = Query("volume", description="volume, gainers, losers"),
     market: str = Query("all", description="all, kospi, kosdaq"),
     limit: int = Query(10, ge=1, le=20),
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """
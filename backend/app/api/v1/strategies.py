@@ -2,30 +2,37 @@ from fastapi import APIRouter, Depends, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user
+from app.api.deps import CurrentUser, get_current_user
 from app.core.database import get_db
-from app.core.exceptions import NotFoundError
+from app.core.exceptions import AppException, NotFoundError
 from app.models.strategy import Strategy
-from app.models.user import User
 from app.schemas.strategy import (
     StrategyCreate,
     StrategyResponse,
     StrategyTypeInfo,
     StrategyUpdate,
 )
-from app.strategies.registry import get_available_strategies
+from app.strategies.registry import get_available_strategies, get_strategy
 
 router = APIRouter()
 
 
+def _validate_parameters(strategy_type: str, parameters: dict) -> None:
+    """Reject parameters the strategy would refuse at session start."""
+    try:
+        get_strategy(strategy_type, parameters)
+    except ValueError as e:
+        raise AppException(f"Invalid parameters: {e}") from e
+
+
 @router.get("/types", response_model=list[StrategyTypeInfo])
-async def list_strategy_types(current_user: User = Depends(get_current_user)):
+async def list_strategy_types(current_user: CurrentUser = Depends(get_current_user)):
     return get_available_strategies()
 
 
 @router.get("", response_model=list[StrategyResponse])
 async def list_strategies(
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     result = await db.execute(
@@ -39,13 +46,14 @@ async def list_strategies(
 @router.post("", response_model=StrategyResponse, status_code=status.HTTP_201_CREATED)
 async def create_strategy(
     body: StrategyCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     # Validate strategy type
     available = {s["type_name"] for s in get_available_strategies()}
     if body.strategy_type not in available:
         raise NotFoundError(f"Unknown strategy type: {body.strategy_type}")
+    _validate_parameters(body.strategy_type, body.parameters)
 
     strategy = Strategy(
         user_id=current_user.id,
@@ -63,7 +71,7 @@ async def create_strategy(
 async def update_strategy(
     strategy_id: int,
     body: StrategyUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     result = await db.execute(
@@ -78,6 +86,7 @@ async def update_strategy(
     if body.name is not None:
         strategy.name = body.name
     if body.parameters is not None:
+        _validate_parameters(strategy.strategy_type, body.parameters)
         strategy.parameters = body.parameters
     if body.is_active is not None:
         strategy.is_active = body.is_active
@@ -90,7 +99,7 @@ async def update_strategy(
 @router.delete("/{strategy_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_strategy(
     strategy_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     result = await db.execute(
@@ -3,24 +3,38 @@ from datetime import datetime, timezone
 from fastapi import APIRouter, Depends
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 
-from app.api.deps import get_current_user
+from app.api.deps import CurrentUser, get_current_user
 from app.broker.kis_broker import KISBroker
 from app.core.database import get_db
 from app.core.exceptions import AppException, NotFoundError
+from app.engine.ledger import ledgers
 from app.engine.manager import trading_manager
 from app.engine.state import SessionState, can_transition
+from app.engine.trade_writer import trade_writer
+from app.models.account import KISAccount
 from app.models.strategy import Strategy
 from app.models.trade_session import TradeSession
-from app.models.user import User
-from app.schemas.trading import AccountInfo, BuyableQuantityResponse, SessionResponse, TradingStartRequest
+from app.schemas.trading import (
+    AccountInfo,
+    BuyableQuantityResponse,
+    SessionResponse,
+    TradeWriterStatus,
+    TradingStartRequest,
+)
 from app.services.account_service import get_account, get_decrypted_credentials, mask_account_no
+from app.services.dashboard_service import invalidate_summary
 from app.strategies.registry import get_strategy
 from app.ws.manager import ws_manager
 
 router = APIRouter()
 
+# SessionResponse 가 쓰는 계좌 컬럼만 함께 조회 (암호화된 키, 체결 내역은 읽지 않음)
+_ACCOUNT_INFO = joinedload(TradeSession.account).load_only(
+    KISAccount.id, KISAccount.label, KISAccount.account_no
+)
+
 
 def _to_session_response(session: TradeSession) -> SessionResponse:
     """TradeSession을 SessionResponse로 변환"""
@@ -53,7 +67,7 @@ def _to_session_response(session: TradeSession) -> SessionResponse:
 @router.post("/start", response_model=SessionResponse)
 async def start_trading(
     body: TradingStartRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     # Validate account
@@ -85,6 +99,7 @@ async def start_trading(
     )
     db.add(session)
     await db.flush()
+    invalidate_summary(db, current_user.id)
     await db.refresh(session, ["account"])
 
     # Create broker and strategy instances
@@ -93,6 +108,8 @@ async def start_trading(
     await broker.connect()
 
     strategy = get_strategy(strategy_model.strategy_type, strategy_model.parameters)
+    # 같은 계좌의 세션들은 잔고 스냅샷 하나로 시작한 원장을 공유
+    ledger = await ledgers.get(account.id, current_user.id, broker)
 
     # Start engine
     trading_manager.start_session(
@@ -104,6 +121,8 @@ async def start_trading(
         stock_name=body.stock_name or body.stock_code,
         interval_seconds=body.interval_seconds,
         order_quantity=body.quantity,
+        timeframe=body.timeframe,
+        ledger=ledger,
     )
 
     await ws_manager.send_to_user(
@@ -119,7 +138,7 @@ async def start_trading(
 @router.post("/stop/{session_id}", response_model=SessionResponse)
 async def stop_trading(
     session_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     session = await _get_session(db, session_id, current_user.id)
@@ -130,7 +149,7 @@ async def stop_trading(
     session.status = SessionState.STOPPED
     session.stopped_at = datetime.now(timezone.utc)
     await db.flush()
-    await db.refresh(session, ["account"])
+    invalidate_summary(db, current_user.id)
 
     await ws_manager.send_to_user(
         current_user.id,
@@ -144,7 +163,7 @@ async def stop_trading(
 @router.post("/pause/{session_id}", response_model=SessionResponse)
 async def pause_trading(
     session_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     session = await _get_session(db, session_id, current_user.id)
@@ -154,14 +173,14 @@ async def pause_trading(
     trading_manager.pause_session(session_id)
     session.status = SessionState.PAUSED
     await db.flush()
-    await db.refresh(session, ["account"])
+    invalidate_summary(db, current_user.id)
     return _to_session_response(session)
 
 
 @router.post("/resume/{session_id}", response_model=SessionResponse)
 async def resume_trading(
     session_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     session = await _get_session(db, session_id, current_user.id)
@@ -171,18 +190,18 @@ async def resume_trading(
     trading_manager.resume_session(session_id)
     session.status = SessionState.RUNNING
     await db.flush()
-    await db.refresh(session, ["account"])
+    invalidate_summary(db, current_user.id)
     return _to_session_response(session)
 
 
 @router.get("/sessions", response_model=list[SessionResponse])
 async def list_sessions(
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     result = await db.execute(
         select(TradeSession)
-        .options(selectinload(TradeSession.account))
+        .options(_ACCOUNT_INFO)
         .where(TradeSession.user_id == current_user.id)
         .order_by(TradeSession.created_at.desc())
         .limit(50)
@@ -193,12 +212,12 @@ async def list_sessions(
 
 @router.get("/active", response_model=list[SessionResponse])
 async def list_active_sessions(
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     result = await db.execute(
         select(TradeSession)
-        .options(selectinload(TradeSession.account))
+        .options(_ACCOUNT_INFO)
         .where(
             TradeSession.user_id == current_user.id,
             TradeSession.status.in_(
@@ -210,11 +229,23 @@ async def list_active_sessions(
     return [_to_session_response(s) for s in sessions]
 
 
+@router.get("/writer", response_model=TradeWriterStatus)
+async def get_trade_writer_status(current_user: CurrentUser = Depends(get_current_user)):
+    """체결 기록기 상태 - DB 장애로 기록이 밀리고 있는지 확인"""
+    return TradeWriterStatus(
+        pending=trade_writer.pending,
+        written=trade_writer.written,
+        spilled=trade_writer.spilled,
+        failing=trade_writer.failing,
+        last_error=trade_writer.last_error,
+    )
+
+
 @router.get("/buyable/{account_id}/{stock_code}", response_model=BuyableQuantityResponse)
 async def get_buyable_quantity(
     account_id: int,
     stock_code: str,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """해당 계좌로 특정 종목을 최대 몇 주까지 매수할 수 있는지 조회"""
@@ -235,9 +266,13 @@ async def get_buyable_quantity(
         if current_price <= 0:
             raise AppException("현재가를 조회할 수 없습니다. 종목 코드를 확인해주세요.")
 
-        # 잔고 조회 (예수금)
-        balance = await broker.get_balance()
-        available_cash = int(float(balance.get("dnca_tot_amt", 0) or 0))
+        # 예수금: 실행 중인 계좌는 원장에서, 아니면 잔고 조회
+        ledger = ledgers.peek(account.id)
+        if ledger is not None:
+            available_cash = int(ledger.cash)
+        else:
+            balance = await broker.get_balance()
+            available_cash = int(float(balance.get("dnca_tot_amt", 0) or 0))
 
         # 매수 가능 수량 계산
         max_quantity = available_cash // current_price if current_price > 0 else 0
@@ -264,9 +299,9 @@ async def _get_session(
     db: AsyncSession, session_id: int, user_id: int
 ) -> TradeSession:
     result = await db.execute(
-        select(TradeSession).where(
-            TradeSession.id == session_id, TradeSession.user_id == user_id
-        )
+        select(TradeSession)
+        .options(_ACCOUNT_INFO)
+        .where(TradeSession.id == session_id, TradeSession.user_id == user_id)
     )
     session = result.scalar_one_or_none()
     if not session:
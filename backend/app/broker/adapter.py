@@ -20,6 +20,10 @@ class BrokerAdapter(ABC):
         """Retrieve current stock holdings."""
         ...
 
+    async def get_account_snapshot(self) -> dict[str, Any]:
+        """Balance summary and holdings as ``{"balance": ..., "holdings": [...]}``."""
+        return {"balance": await self.get_balance(), "holdings": await self.get_holdings()}
+
     @abstractmethod
     async def get_current_price(self, stock_code: str) -> dict[str, Any]:
         """Retrieve the current price for a given stock code."""
@@ -29,9 +33,20 @@ class BrokerAdapter(ABC):
     async def get_ohlcv(
         self, stock_code: str, period: str = "D", count: int = 60
     ) -> list[dict[str, Any]]:
-        """Retrieve OHLCV (Open/High/Low/Close/Volume) data."""
+        """Retrieve OHLCV (Open/High/Low/Close/Volume) data, newest first.
+
+        ``period`` is ``D``/``W``/``M`` or an intraday timeframe
+        (``1m``, ``5m``, ``15m``, ``60m``) covering the current session.
+        """
         ...
 
+    async def get_ohlcv_range(
+        self, stock_code: str, period: str, start_day: str, end_day: str
+    ) -> list[dict[str, Any]]:
+        """Retrieve OHLCV data between two YYYYMMDD dates (inclusive)."""
+        records = await self.get_ohlcv(stock_code, period, 200)
+        return [r for r in records if start_day <= r["date"] <= end_day]
+
     @abstractmethod
     async def buy_market(self, stock_code: str, quantity: int) -> dict[str, Any]:
         """Place a market buy order."""
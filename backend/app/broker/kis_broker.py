@@ -1,4 +1,5 @@
 import asyncio
+from datetime import datetime, timedelta
 from typing import Any
 
 from loguru import logger
@@ -6,6 +7,11 @@ from loguru import logger
 from app.broker.adapter import BrokerAdapter
 from app.broker.exceptions import BrokerConnectionError, BrokerOrderError
 from app.broker.rate_limiter import TokenBucketRateLimiter
+from app.market.bars import INTRADAY_TIMEFRAMES, resample
+from app.market.store import KST, records_to_array, ts_to_date
+
+# 당일 분봉 조회 1회당 반환되는 1분봉 수
+_MINUTE_PAGE_SIZE = 30
 
 
 class KISBroker(BrokerAdapter):
@@ -106,6 +112,26 @@ class KISBroker(BrokerAdapter):
         except Exception as e:
             raise BrokerConnectionError(f"Failed to fetch holdings: {e}") from e
 
+    async def get_account_snapshot(self) -> dict[str, Any]:
+        """잔고 요약과 보유 종목을 fetch_balance 한 번으로 조회합니다."""
+        try:
+            await self._rate_limiter.acquire()
+            result = await asyncio.to_thread(self._broker.fetch_balance)
+        except Exception as e:
+            raise BrokerConnectionError(f"Failed to fetch balance: {e}") from e
+
+        balance = self._parse_balance_result(result)
+        if balance:
+            self._cached_balance = balance
+        if hasattr(result, "to_dict"):
+            records = result.to_dict(orient="records")
+        elif isinstance(result, dict):
+            records = result.get("output1") or []
+        else:
+            records = []
+        holdings = [r for r in records if int(float(r.get("hldg_qty", 0) or 0)) > 0]
+        return {"balance": balance, "holdings": holdings}
+
     async def get_current_price(self, stock_code: str) -> dict[str, Any]:
         try:
             await self._rate_limiter.acquire()
@@ -130,28 +156,112 @@ class KISBroker(BrokerAdapter):
     async def get_ohlcv(
         self, stock_code: str, period: str = "D", count: int = 60
     ) -> list[dict[str, Any]]:
+        if period in INTRADAY_TIMEFRAMES:
+            return await self._get_intraday_ohlcv(stock_code, period, count)
         try:
             await self._rate_limiter.acquire()
             result = await asyncio.to_thread(
                 self._broker.fetch_ohlcv, stock_code, timeframe=period, adj_price=True
             )
-            if hasattr(result, "to_dict"):
-                records = result.to_dict(orient="records")
-                return [
-                    {
-                        "date": str(r.get("stck_bsop_date", "")),
-                        "open": float(r.get("stck_oprc", 0)),
-                        "high": float(r.get("stck_hgpr", 0)),
-                        "low": float(r.get("stck_lwpr", 0)),
-                        "close": float(r.get("stck_clpr", 0)),
-                        "volume": int(r.get("acml_vol", 0)),
-                    }
-                    for r in records[:count]
-                ]
-            return []
+            return self._parse_ohlcv_result(result)[:count]
         except Exception as e:
             raise BrokerConnectionError(f"Failed to fetch OHLCV for {stock_code}: {e}") from e
 
+    async def get_ohlcv_range(
+        self, stock_code: str, period: str, start_day: str, end_day: str
+    ) -> list[dict[str, Any]]:
+        """기간 지정 OHLCV 조회 (KIS는 한 번에 최대 100개 봉을 반환)"""
+        try:
+            await self._rate_limiter.acquire()
+            result = await asyncio.to_thread(
+                self._broker.fetch_ohlcv,
+                stock_code,
+                timeframe=period,
+                start_day=start_day,
+                end_day=end_day,
+                adj_price=True,
+            )
+            return self._parse_ohlcv_result(result)
+        except Exception as e:
+            raise BrokerConnectionError(f"Failed to fetch OHLCV for {stock_code}: {e}") from e
+
+    async def _get_intraday_ohlcv(
+        self, stock_code: str, period: str, count: int
+    ) -> list[dict[str, Any]]:
+        """당일 분봉 조회: 1분봉을 30개씩 거슬러 올라가며 모아 period 단위로 재집계"""
+        minutes = INTRADAY_TIMEFRAMES[period]
+        needed = count * minutes
+        records: list[dict[str, Any]] = []
+        to = datetime.now(KST).strftime("%H%M%S")
+        try:
+            while len(records) < needed:
+                await self._rate_limiter.acquire()
+                result = await asyncio.to_thread(
+                    self._broker._fetch_today_1m_ohlcv, stock_code, to
+                )
+                page = self._parse_minute_result(result)
+                if not page:
+                    break
+                records.extend(page)
+                earliest = datetime.strptime(page[-1]["date"][-4:], "%H%M")
+                if len(page) < _MINUTE_PAGE_SIZE or (earliest.hour, earliest.minute) <= (9, 0):
+                    break
+                to = (earliest - timedelta(minutes=1)).strftime("%H%M00")
+        except Exception as e:
+            raise BrokerConnectionError(f"Failed to fetch OHLCV for {stock_code}: {e}") from e
+
+        bars = resample(records_to_array(records), minutes)[::-1][:count]
+        return [
+            {
+                "date": ts_to_date(bar["ts"], period),
+                "open": float(bar["open"]),
+                "high": float(bar["high"]),
+                "low": float(bar["low"]),
+                "close": float(bar["close"]),
+                "volume": int(bar["volume"]),
+            }
+            for bar in bars
+        ]
+
+    @staticmethod
+    def _parse_minute_result(result: Any) -> list[dict[str, Any]]:
+        """당일 분봉 응답을 최신순 1분봉 목록으로 변환 (date는 YYYYMMDDHHMM)"""
+        records = (result.get("output2") or []) if isinstance(result, dict) else []
+        return [
+            {
+                "date": f"{r['stck_bsop_date']}{str(r['stck_cntg_hour'])[:4]}",
+                "open": float(r.get("stck_oprc", 0)),
+                "high": float(r.get("stck_hgpr", 0)),
+                "low": float(r.get("stck_lwpr", 0)),
+                "close": float(r.get("stck_prpr", 0)),
+                "volume": int(r.get("cntg_vol", 0)),
+            }
+            for r in records
+            if r.get("stck_bsop_date") and r.get("stck_cntg_hour")
+        ]
+
+    @staticmethod
+    def _parse_ohlcv_result(result: Any) -> list[dict[str, Any]]:
+        """fetch_ohlcv 결과(DataFrame 또는 응답 dict)를 최신순 봉 목록으로 변환"""
+        if hasattr(result, "to_dict"):
+            records = result.to_dict(orient="records")
+        elif isinstance(result, dict):
+            records = result.get("output2") or []
+        else:
+            return []
+        return [
+            {
+                "date": str(r.get("stck_bsop_date", "")),
+                "open": float(r.get("stck_oprc", 0)),
+                "high": float(r.get("stck_hgpr", 0)),
+                "low": float(r.get("stck_lwpr", 0)),
+                "close": float(r.get("stck_clpr", 0)),
+                "volume": int(r.get("acml_vol", 0)),
+            }
+            for r in records
+            if r.get("stck_bsop_date")
+        ]
+
     async def buy_market(self, stock_code: str, quantity: int) -> dict[str, Any]:
         try:
             await self._rate_limiter.acquire()
@@ -1,6 +1,7 @@
 from pydantic_settings import BaseSettings
 from pydantic import Field
 from typing import List
+from datetime import date
 import json
 
 
@@ -13,6 +14,32 @@ class Settings(BaseSettings):
 
     DATABASE_URL: str = "sqlite+aiosqlite:///./richer.db"
 
+    # SQLite 운영 설정 (WAL 모드에서 사용)
+    SQLITE_SYNCHRONOUS: str = "NORMAL"  # WAL 에서는 NORMAL 로도 파일이 깨지지 않음
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000  # 쓰기 잠금을 기다리는 최대 시간
+    SQLITE_CACHE_SIZE_KB: int = 65536  # 연결당 페이지 캐시
+    SQLITE_MMAP_SIZE_MB: int = 256
+
+    # PostgreSQL (postgresql+asyncpg://...) 연결 풀 설정
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_STATEMENT_CACHE_SIZE: int = 500  # 연결당 준비된 문장 캐시 (pgbouncer 사용 시 0)
+
+    # 시세 이력 등 로컬 데이터 저장 경로
+    DATA_DIR: str = "data"
+    TICK_RECORDING: bool = True  # 엔진이 받은 시세/봉을 DATA_DIR/ticks 에 기록
+
+    # 일별 손익 집계에 쓰는 예상 비용 (체결 금액 대비)
+    TRADE_FEE_RATE: float = 0.00015  # 증권사 수수료 (매수/매도 모두)
+    SELL_TAX_RATE: float = 0.002  # 매도 시 거래세
+
+    # 계좌 원장을 KIS 잔고와 대조하는 주기 (분, 장중)
+    LEDGER_RECONCILE_MINUTES: int = 5
+
+    # 내장 KRX 휴장일 표에 없는 임시 휴장일 (쉼표 구분 YYYYMMDD)
+    MARKET_HOLIDAYS: str = ""
+
     # 공개 시장 데이터 조회용 기본 KIS API 설정 (선택적)
     KIS_APP_KEY: str = ""
     KIS_APP_SECRET: str = ""
@@ -22,12 +49,18 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = "HS256"
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
     JWT_REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    AUTH_CACHE_SECONDS: float = 30  # 토큰 사용자 존재 확인 결과를 재사용하는 시간 (0이면 끔)
+    DASHBOARD_CACHE_SECONDS: float = 3  # 대시보드 요약을 사용자별로 재사용하는 시간 (0이면 끔)
 
     CORS_ORIGINS: str = '["http://localhost:5173","http://localhost:3000"]'
 
     LOG_LEVEL: str = "DEBUG"
     LOG_DIR: str = "logs"
 
+    # trade_logs 보관: 최근 N일만 DB 에 두고 이전 날짜는 DATA_DIR/log_archive 로 압축 이동
+    LOG_HOT_DAYS: int = 14
+    LOG_ARCHIVE_RETENTION_DAYS: int = 365  # 이보다 오래된 압축 파일은 삭제 (0이면 보관)
+
     @property
     def cors_origins_list(self) -> List[str]:
         if not self.CORS_ORIGINS or self.CORS_ORIGINS.strip() == "":
@@ -38,6 +71,11 @@ class Settings(BaseSettings):
             # 단일 URL이 들어온 경우 처리
             return [self.CORS_ORIGINS.strip()]
 
+    @property
+    def market_holidays_list(self) -> List[date]:
+        days = [d.strip() for d in self.MARKET_HOLIDAYS.split(",") if d.strip()]
+        return [date(int(d[:4]), int(d[4:6]), int(d[6:8])) for d in days]
+
     model_config = {"env_file": ".env", "env_file_encoding": "utf-8"}
 
 
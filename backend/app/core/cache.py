@@ -0,0 +1,45 @@
+import time
+from typing import Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+# 캐시가 무한히 커지지 않도록 하는 상한 (넘으면 오래된 항목부터 버림)
+DEFAULT_MAX_SIZE = 10_000
+
+
+class TTLCache(Generic[K, V]):
+    """In-process map whose entries expire ``ttl`` seconds after they are stored.
+
+    Meant for small, per-user answers that are cheap to recompute but asked
+    for on almost every request. A ``ttl`` of 0 or less disables caching.
+    """
+
+    def __init__(self, ttl: float, max_size: int = DEFAULT_MAX_SIZE):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: dict[K, tuple[float, V]] = {}
+
+    def get(self, key: K) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        return value
+
+    def put(self, key: K, value: V) -> None:
+        if self.ttl <= 0:
+            return
+        self._entries.pop(key, None)
+        while len(self._entries) >= self.max_size:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def invalidate(self, key: K) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
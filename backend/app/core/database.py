@@ -1,15 +1,78 @@
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import JSON, event
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
 from app.config import settings
 
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=settings.SQL_ECHO,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {},
-)
+IS_SQLITE = settings.DATABASE_URL.startswith("sqlite")
+
+# SQLite 에서는 JSON 텍스트, PostgreSQL 에서는 GIN 인덱스를 걸 수 있는 JSONB
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
+
+def configure_sqlite(engine: AsyncEngine) -> None:
+    """Apply the production pragmas to every new connection of a SQLite engine.
+
+    WAL lets readers run while one writer commits, ``busy_timeout`` makes a
+    second writer wait instead of failing with ``database is locked``, and
+    ``synchronous=NORMAL`` is durable enough under WAL (a power loss can
+    only drop the last commits, never corrupt the file).
+    """
+    in_memory = engine.url.database in (None, "", ":memory:")
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        if not in_memory:
+            cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+        cursor.execute(f"PRAGMA busy_timeout={settings.SQLITE_BUSY_TIMEOUT_MS}")
+        # 음수는 KiB 단위
+        cursor.execute(f"PRAGMA cache_size=-{settings.SQLITE_CACHE_SIZE_KB}")
+        cursor.execute(f"PRAGMA mmap_size={settings.SQLITE_MMAP_SIZE_MB * 1024 * 1024}")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+
+def engine_options(url: str) -> dict:
+    """Dialect-specific ``create_async_engine`` arguments for ``url``."""
+    if url.startswith("sqlite"):
+        return {"connect_args": {"check_same_thread": False}}
+    options = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": True,
+    }
+    if "+asyncpg" in url:
+        # 자주 쓰는 쿼리는 연결마다 준비된 문장으로 재사용 (pgbouncer 트랜잭션 모드면 0)
+        options["connect_args"] = {
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "server_settings": {"application_name": settings.APP_NAME},
+        }
+    return options
+
+
+def _create_engine(**kwargs) -> AsyncEngine:
+    engine = create_async_engine(
+        settings.DATABASE_URL,
+        echo=settings.SQL_ECHO,
+        **{**engine_options(settings.DATABASE_URL), **kwargs},
+    )
+    if IS_SQLITE:
+        configure_sqlite(engine)
+    return engine
+
+
+engine = _create_engine()
+
+# SQLite 는 쓰기 트랜잭션이 한 번에 하나뿐이므로, 백그라운드 기록기(체결, 로그)는
+# 연결 하나짜리 엔진으로 모아 서로 잠금을 다투지 않게 함. 읽기는 engine 의 풀을 사용.
+write_engine = _create_engine(pool_size=1, max_overflow=0) if IS_SQLITE else engine
 
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+write_session = async_sessionmaker(write_engine, class_=AsyncSession, expire_on_commit=False)
 
 
 class Base(DeclarativeBase):
@@ -29,3 +92,9 @@ async def get_db():
 async def init_db():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+
+
+async def close_db():
+    await engine.dispose()
+    if write_engine is not engine:
+        await write_engine.dispose()
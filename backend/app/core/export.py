@@ -0,0 +1,63 @@
+import csv
+import io
+import json
+import zlib
+from datetime import datetime
+from typing import Any, AsyncIterator, Iterable, Literal
+
+ExportFormat = Literal["csv", "ndjson"]
+
+MEDIA_TYPES: dict[str, str] = {"csv": "text/csv; charset=utf-8", "ndjson": "application/x-ndjson"}
+
+
+def _cell(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+def _csv_chunk(rows: Iterable[dict[str, Any]], header: list[str] | None = None) -> str:
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    if header is not None:
+        writer.writerow(header)
+    writer.writerows([_cell(value) for value in row.values()] for row in rows)
+    return buf.getvalue()
+
+
+def _ndjson_chunk(rows: Iterable[dict[str, Any]]) -> str:
+    return "".join(
+        json.dumps(
+            {name: v.isoformat() if isinstance(v, datetime) else v for name, v in row.items()},
+            ensure_ascii=False,
+        )
+        + "\n"
+        for row in rows
+    )
+
+
+async def encode_rows(
+    batches: AsyncIterator[list[dict[str, Any]]], fmt: ExportFormat, columns: list[str]
+) -> AsyncIterator[bytes]:
+    """Encode row batches as CSV (with a header line) or NDJSON, one chunk per batch.
+
+    Every row must have exactly ``columns`` as keys, in that order.
+    """
+    if fmt == "csv":
+        # 엑셀에서 한글이 깨지지 않도록 BOM 을 붙임
+        yield ("\ufeff" + _csv_chunk([], columns)).encode()
+    async for rows in batches:
+        if rows:
+            chunk = _csv_chunk(rows) if fmt == "csv" else _ndjson_chunk(rows)
+            yield chunk.encode()
+
+
+async def gzip_chunks(chunks: AsyncIterator[bytes], level: int = 6) -> AsyncIterator[bytes]:
+    """Compress a byte stream into a single gzip member as it is produced."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    async for chunk in chunks:
+        if out := compressor.compress(chunk):
+            yield out
+    yield compressor.flush()
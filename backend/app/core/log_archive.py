@@ -0,0 +1,364 @@
+import json
+import os
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterator
+
+import numpy as np
+
+from app.config import settings
+
+_EPOCH = datetime(1970, 1, 1)
+_NO_SESSION = -1
+_MICROSECOND = timedelta(microseconds=1)
+MANIFEST_NAME = "manifest.json"
+
+
+@dataclass(frozen=True, slots=True)
+class ArchivedLog:
+    """A trade log row read back from an archive file (same fields as ``TradeLog``)."""
+
+    id: int
+    session_id: int | None
+    level: str
+    category: str
+    message: str
+    metadata_json: dict[str, Any] | None
+    created_at: datetime
+
+
+def _to_micros(value: datetime) -> int:
+    # 저장된 시각은 UTC (시간대 없는 값도 UTC 로 봄)
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _from_micros(micros: int) -> datetime:
+    return _EPOCH + int(micros) * _MICROSECOND
+
+
+def _pack_strings(values: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    """UTF-8 bytes of all values back to back, plus the end offset of each."""
+    encoded = [v.encode() for v in values]
+    offsets = np.cumsum([len(b) for b in encoded], dtype=np.int64)
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+def _unpack_string(data: np.ndarray, offsets: np.ndarray, i: int) -> str:
+    start = offsets[i - 1] if i else 0
+    return data[start : offsets[i]].tobytes().decode()
+
+
+def _dictionary(values: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    """Dictionary-encode a low-cardinality column (level, category)."""
+    labels, codes = np.unique(np.array(values, dtype=str), return_inverse=True)
+    return labels, codes.astype(np.uint16)
+
+
+@lru_cache(maxsize=8)
+def _load(path: str, mtime_ns: int, size: int) -> dict[str, np.ndarray]:
+    with np.load(path, allow_pickle=False) as archive:
+        return {name: archive[name] for name in archive.files}
+
+
+def _day_summary(rows: list[dict[str, Any]]) -> dict[str, dict]:
+    """Per-user row counts of one partition, also split by category and level."""
+    users: dict[str, dict] = {}
+    for row in rows:
+        entry = users.setdefault(str(row["user_id"]), {"count": 0, "categories": {}, "levels": {}})
+        entry["count"] += 1
+        for key, value in (("categories", row["category"]), ("levels", row["level"])):
+            entry[key][value] = entry[key].get(value, 0) + 1
+    return users
+
+
+def _expected_matches(
+    summary: dict[str, dict], user_id: int, category: str | None, level: str | None
+) -> int | None:
+    """Matching rows of a partition from its summary; None when only the file can tell."""
+    entry = summary.get(str(user_id))
+    if entry is None:
+        return 0
+    counts = [entry["count"]]
+    if category:
+        counts.append(entry["categories"].get(category, 0))
+    if level:
+        counts.append(entry["levels"].get(level, 0))
+    if min(counts) == 0:
+        return 0
+    # 분류와 레벨을 함께 거르면 파일을 읽어야 정확한 수를 앎
+    return None if category and level else counts[-1]
+
+
+class LogArchive:
+    """Day partitions of ``trade_logs`` moved out of the database.
+
+    Each UTC day is one compressed ``.npz`` file of column arrays sorted
+    newest first: ids, user/session ids and timestamps as integer columns,
+    level and category dictionary-encoded, and messages and metadata as one
+    UTF-8 buffer with offsets. Queries filter on the integer columns and
+    only decode the text of the rows they return.
+
+    A small JSON manifest keeps per-user row counts of every partition, so
+    queries skip the days without matching rows, and the days a page offset
+    jumps over, without opening their files.
+    """
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+        self._manifest_cache: tuple[tuple[int, int], dict[date, dict]] | None = None
+
+    def path(self, day: date) -> Path:
+        return self.root / f"{day:%Y}" / f"trade_logs-{day:%Y%m%d}.npz"
+
+    def days(self) -> list[date]:
+        """Archived days, newest first."""
+        return sorted(self._manifest(), reverse=True)
+
+    # -- manifest --------------------------------------------------------
+
+    def _manifest(self) -> dict[date, dict]:
+        path = self.root / MANIFEST_NAME
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            if not any(self.root.glob("*/trade_logs-*.npz")):
+                return {}
+            # 매니페스트가 없던 때 만든 보관 파일
+            self.rebuild_manifest()
+            stat = path.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+        if self._manifest_cache is None or self._manifest_cache[0] != key:
+            raw = json.loads(path.read_text())
+            manifest = {date.fromisoformat(day): users for day, users in raw.items()}
+            self._manifest_cache = (key, manifest)
+        return self._manifest_cache[1]
+
+    def _save_manifest(self, manifest: dict[date, dict]) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self.root / MANIFEST_NAME
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps({day.isoformat(): users for day, users in sorted(manifest.items())}))
+        os.replace(tmp, path)
+
+    def rebuild_manifest(self) -> None:
+        """Recompute the manifest from the partition files."""
+        manifest = {}
+        for p in self.root.glob("*/trade_logs-*.npz"):
+            day = datetime.strptime(p.stem.rsplit("-", 1)[1], "%Y%m%d").date()
+            manifest[day] = _day_summary(self._rows(day))
+        self._save_manifest(manifest)
+
+    # -- writing ---------------------------------------------------------
+
+    def write_day(self, day: date, rows: list[dict[str, Any]]) -> int:
+        """Store ``rows`` (``trade_logs`` columns) as the partition of ``day``.
+
+        Rows already in an existing partition of that day are kept, so an
+        interrupted archive run can simply be repeated.
+        """
+        merged = {row["id"]: row for row in self._rows(day)}
+        merged.update({row["id"]: row for row in rows})
+        ordered = sorted(
+            merged.values(), key=lambda r: (_to_micros(r["created_at"]), r["id"]), reverse=True
+        )
+        if not ordered:
+            return 0
+        path = self.path(day)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            self._save(f, ordered)
+        os.replace(tmp, path)
+        manifest = dict(self._manifest())
+        manifest[day] = _day_summary(ordered)
+        self._save_manifest(manifest)
+        return len(ordered)
+
+    @staticmethod
+    def _save(f, ordered: list[dict[str, Any]]) -> None:
+        levels, level_codes = _dictionary([r["level"] for r in ordered])
+        categories, category_codes = _dictionary([r["category"] for r in ordered])
+        messages, message_offsets = _pack_strings([r["message"] for r in ordered])
+        metadata, metadata_offsets = _pack_strings(
+            [json.dumps(r["metadata"], ensure_ascii=False) if r["metadata"] else "" for r in ordered]
+        )
+        np.savez_compressed(
+            f,
+            id=np.array([r["id"] for r in ordered], dtype=np.int64),
+            user_id=np.array([r["user_id"] for r in ordered], dtype=np.int64),
+            session_id=np.array(
+                [_NO_SESSION if r["session_id"] is None else r["session_id"] for r in ordered],
+                dtype=np.int64,
+            ),
+            created_at=np.array([_to_micros(r["created_at"]) for r in ordered], dtype=np.int64),
+            levels=levels,
+            level_codes=level_codes,
+            categories=categories,
+            category_codes=category_codes,
+            messages=messages,
+            message_offsets=message_offsets,
+            metadata=metadata,
+            metadata_offsets=metadata_offsets,
+        )
+
+    def prune(self, before: date) -> list[date]:
+        """Delete partitions older than ``before``; return the days removed."""
+        manifest = dict(self._manifest())
+        removed = [day for day in sorted(manifest) if day < before]
+        if not removed:
+            return []
+        for day in removed:
+            del manifest[day]
+        # 매니페스트에서 먼저 빼야 읽는 쪽이 지워진 파일을 찾지 않음
+        self._save_manifest(manifest)
+        for day in removed:
+            self.path(day).unlink(missing_ok=True)
+        return removed
+
+    # -- reading ---------------------------------------------------------
+
+    def _columns(self, day: date) -> dict[str, np.ndarray] | None:
+        path = self.path(day)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        # 다시 쓰인 파일은 수정 시각/크기가 달라 캐시를 새로 읽음
+        return _load(str(path), stat.st_mtime_ns, stat.st_size)
+
+    def _rows(self, day: date) -> list[dict[str, Any]]:
+        cols = self._columns(day)
+        if cols is None:
+            return []
+        rows = []
+        for i in range(len(cols["id"])):
+            log = self._decode(cols, i)
+            rows.append(
+                {
+                    "id": log.id,
+                    "session_id": log.session_id,
+                    "user_id": int(cols["user_id"][i]),
+                    "level": log.level,
+                    "category": log.category,
+                    "message": log.message,
+                    "metadata": log.metadata_json,
+                    "created_at": log.created_at,
+                }
+            )
+        return rows
+
+    @staticmethod
+    def _decode(cols: dict[str, np.ndarray], i: int) -> ArchivedLog:
+        session_id = int(cols["session_id"][i])
+        metadata = _unpack_string(cols["metadata"], cols["metadata_offsets"], i)
+        return ArchivedLog(
+            id=int(cols["id"][i]),
+            session_id=None if session_id == _NO_SESSION else session_id,
+            level=str(cols["levels"][cols["level_codes"][i]]),
+            category=str(cols["categories"][cols["category_codes"][i]]),
+            message=_unpack_string(cols["messages"], cols["message_offsets"], i),
+            metadata_json=json.loads(metadata) if metadata else None,
+            created_at=_from_micros(cols["created_at"][i]),
+        )
+
+    @staticmethod
+    def _matches(
+        cols: dict[str, np.ndarray],
+        user_id: int,
+        category: str | None,
+        level: str | None,
+        before: tuple[datetime, int] | None,
+    ) -> np.ndarray:
+        mask = cols["user_id"] == user_id
+        for value, labels, codes in (
+            (category, cols["categories"], cols["category_codes"]),
+            (level, cols["levels"], cols["level_codes"]),
+        ):
+            if value:
+                hit = np.flatnonzero(labels == value)
+                mask &= np.isin(codes, hit)
+        if before is not None:
+            at, row_id = _to_micros(before[0]), before[1]
+            created = cols["created_at"]
+            mask &= (created < at) | ((created == at) & (cols["id"] < row_id))
+        return np.flatnonzero(mask)
+
+    def _candidates(
+        self,
+        user_id: int,
+        category: str | None,
+        level: str | None,
+        before: tuple[datetime, int] | None,
+    ) -> Iterator[tuple[date, int | None]]:
+        """Days (newest first) that may hold matches, with the match count if known.
+
+        The count is only given for days entirely before the cursor.
+        """
+        last_day = _from_micros(_to_micros(before[0])).date() if before is not None else None
+        manifest = self._manifest()
+        for day in sorted(manifest, reverse=True):
+            if last_day is not None and day > last_day:
+                continue
+            expected = _expected_matches(manifest[day], user_id, category, level)
+            if expected == 0:
+                continue
+            yield day, None if day == last_day else expected
+
+    def _hits(
+        self,
+        day: date,
+        user_id: int,
+        category: str | None,
+        level: str | None,
+        before: tuple[datetime, int] | None,
+    ) -> tuple[dict[str, np.ndarray] | None, np.ndarray]:
+        cols = self._columns(day)
+        if cols is None:
+            return None, np.empty(0, dtype=np.int64)
+        return cols, self._matches(cols, user_id, category, level, before)
+
+    def iter_logs(
+        self,
+        user_id: int,
+        category: str | None = None,
+        level: str | None = None,
+        before: tuple[datetime, int] | None = None,
+    ) -> Iterator[ArchivedLog]:
+        """A user's archived logs newest first, starting after ``before`` (created_at, id)."""
+        for day, _ in self._candidates(user_id, category, level, before):
+            cols, hits = self._hits(day, user_id, category, level, before)
+            for i in hits:
+                yield self._decode(cols, i)
+
+    def query(
+        self,
+        user_id: int,
+        category: str | None = None,
+        level: str | None = None,
+        before: tuple[datetime, int] | None = None,
+        limit: int = 50,
+        skip: int = 0,
+    ) -> list[ArchivedLog]:
+        logs: list[ArchivedLog] = []
+        for day, expected in self._candidates(user_id, category, level, before):
+            # 건너뛸 날은 파일을 열지 않음
+            if expected is not None and skip >= expected:
+                skip -= expected
+                continue
+            cols, hits = self._hits(day, user_id, category, level, before)
+            if skip >= len(hits):
+                skip -= len(hits)
+                continue
+            for i in hits[skip : skip + limit - len(logs)]:
+                logs.append(self._decode(cols, i))
+            skip = 0
+            if len(logs) >= limit:
+                break
+        return logs
+
+
+log_archive = LogArchive(Path(settings.DATA_DIR) / "log_archive")
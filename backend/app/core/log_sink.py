@@ -0,0 +1,149 @@
+import asyncio
+import threading
+from collections import deque
+from datetime import timezone
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.database import write_session
+from app.models.trade_log import TradeLog
+
+DEFAULT_MAX_QUEUE = 10_000
+DEFAULT_BATCH_SIZE = 100  # 다중 행 INSERT 한 번에 들어가는 행 수 (SQLite 변수 한도 고려)
+DEFAULT_FLUSH_INTERVAL = 1.0
+
+# 로그 행의 컬럼으로 쓰이므로 metadata 에서 빼는 extra 키
+_RESERVED_EXTRA = {"category", "session_id", "user_id"}
+
+
+class DatabaseLogSink:
+    """Loguru sink that copies session-bound records into ``trade_logs``.
+
+    Records bound with both ``session_id`` and ``user_id`` are turned into
+    rows and appended to a bounded buffer; the emitting code never touches
+    the database. A background task writes the buffer as multi-row inserts
+    whenever ``batch_size`` rows are waiting or ``flush_interval`` has
+    passed. When the buffer is full new rows are dropped and counted in
+    ``dropped`` instead of blocking the trading path.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] = write_session,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ):
+        self.session_factory = session_factory
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self.written = 0
+        self._buffer: deque[dict[str, Any]] = deque()
+        # 로그는 to_thread 작업자 스레드에서도 찍히므로 버퍼는 락으로 보호
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+        self._stopping = False
+        self._reported_drops = 0
+
+    @staticmethod
+    def accepts(record: dict) -> bool:
+        extra = record["extra"]
+        return extra.get("session_id") is not None and extra.get("user_id") is not None
+
+    @property
+    def pending(self) -> int:
+        return len(self._buffer)
+
+    def __call__(self, message) -> None:
+        record = message.record
+        extra = record["extra"]
+        metadata = {k: str(v) for k, v in extra.items() if k not in _RESERVED_EXTRA}
+        row = {
+            "session_id": int(extra["session_id"]),
+            "user_id": int(extra["user_id"]),
+            "level": record["level"].name,
+            "category": str(extra.get("category", "engine")),
+            "message": record["message"],
+            "metadata": metadata or None,
+            "created_at": record["time"].astimezone(timezone.utc),
+        }
+        with self._lock:
+            if len(self._buffer) >= self.max_queue:
+                self.dropped += 1
+                return
+            self._buffer.append(row)
+            full = len(self._buffer) >= self.batch_size
+        if full and self._loop is not None and self._wakeup is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._wakeup.set)
+            except RuntimeError:
+                pass  # 루프가 이미 닫힘
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._loop = asyncio.get_running_loop()
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run(), name="db-log-sink")
+
+    async def stop(self) -> None:
+        """Stop the flush task and write whatever is still buffered."""
+        if self._task is not None and not self._task.done():
+            self._stopping = True
+            self._wakeup.set()
+            await self._task
+        self._task = None
+        self._loop = None
+        self._stopping = False
+        await self.flush()
+
+    async def flush(self) -> None:
+        while self._buffer:
+            await self._write(self._take())
+
+    def _take(self) -> list[dict[str, Any]]:
+        with self._lock:
+            n = min(len(self._buffer), self.batch_size)
+            return [self._buffer.popleft() for _ in range(n)]
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+            self._report_drops()
+            if self._stopping:
+                return
+
+    async def _write(self, rows: list[dict[str, Any]]) -> None:
+        try:
+            async with self.session_factory() as db:
+                await db.execute(insert(TradeLog.__table__).values(rows))
+                await db.commit()
+        except Exception as e:
+            with self._lock:
+                self.dropped += len(rows)
+            # 세션 정보를 붙이지 않아 이 싱크로 되돌아오지 않음
+            logger.error(f"Failed to write {len(rows)} trade logs: {e}")
+            return
+        self.written += len(rows)
+
+    def _report_drops(self) -> None:
+        if self.dropped > self._reported_drops:
+            logger.warning(
+                f"Trade log sink dropped {self.dropped - self._reported_drops} records "
+                f"({self.dropped} total)"
+            )
+            self._reported_drops = self.dropped
+
+
+db_log_sink = DatabaseLogSink()
@@ -4,6 +4,7 @@ from pathlib import Path
 from loguru import logger
 
 from app.config import settings
+from app.core.log_sink import db_log_sink
 
 
 def setup_logging():
@@ -44,6 +45,9 @@ def setup_logging():
         filter=lambda record: record["extra"].get("category") in ("engine", "strategy", "order"),
     )
 
+    # Session logs: records bound with session_id/user_id -> trade_logs (batched)
+    logger.add(db_log_sink, level="INFO", filter=db_log_sink.accepts, format="{message}")
+
     # Error log: WARNING+, 60 days, backtrace
     logger.add(
         str(log_dir / "error_{time:YYYY-MM-DD}.log"),
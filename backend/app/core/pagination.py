@@ -0,0 +1,74 @@
+import base64
+import binascii
+from datetime import datetime
+from typing import Any, AsyncIterator
+
+from sqlalchemy import Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import InstrumentedAttribute
+
+from app.core.exceptions import AppException
+
+DEFAULT_STREAM_BATCH = 500
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """Opaque cursor pointing just past ``(created_at, id)`` in newest-first order."""
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, row_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise AppException("Invalid cursor")
+
+
+def newest_first(
+    query: Select,
+    created_at: InstrumentedAttribute,
+    row_id: InstrumentedAttribute,
+    cursor: str | None = None,
+) -> Select:
+    """Order by ``(created_at, id)`` descending and start after ``cursor``.
+
+    The seek condition is a row-value comparison, so the database walks the
+    ``(…, created_at, id)`` index from the cursor instead of skipping rows.
+    """
+    if cursor:
+        after = decode_cursor(cursor)
+        query = query.where(tuple_(created_at, row_id) < tuple_(*after))
+    return query.order_by(created_at.desc(), row_id.desc())
+
+
+def next_cursor(rows: list[Any], size: int) -> str | None:
+    """Cursor of the page after ``rows``, or None when this was the last page."""
+    if len(rows) < size or not rows:
+        return None
+    last = rows[-1]
+    return encode_cursor(last.created_at, last.id)
+
+
+async def iter_newest_first(
+    session_factory: async_sessionmaker[AsyncSession],
+    query: Select,
+    created_at: InstrumentedAttribute,
+    row_id: InstrumentedAttribute,
+    batch_size: int = DEFAULT_STREAM_BATCH,
+) -> AsyncIterator[Any]:
+    """Yield every row of ``query`` newest first, one keyset batch in memory at a time."""
+    cursor = None
+    async with session_factory() as db:
+        while True:
+            page = newest_first(query, created_at, row_id, cursor).limit(batch_size)
+            rows = list((await db.execute(page)).scalars().all())
+            for row in rows:
+                yield row
+            cursor = next_cursor(rows, batch_size)
+            if cursor is None:
+                return
+            # 이미 내보낸 행은 세션에 남기지 않음
+            db.expunge_all()
@@ -0,0 +1,127 @@
+import math
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from app.engine.signals import Signal
+from app.strategies.base import DEFAULT_HISTORY, BaseStrategy
+
+# 시그널 배열 인코딩
+BUY, HOLD, SELL = 1, 0, -1
+
+_SIGNAL_CODES = {Signal.BUY: BUY, Signal.HOLD: HOLD, Signal.SELL: SELL}
+
+# 거래일 기준 연환산 계수
+TRADING_DAYS_PER_YEAR = 252
+
+
+@dataclass
+class BacktestResult:
+    total_return: float = 0.0
+    max_drawdown: float = 0.0
+    sharpe: float = 0.0
+    win_rate: float = 0.0
+    trades: int = 0
+    equity: list[float] = field(default_factory=list, repr=False)
+
+    def metrics(self) -> dict:
+        return {
+            "total_return": self.total_return,
+            "max_drawdown": self.max_drawdown,
+            "sharpe": self.sharpe,
+            "win_rate": self.win_rate,
+            "trades": self.trades,
+        }
+
+
+def generate_signals(strategy: BaseStrategy, ohlcv_df: pd.DataFrame) -> np.ndarray:
+    """Replay the strategy bar by bar and return the signal codes.
+
+    Each bar sees the same trailing window the live executor would fetch, so
+    backtest signals match what the engine would have produced on that day.
+    Batchable strategies evaluate every full window in one ``evaluate_batch``
+    call over a zero-copy sliding window view.
+    """
+    n = len(ohlcv_df)
+    signals = np.zeros(n, dtype=np.int8)
+    if n == 0:
+        return signals
+
+    lookback = max(DEFAULT_HISTORY, strategy.required_history())
+    close = ohlcv_df["close"].to_numpy(dtype=float)
+
+    # 전체 길이 창이 확보되는 구간은 슬라이딩 윈도우 행렬로 한 번에 평가
+    batch_start = lookback - 1 if strategy.batchable and n >= lookback else n
+    for i in range(batch_start):
+        window = ohlcv_df.iloc[max(0, i + 1 - lookback) : i + 1]
+        signal = strategy.evaluate(close[i], window, None)
+        signals[i] = _SIGNAL_CODES[signal]
+
+    if batch_start < n:
+        windows = np.lib.stride_tricks.sliding_window_view(close, lookback)
+        batch_signals, _ = type(strategy).evaluate_batch(
+            windows, [strategy.parameters] * len(windows), close[batch_start:]
+        )
+        signals[batch_start:] = [_SIGNAL_CODES[s] for s in batch_signals]
+    return signals
+
+
+def simulate(
+    close: np.ndarray, signals: np.ndarray, fee_rate: float = 0.0
+) -> BacktestResult:
+    """Simulate an all-in/all-out long position driven by ``signals``.
+
+    Orders fill at the bar's close. ``fee_rate`` is charged on both entry and
+    exit. An open position is marked to market on the last bar.
+    """
+    n = len(close)
+    if n == 0:
+        return BacktestResult()
+
+    equity = np.empty(n, dtype=float)
+    cash = 1.0
+    units = 0.0
+    entry_value = 0.0
+    trades = 0
+    wins = 0
+
+    for i in range(n):
+        price = close[i]
+        if signals[i] == BUY and units == 0.0 and price > 0:
+            entry_value = cash
+            units = cash * (1 - fee_rate) / price
+            cash = 0.0
+        elif signals[i] == SELL and units > 0.0:
+            cash = units * price * (1 - fee_rate)
+            units = 0.0
+            trades += 1
+            if cash > entry_value:
+                wins += 1
+        equity[i] = cash + units * price
+
+    peak = np.maximum.accumulate(equity)
+    drawdown = (peak - equity) / peak
+    returns = np.diff(equity) / equity[:-1] if n > 1 else np.zeros(0)
+    std = returns.std() if len(returns) else 0.0
+    sharpe = (
+        returns.mean() / std * math.sqrt(TRADING_DAYS_PER_YEAR) if std > 0 else 0.0
+    )
+
+    return BacktestResult(
+        total_return=(equity[-1] - 1.0) * 100,
+        max_drawdown=float(drawdown.max()) * 100,
+        sharpe=float(sharpe),
+        win_rate=(wins / trades * 100) if trades else 0.0,
+        trades=trades,
+        equity=equity.tolist(),
+    )
+
+
+def run_backtest(
+    strategy: BaseStrategy, ohlcv_df: pd.DataFrame, fee_rate: float = 0.0
+) -> BacktestResult:
+    """Backtest a strategy over chronologically ordered daily candles."""
+    signals = generate_signals(strategy, ohlcv_df)
+    close = ohlcv_df["close"].to_numpy(dtype=float) if len(ohlcv_df) else np.zeros(0)
+    return simulate(close, signals, fee_rate)
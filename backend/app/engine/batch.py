@@ -0,0 +1,118 @@
+import asyncio
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from app.engine.signals import Signal
+from app.strategies.base import BaseStrategy
+from app.strategies.indicators import IndicatorCache, indicator_cache, use_indicator_cache
+
+# 같은 배치로 묶기 위해 평가 요청을 모으는 시간 (초)
+BATCH_WINDOW_SECONDS = 0.005
+
+
+@dataclass
+class _Request:
+    strategy: BaseStrategy
+    current_price: float
+    frame: pd.DataFrame
+    holdings: dict | None
+    future: asyncio.Future
+
+    @property
+    def closes(self) -> np.ndarray:
+        return self.frame["close"].to_numpy(dtype=float)
+
+
+class BatchEvaluator:
+    """Groups concurrent strategy evaluations so each strategy type runs once per batch.
+
+    Executors whose cycles come due together submit their evaluations here.
+    Requests are collected for ``BATCH_WINDOW_SECONDS``, grouped by strategy
+    class and history length, and handed to ``evaluate_batch`` as one matrix.
+    Lone requests and strategies without batch support go through
+    ``evaluate``, which reads indicators from ``indicators`` (the process-wide
+    cache unless another one is given).
+    """
+
+    def __init__(
+        self, window: float = BATCH_WINDOW_SECONDS, indicators: IndicatorCache | None = None
+    ):
+        self.window = window
+        self.indicators = indicators or indicator_cache
+        self._pending: list[_Request] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+    def _evaluate_single(self, request: _Request) -> None:
+        try:
+            with use_indicator_cache(self.indicators):
+                signal = request.strategy.evaluate(
+                    request.current_price, request.frame, request.holdings
+                )
+        except Exception as e:
+            request.future.set_exception(e)
+            return
+        request.future.set_result(signal)
+
+    async def evaluate(
+        self,
+        strategy: BaseStrategy,
+        current_price: float,
+        ohlcv_df: pd.DataFrame,
+        holdings: dict | None,
+    ) -> Signal:
+        if not strategy.batchable or ohlcv_df.empty:
+            with use_indicator_cache(self.indicators):
+                return strategy.evaluate(current_price, ohlcv_df, holdings)
+
+        loop = asyncio.get_running_loop()
+        request = _Request(
+            strategy=strategy,
+            current_price=current_price,
+            frame=ohlcv_df,
+            holdings=holdings,
+            future=loop.create_future(),
+        )
+        self._pending.append(request)
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window, self._flush)
+        return await request.future
+
+    def _flush(self) -> None:
+        self._flush_handle = None
+        pending, self._pending = self._pending, []
+
+        groups: dict[tuple[type, int], list[_Request]] = {}
+        for request in pending:
+            if request.future.cancelled():
+                continue
+            key = (type(request.strategy), len(request.frame))
+            groups.setdefault(key, []).append(request)
+
+        for (cls, _), requests in groups.items():
+            if len(requests) == 1:
+                # 단독 요청은 공유 지표 캐시를 쓰는 일반 evaluate 경로로 처리
+                self._evaluate_single(requests[0])
+                continue
+            try:
+                signals, reasons = cls.evaluate_batch(
+                    np.vstack([r.closes for r in requests]),
+                    [r.strategy.parameters for r in requests],
+                    np.array([r.current_price for r in requests]),
+                )
+            except Exception as e:
+                logger.bind(category="strategy").error(f"Batch evaluation failed for {cls.name}: {e}")
+                for r in requests:
+                    if not r.future.done():
+                        r.future.set_exception(e)
+                continue
+
+            for r, signal, reason in zip(requests, signals, reasons):
+                r.strategy._last_reason = reason
+                if not r.future.done():
+                    r.future.set_result(signal)
+
+
+batch_evaluator = BatchEvaluator()
@@ -0,0 +1,47 @@
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+from app.market.store import KST
+
+
+class Clock:
+    """Wall-clock time and waiting, as seen by the trading engine."""
+
+    def now(self) -> datetime:
+        return datetime.now(KST)
+
+    async def sleep(self, seconds: float) -> None:
+        await asyncio.sleep(seconds)
+
+    async def wait(self, event: asyncio.Event, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds for ``event``; return whether it was set."""
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+
+class ReplayClock(Clock):
+    """Virtual clock that starts at ``start`` and runs ``speed`` times faster than real time."""
+
+    def __init__(self, start: datetime, speed: float = 100.0):
+        if speed <= 0:
+            raise ValueError("speed must be positive")
+        self.start = start if start.tzinfo else start.replace(tzinfo=KST)
+        self.speed = speed
+        self._origin = time.monotonic()
+
+    def now(self) -> datetime:
+        elapsed = (time.monotonic() - self._origin) * self.speed
+        return self.start + timedelta(seconds=elapsed)
+
+    async def sleep(self, seconds: float) -> None:
+        await asyncio.sleep(seconds / self.speed)
+
+    async def wait(self, event: asyncio.Event, timeout: float) -> bool:
+        return await super().wait(event, timeout / self.speed)
+
+
+system_clock = Clock()
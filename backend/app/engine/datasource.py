@@ -0,0 +1,157 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from app.broker.adapter import BrokerAdapter
+from app.engine.clock import Clock
+from app.market.recorder import tick_recorder
+from app.market.store import KST, OHLCVStore, date_to_ts, ohlcv_store, to_frame
+from app.services.market_service import load_daily_history
+
+
+class MarketDataSource(ABC):
+    """Where an executor gets quotes and candle history from."""
+
+    @abstractmethod
+    async def quote(self, stock_code: str) -> dict[str, Any]:
+        """Current-price quote in the shape of ``BrokerAdapter.get_current_price``."""
+        ...
+
+    @abstractmethod
+    async def daily_history(self, stock_code: str, count: int) -> pd.DataFrame:
+        """The last ``count`` completed daily candles, oldest first."""
+        ...
+
+    async def intraday_bars(
+        self, stock_code: str, timeframe: str, count: int
+    ) -> list[dict[str, Any]]:
+        """Today's completed intraday bars, in ``BrokerAdapter.get_ohlcv`` format."""
+        return []
+
+
+class LiveDataSource(MarketDataSource):
+    """Quotes from the broker, daily candles from the local store.
+
+    Every quote and intraday candle fetched here is appended to the tick log.
+    """
+
+    def __init__(self, broker: BrokerAdapter):
+        self.broker = broker
+
+    async def _get_broker(self) -> BrokerAdapter:
+        return self.broker
+
+    async def quote(self, stock_code: str) -> dict[str, Any]:
+        quote = await self.broker.get_current_price(stock_code)
+        tick_recorder.record_quote(quote)
+        return quote
+
+    async def daily_history(self, stock_code: str, count: int) -> pd.DataFrame:
+        return await load_daily_history(stock_code, count, self._get_broker)
+
+    async def intraday_bars(
+        self, stock_code: str, timeframe: str, count: int
+    ) -> list[dict[str, Any]]:
+        candles = await self.broker.get_ohlcv(stock_code, timeframe, count)
+        tick_recorder.record_candles(stock_code, timeframe, candles)
+        return candles
+
+
+class ReplayDataSource(MarketDataSource):
+    """Serves a recorded quote stream according to a (replay) clock.
+
+    ``ticks`` maps each stock code to a frame with an epoch-second ``ts`` and
+    a ``price`` column, plus optional cumulative ``volume``. Daily history
+    only includes candles from before the replayed day, so strategies never
+    see the future.
+    """
+
+    def __init__(
+        self,
+        ticks: dict[str, pd.DataFrame],
+        clock: Clock,
+        store: OHLCVStore | None = None,
+    ):
+        self.clock = clock
+        self.store = store or ohlcv_store
+        self._ticks = {code: self._prepare(df) for code, df in ticks.items()}
+
+    @staticmethod
+    def _prepare(df: pd.DataFrame) -> dict[str, np.ndarray]:
+        df = df.sort_values("ts", kind="stable")
+        ts = df["ts"].to_numpy(dtype=np.int64)
+        price = df["price"].to_numpy(dtype=float)
+        volume = (
+            df["volume"].to_numpy(dtype=np.int64)
+            if "volume" in df
+            else np.zeros(len(df), dtype=np.int64)
+        )
+        # 시세 응답처럼 당일 시가/고가/저가를 함께 제공
+        day = (ts + 9 * 3600) // 86400
+        new_day = np.r_[True, day[1:] != day[:-1]]
+        starts = np.maximum.accumulate(np.where(new_day, np.arange(len(ts)), 0))
+        high = np.empty_like(price)
+        low = np.empty_like(price)
+        for a, b in zip(np.flatnonzero(new_day), np.r_[np.flatnonzero(new_day)[1:], len(ts)]):
+            high[a:b] = np.maximum.accumulate(price[a:b])
+            low[a:b] = np.minimum.accumulate(price[a:b])
+        return {
+            "ts": ts,
+            "price": price,
+            "volume": volume,
+            "open": price[starts],
+            "high": high,
+            "low": low,
+        }
+
+    @classmethod
+    def from_bars(
+        cls, bars: dict[str, pd.DataFrame], clock: Clock, bar_seconds: int = 60, **kwargs
+    ) -> "ReplayDataSource":
+        """Build a quote stream from recorded bars: one quote at each bar's close."""
+        ticks = {}
+        for code, df in bars.items():
+            start = np.array([date_to_ts(str(d)) for d in df["date"]], dtype=np.int64)
+            ticks[code] = pd.DataFrame(
+                {
+                    "ts": start + bar_seconds,
+                    "price": df["close"].to_numpy(dtype=float),
+                    "volume": np.cumsum(df["volume"].to_numpy(dtype=np.int64)),
+                }
+            )
+        return cls(ticks, clock, **kwargs)
+
+    def time_range(self) -> tuple[int, int] | None:
+        spans = [(t["ts"][0], t["ts"][-1]) for t in self._ticks.values() if len(t["ts"])]
+        if not spans:
+            return None
+        return int(min(a for a, _ in spans)), int(max(b for _, b in spans))
+
+    async def quote(self, stock_code: str) -> dict[str, Any]:
+        ticks = self._ticks.get(stock_code)
+        if ticks is None:
+            return {"stock_code": stock_code, "current_price": 0}
+        now = int(self.clock.now().timestamp())
+        i = int(np.searchsorted(ticks["ts"], now, side="right")) - 1
+        if i < 0:
+            return {"stock_code": stock_code, "current_price": 0}
+        return {
+            "stock_code": stock_code,
+            "stock_name": stock_code,
+            "current_price": float(ticks["price"][i]),
+            "change": 0.0,
+            "change_rate": 0.0,
+            "volume": int(ticks["volume"][i]),
+            "high": float(ticks["high"][i]),
+            "low": float(ticks["low"][i]),
+            "open_price": float(ticks["open"][i]),
+        }
+
+    async def daily_history(self, stock_code: str, count: int) -> pd.DataFrame:
+        now = self.clock.now()
+        day_start = datetime(now.year, now.month, now.day, tzinfo=KST)
+        arr = self.store.read(stock_code, "D", end=int(day_start.timestamp()) - 1)
+        return to_frame(arr[-count:] if count else arr[:0])
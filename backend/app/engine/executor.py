@@ -1,57 +1,35 @@
 import asyncio
-from datetime import datetime, timezone, timedelta
+import time
+from datetime import timedelta
+from typing import Callable
 
-import pandas as pd
 from loguru import logger
 
 from app.broker.adapter import BrokerAdapter
+from app.engine.batch import BatchEvaluator, batch_evaluator
+from app.engine.clock import Clock, system_clock
+from app.engine.datasource import LiveDataSource, MarketDataSource
+from app.engine.ledger import AccountLedger
+from app.engine.market_hours import MarketHours, market_hours
 from app.engine.signals import Signal
-from app.strategies.base import BaseStrategy
-from app.ws.manager import ws_manager
-
-
-# KST = UTC+9
-KST = timezone(timedelta(hours=9))
-MARKET_OPEN = (9, 0)
-MARKET_CLOSE = (15, 30)
-
-
-def _is_market_open() -> bool:
-    now = datetime.now(KST)
-    if now.weekday() >= 5:  # Saturday or Sunday
-        return False
-    t = (now.hour, now.minute)
-    return MARKET_OPEN <= t <= MARKET_CLOSE
-
-
-def _get_market_status() -> dict:
-    """Get current market status information."""
-    now = datetime.now(KST)
-    is_open = _is_market_open()
-
-    if now.weekday() >= 5:
-        reason = "weekend"
-        next_open = "월요일 09:00"
-    elif (now.hour, now.minute) < MARKET_OPEN:
-        reason = "before_open"
-        next_open = "오늘 09:00"
-    elif (now.hour, now.minute) > MARKET_CLOSE:
-        reason = "after_close"
-        next_open = "내일 09:00"
-    else:
-        reason = "open"
-        next_open = None
-
-    return {
-        "is_open": is_open,
-        "reason": reason,
-        "next_open": next_open,
-        "current_time": now.strftime("%H:%M:%S"),
-    }
+from app.engine.trade_writer import TradeWriter, trade_writer
+from app.engine.triggers import TriggerIndex, trigger_index
+from app.market.bars import INTRADAY_TIMEFRAMES, BarAggregator, bar_aggregator, bucket_start
+from app.market.store import date_to_ts
+from app.services.market_service import with_live_bar
+from app.strategies.base import DEFAULT_HISTORY, BaseStrategy
+from app.ws.manager import ConnectionManager, ws_manager
 
 
 class StrategyExecutor:
-    """Runs the strategy evaluation loop for a single trading session."""
+    """Runs the strategy evaluation loop for a single trading session.
+
+    Time, market data, status delivery, bar building and evaluation are
+    injectable so the same loop can be driven by a replayed market (see
+    ``app.engine.replay``). ``on_cycle`` receives the wall-clock duration of
+    every cycle, and ``persist_logs=False`` keeps session logs out of
+    ``trade_logs``.
+    """
 
     def __init__(
         self,
@@ -63,6 +41,18 @@ class StrategyExecutor:
         stock_name: str = "",
         interval_seconds: int = 60,
         order_quantity: int = 1,
+        timeframe: str = "D",
+        clock: Clock | None = None,
+        data_source: MarketDataSource | None = None,
+        notifier: ConnectionManager | None = None,
+        hours: MarketHours | None = None,
+        triggers: TriggerIndex | None = None,
+        trades: TradeWriter | None = None,
+        ledger: AccountLedger | None = None,
+        bars: BarAggregator | None = None,
+        evaluator: BatchEvaluator | None = None,
+        on_cycle: Callable[[float], None] | None = None,
+        persist_logs: bool = True,
     ):
         self.session_id = session_id
         self.user_id = user_id
@@ -72,14 +62,44 @@ class StrategyExecutor:
         self.stock_name = stock_name
         self.interval_seconds = interval_seconds
         self.order_quantity = order_quantity
+        self.timeframe = timeframe
+        self.clock = clock or system_clock
+        self.data_source = data_source or LiveDataSource(broker)
+        self.notifier = notifier or ws_manager
+        # 장 시간 대기는 같은 시계를 쓰는 실행기끼리 공유
+        if hours is None and clock is not None:
+            hours = MarketHours(clock=self.clock, notifier=self.notifier)
+        self.hours = hours or market_hours
+        self.triggers = triggers or trigger_index
+        self.trades = trades or trade_writer
+        # 계좌 원장이 있으면 보유 수량은 원장에서 읽음 (없으면 매 사이클 잔고 조회)
+        self.ledger = ledger
+        self.bars = bars or bar_aggregator
+        self.evaluator = evaluator or batch_evaluator
+        self.on_cycle = on_cycle
+        self.persist_logs = persist_logs
+
+        # 분봉 모드: 시세 폴링으로 봉을 만들고, 봉이 마감될 때만 전략을 평가
+        self._bar_minutes = INTRADAY_TIMEFRAMES.get(timeframe)
+        self._bars_seeded = False
+        self._last_bar_ts: int | None = None
+        if self._bar_minutes:
+            self.bars.track(stock_code, timeframe)
+            # 봉 하나에 최소 한 번은 시세를 받아야 마감을 감지할 수 있음
+            self.interval_seconds = min(interval_seconds, self._bar_minutes * 60)
+
+        # 트리거 모드: HOLD 신호가 바뀌지 않는 가격 구간과 그 구간이 유효한 날짜
+        self._band: tuple[float, float] | None = None
+        self._band_day: str | None = None
 
         self._running = asyncio.Event()
         self._stopped = asyncio.Event()
         self._paused = asyncio.Event()
+        self._wake = asyncio.Event()
         self._running.set()
 
     async def run(self) -> None:
-        log = logger.bind(category="engine")
+        log = self._logger("engine")
         log.info(f"[Session {self.session_id}] Executor started for {self.stock_code}")
 
         try:
@@ -89,78 +109,107 @@ class StrategyExecutor:
                     log.info(f"[Session {self.session_id}] Paused, waiting for resume")
                     await self._send_status_update("paused", "일시정지 중")
                     while self._paused.is_set() and not self._stopped.is_set():
-                        await asyncio.sleep(1)
+                        await self.clock.sleep(1)
                     if self._stopped.is_set():
                         break
                     log.info(f"[Session {self.session_id}] Resumed")
                     await self._send_status_update("running", "재개됨")
 
                 # Check market hours
-                market_status = _get_market_status()
-                if not market_status["is_open"]:
-                    log.debug(f"[Session {self.session_id}] Market closed, waiting")
+                if not self.hours.is_open():
+                    market_status = self.hours.status()
+                    log.debug(
+                        f"[Session {self.session_id}] Market closed, "
+                        f"sleeping until {market_status['next_open_at']}"
+                    )
                     await self._send_status_update(
                         "waiting_market",
                         "장 시간 대기 중",
                         market_status=market_status,
                     )
-                    await asyncio.sleep(30)
+                    if not await self.hours.wait_until_open(self._stopped):
+                        break
                     continue
 
+                started = time.perf_counter()
                 try:
                     await self._execute_cycle()
                 except Exception as e:
                     log.error(f"[Session {self.session_id}] Cycle error: {e}")
                     await self._send_status_update("error", f"오류: {str(e)[:50]}")
+                if self.on_cycle is not None:
+                    self.on_cycle(time.perf_counter() - started)
 
                 # Wait for next cycle
-                next_check = datetime.now(KST) + timedelta(seconds=self.interval_seconds)
+                next_check = self.clock.now() + timedelta(seconds=self.interval_seconds)
                 await self._send_status_update(
                     "running",
                     f"다음 체크: {next_check.strftime('%H:%M:%S')}",
                     next_check_at=next_check.isoformat(),
                 )
 
-                try:
-                    await asyncio.wait_for(
-                        self._stopped.wait(), timeout=self.interval_seconds
-                    )
-                    break  # stopped was set
-                except asyncio.TimeoutError:
-                    pass  # normal timeout, continue loop
+                # 다음 주기 전이라도 시세가 신호 구간을 벗어나면 깨어남
+                await self.clock.wait(self._wake, self.interval_seconds)
+                self._wake.clear()
+                if self._stopped.is_set():
+                    break
         finally:
+            self.triggers.remove(self)
             log.info(f"[Session {self.session_id}] Executor stopped")
             await self._send_status_update("stopped", "중지됨")
 
     async def _execute_cycle(self) -> None:
-        log = logger.bind(category="strategy")
+        log = self._logger("strategy")
 
         await self._send_status_update("checking", "시세 조회 중...")
 
         # Fetch data
-        price_data = await self.broker.get_current_price(self.stock_code)
+        price_data = await self.data_source.quote(self.stock_code)
         current_price = price_data.get("current_price", 0)
         if current_price <= 0:
             log.warning(f"[Session {self.session_id}] Invalid price: {current_price}")
             await self._send_status_update("error", "시세 조회 실패")
             return
 
-        ohlcv_data = await self.broker.get_ohlcv(self.stock_code, "D", 60)
-        ohlcv_df = pd.DataFrame(ohlcv_data) if ohlcv_data else pd.DataFrame()
+        if self._skip_inside_band(current_price):
+            low, high = self._band
+            reason = f"Price {current_price:,.0f} inside hold band {low:,.0f} ~ {high:,.0f}"
+            await self._send_status_update(
+                "evaluated",
+                reason,
+                current_price=current_price,
+                signal=Signal.HOLD.value,
+                signal_reason=reason,
+                last_checked_at=self.clock.now().isoformat(),
+            )
+            return
 
-        holdings_list = await self.broker.get_holdings()
-        holdings = None
-        for h in holdings_list:
-            code = h.get("pdno", h.get("stock_code", ""))
-            if code == self.stock_code:
-                holdings = h
-                break
+        history = max(DEFAULT_HISTORY, self.strategy.required_history())
+        if self._bar_minutes:
+            ohlcv_df = await self._closed_bars(price_data, history)
+            if ohlcv_df is None:
+                await self._send_status_update(
+                    "waiting_bar",
+                    "봉 마감 대기 중",
+                    current_price=current_price,
+                )
+                return
+        else:
+            daily = await self.data_source.daily_history(self.stock_code, history - 1)
+            ohlcv_df = with_live_bar(daily, price_data, now=self.clock.now())
+        # 같은 종목·봉을 보는 세션끼리 지표 계산 결과를 공유하기 위한 태그
+        ohlcv_df.attrs.update(stock_code=self.stock_code, timeframe=self.timeframe)
+
+        holdings = await self._holdings(current_price)
 
         await self._send_status_update("evaluating", "전략 평가 중...")
 
         # Evaluate strategy
-        signal = self.strategy.evaluate(current_price, ohlcv_df, holdings)
+        signal = await self.evaluator.evaluate(
+            self.strategy, current_price, ohlcv_df, holdings
+        )
         reason = self.strategy.get_signal_reason()
+        self._publish_band(signal, current_price, ohlcv_df)
         log.info(
             f"[Session {self.session_id}] {self.stock_code} "
             f"price={current_price:,.0f} signal={signal.value} reason={reason}"
@@ -173,7 +222,7 @@ class StrategyExecutor:
             current_price=current_price,
             signal=signal.value,
             signal_reason=reason,
-            last_checked_at=datetime.now(KST).isoformat(),
+            last_checked_at=self.clock.now().isoformat(),
         )
 
         # Execute order if needed
@@ -184,27 +233,115 @@ class StrategyExecutor:
             await self._send_status_update("ordering", "매도 주문 중...")
             await self._execute_sell(current_price, reason)
 
-    async def _execute_buy(self, price: float, reason: str) -> None:
-        log = logger.bind(category="order")
-        try:
-            result = await self.broker.buy_market(self.stock_code, self.order_quantity)
-            log.info(
-                f"[Session {self.session_id}] BUY {self.stock_code} "
-                f"x{self.order_quantity} @ ~{price:,.0f} | {reason} | order={result}"
+    async def _holdings(self, current_price: float) -> dict | None:
+        if self.ledger is not None:
+            self.ledger.mark(self.stock_code, current_price)
+            return self.ledger.holding(self.stock_code)
+        for h in await self.broker.get_holdings():
+            code = h.get("pdno", h.get("stock_code", ""))
+            if code == self.stock_code:
+                return h
+        return None
+
+    def _skip_inside_band(self, price: float) -> bool:
+        """Feed the quote to the trigger index; True if the last HOLD still provably holds."""
+        band = self._band if self._band_day == self.clock.now().strftime("%Y%m%d") else None
+        # 자기 구간은 빼고 알려서 같은 종목의 다른 세션만 깨움
+        self.triggers.remove(self)
+        self.triggers.on_tick(self.stock_code, price)
+        if band is None or not band[0] <= price <= band[1]:
+            self._band = None
+            return False
+        self.triggers.set_band(self.stock_code, self, *band, wake=self._on_trigger)
+        return True
+
+    def _publish_band(self, signal: Signal, price: float, ohlcv_df) -> None:
+        # 분봉은 봉 마감 때만 평가하므로, 구간은 일봉 HOLD 신호에만 적용
+        band = None
+        if signal == Signal.HOLD and not self._bar_minutes:
+            band = self.strategy.signal_band(price, ohlcv_df)
+        self._band = band
+        if band is None:
+            return
+        self._band_day = self.clock.now().strftime("%Y%m%d")
+        self.triggers.set_band(self.stock_code, self, *band, wake=self._on_trigger)
+
+    def _on_trigger(self, price: float) -> None:
+        self._band = None
+        self._wake.set()
+
+    async def _closed_bars(self, price_data: dict, history: int):
+        """Fold the quote into the bar aggregator; return bars only when a new one closed."""
+        now = int(self.clock.now().timestamp())
+        self.bars.on_tick(
+            self.stock_code,
+            float(price_data["current_price"]),
+            int(price_data.get("volume", 0)),
+            ts=now,
+        )
+        if not self._bars_seeded:
+            # 첫 사이클에만 당일 분봉 이력을 받아 링 버퍼를 채움 (형성 중인 봉 제외)
+            forming = bucket_start(now, self._bar_minutes)
+            records = await self.data_source.intraday_bars(
+                self.stock_code, self.timeframe, history
             )
-        except Exception as e:
-            log.error(f"[Session {self.session_id}] BUY failed: {e}")
+            self.bars.seed(
+                self.stock_code,
+                self.timeframe,
+                [r for r in records if date_to_ts(r["date"]) < forming],
+            )
+            self._bars_seeded = True
+
+        closed_ts = self.bars.last_closed_ts(self.stock_code, self.timeframe)
+        if closed_ts is None or closed_ts == self._last_bar_ts:
+            return None
+        self._last_bar_ts = closed_ts
+        return self.bars.frame(self.stock_code, self.timeframe, history)
+
+    async def _execute_buy(self, price: float, reason: str) -> None:
+        await self._place_order("BUY", self.broker.buy_market, price, reason)
 
     async def _execute_sell(self, price: float, reason: str) -> None:
-        log = logger.bind(category="order")
+        await self._place_order("SELL", self.broker.sell_market, price, reason)
+
+    async def _place_order(self, side: str, submit, price: float, reason: str) -> None:
+        log = self._logger("order")
+        result = None
         try:
-            result = await self.broker.sell_market(self.stock_code, self.order_quantity)
+            result = await submit(self.stock_code, self.order_quantity)
             log.info(
-                f"[Session {self.session_id}] SELL {self.stock_code} "
+                f"[Session {self.session_id}] {side} {self.stock_code} "
                 f"x{self.order_quantity} @ ~{price:,.0f} | {reason} | order={result}"
             )
         except Exception as e:
-            log.error(f"[Session {self.session_id}] SELL failed: {e}")
+            log.error(f"[Session {self.session_id}] {side} failed: {e}")
+        if result is not None and self.ledger is not None:
+            await self.ledger.apply_fill(
+                self.stock_code,
+                side,
+                result.get("filled_quantity") or self.order_quantity,
+                result.get("filled_price") or price,
+                self.stock_name,
+            )
+        # DB 기록은 write-behind 큐에 넘기고 주문 경로에서는 기다리지 않음
+        self.trades.record(
+            session_id=self.session_id,
+            user_id=self.user_id,
+            stock_code=self.stock_code,
+            stock_name=self.stock_name,
+            side=side,
+            quantity=self.order_quantity,
+            price=price,
+            status="filled" if result is not None else "rejected",
+            result=result,
+            signal_reason=reason,
+        )
+
+    def _logger(self, category: str):
+        # session_id/user_id 가 붙은 기록은 trade_logs 에도 저장됨
+        if not self.persist_logs:
+            return logger.bind(category=category, session_id=self.session_id)
+        return logger.bind(category=category, session_id=self.session_id, user_id=self.user_id)
 
     def pause(self) -> None:
         self._paused.set()
@@ -216,6 +353,7 @@ class StrategyExecutor:
         self._stopped.set()
         self._running.clear()
         self._paused.clear()  # unblock if paused
+        self._wake.set()
 
     async def _send_status_update(
         self,
@@ -230,10 +368,10 @@ class StrategyExecutor:
             "stock_name": self.stock_name,
             "status": status,
             "message": message,
-            "timestamp": datetime.now(KST).isoformat(),
+            "timestamp": self.clock.now().isoformat(),
             **extra_data,
         }
-        await ws_manager.send_to_user(
+        await self.notifier.send_to_user(
             self.user_id,
             "session.status",
             "trading",
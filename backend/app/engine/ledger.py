@@ -0,0 +1,250 @@
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from loguru import logger
+
+from app.broker.adapter import BrokerAdapter
+from app.engine.clock import KST
+from app.engine.trade_writer import apply_fill
+from app.ws.manager import ConnectionManager, ws_manager
+
+# 수수료·세금 때문에 생기는 예수금 차이는 이 비율까지 허용
+CASH_DRIFT_TOLERANCE = 0.005
+# 잔고 조회 중에 체결이 들어오면 다시 조회하는 횟수
+RECONCILE_ATTEMPTS = 3
+
+
+def _number(value: Any) -> float:
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+@dataclass
+class Holding:
+    stock_code: str
+    stock_name: str
+    quantity: int
+    avg_price: float
+    current_price: float = 0.0
+
+    def as_kis(self) -> dict[str, Any]:
+        """The holding in the shape of a ``get_holdings`` record."""
+        evaluation = self.quantity * self.current_price
+        profit = 0.0
+        if self.current_price:
+            profit = (self.current_price - self.avg_price) * self.quantity
+        cost = self.avg_price * self.quantity
+        return {
+            "pdno": self.stock_code,
+            "prdt_name": self.stock_name,
+            "hldg_qty": self.quantity,
+            "pchs_avg_pric": self.avg_price,
+            "prpr": self.current_price,
+            "evlu_amt": evaluation,
+            "evlu_pfls_amt": profit,
+            "evlu_pfls_rt": profit / cost * 100 if cost else 0.0,
+        }
+
+
+class AccountLedger:
+    """Positions, average prices and cash of one account, kept in memory.
+
+    Seeded from a single balance snapshot and moved by every fill the engine
+    makes, so executors, the buyable calculation and the dashboard read it
+    instead of calling ``fetch_balance``. ``reconcile`` compares it with a
+    fresh snapshot, alerts on drift and adopts the broker's numbers.
+
+    Fills and adopting a snapshot both take ``_lock``; the broker call of a
+    reconcile does not, so fills never wait on it. A fill counter tells
+    whether the state changed while the snapshot was being fetched.
+    """
+
+    def __init__(
+        self,
+        account_id: int,
+        user_id: int,
+        broker: BrokerAdapter,
+        notifier: ConnectionManager = ws_manager,
+    ):
+        self.account_id = account_id
+        self.user_id = user_id
+        self.broker = broker
+        self.notifier = notifier
+        self.cash = 0.0
+        self.positions: dict[str, Holding] = {}
+        self.seeded_at: datetime | None = None
+        self.reconciled_at: datetime | None = None
+        self._fills = 0
+        self._lock = asyncio.Lock()
+
+    def _load(self, snapshot: dict[str, Any]) -> None:
+        self.cash = _number(snapshot.get("balance", {}).get("dnca_tot_amt"))
+        self.positions = {}
+        for record in snapshot.get("holdings", []):
+            quantity = int(_number(record.get("hldg_qty")))
+            if quantity <= 0:
+                continue
+            code = str(record.get("pdno", ""))
+            self.positions[code] = Holding(
+                stock_code=code,
+                stock_name=str(record.get("prdt_name", code)),
+                quantity=quantity,
+                avg_price=_number(record.get("pchs_avg_pric")),
+                current_price=_number(record.get("prpr")),
+            )
+
+    async def seed(self) -> None:
+        async with self._lock:
+            self._load(await self.broker.get_account_snapshot())
+            self.seeded_at = datetime.now(KST)
+
+    def holding(self, stock_code: str) -> dict[str, Any] | None:
+        position = self.positions.get(stock_code)
+        return position.as_kis() if position else None
+
+    def holdings(self) -> list[dict[str, Any]]:
+        return [p.as_kis() for p in self.positions.values()]
+
+    def mark(self, stock_code: str, price: float) -> None:
+        """Update the last price of a held stock from a quote."""
+        position = self.positions.get(stock_code)
+        if position is not None:
+            position.current_price = price
+
+    def buyable_quantity(self, price: float) -> int:
+        return int(self.cash // price) if price > 0 else 0
+
+    def summary(self) -> dict[str, float]:
+        evaluation = sum(p.quantity * p.current_price for p in self.positions.values())
+        profit = sum(
+            (p.current_price - p.avg_price) * p.quantity
+            for p in self.positions.values()
+            if p.current_price
+        )
+        return {
+            "cash": self.cash,
+            "evaluation": evaluation,
+            "total": self.cash + evaluation,
+            "profit": profit,
+        }
+
+    async def apply_fill(
+        self, stock_code: str, side: str, quantity: int, price: float, stock_name: str = ""
+    ) -> None:
+        async with self._lock:
+            self._apply_fill(stock_code, side, quantity, price, stock_name)
+            self._fills += 1
+
+    def _apply_fill(
+        self, stock_code: str, side: str, quantity: int, price: float, stock_name: str
+    ) -> None:
+        position = self.positions.get(stock_code)
+        held = (position.quantity, position.avg_price) if position else (0, 0.0)
+        (quantity_after, avg_price), _ = apply_fill(held, side, quantity, price)
+        self.cash += -quantity * price if side == "BUY" else min(quantity, held[0]) * price
+        if quantity_after <= 0:
+            self.positions.pop(stock_code, None)
+            return
+        if position is None:
+            position = self.positions[stock_code] = Holding(
+                stock_code, stock_name or stock_code, 0, 0.0, price
+            )
+        position.quantity = quantity_after
+        position.avg_price = avg_price
+        position.current_price = price
+
+    async def reconcile(self) -> list[dict[str, Any]]:
+        """Compare with a fresh snapshot, alert on drift and adopt the broker's state.
+
+        A snapshot fetched while a fill was applied may or may not include
+        that fill, so it is neither compared nor adopted; the fetch is
+        repeated instead, and the run is skipped if fills keep arriving.
+        """
+        for _ in range(RECONCILE_ATTEMPTS):
+            fills = self._fills
+            snapshot = await self.broker.get_account_snapshot()
+            async with self._lock:
+                if self._fills != fills:
+                    continue
+                expected = {code: p.quantity for code, p in self.positions.items()}
+                cash = self.cash
+                self._load(snapshot)
+                self.reconciled_at = datetime.now(KST)
+                break
+        else:
+            logger.bind(category="order").info(
+                f"Ledger reconcile of account {self.account_id} skipped: fills during every fetch"
+            )
+            return []
+
+        actual = {code: p.quantity for code, p in self.positions.items()}
+        drift = [
+            {"stock_code": code, "ledger": expected.get(code, 0), "broker": actual.get(code, 0)}
+            for code in sorted(expected.keys() | actual.keys())
+            if expected.get(code, 0) != actual.get(code, 0)
+        ]
+        if abs(self.cash - cash) > CASH_DRIFT_TOLERANCE * max(abs(self.cash), 1.0):
+            drift.append({"stock_code": None, "ledger": cash, "broker": self.cash})
+
+        if drift:
+            logger.bind(category="order").warning(
+                f"Ledger drift on account {self.account_id}: {drift}"
+            )
+            await self.notifier.send_to_user(
+                self.user_id,
+                "ledger.drift",
+                "account",
+                {"account_id": self.account_id, "drift": drift},
+            )
+        return drift
+
+
+class LedgerRegistry:
+    """One ledger per account, created and seeded on first use."""
+
+    def __init__(self):
+        self._ledgers: dict[int, AccountLedger] = {}
+        self._lock = asyncio.Lock()
+
+    def peek(self, account_id: int) -> AccountLedger | None:
+        return self._ledgers.get(account_id)
+
+    async def get(self, account_id: int, user_id: int, broker: BrokerAdapter) -> AccountLedger:
+        ledger = self._ledgers.get(account_id)
+        if ledger is not None:
+            return ledger
+        async with self._lock:
+            ledger = self._ledgers.get(account_id)
+            if ledger is None:
+                ledger = AccountLedger(account_id, user_id, broker)
+                await ledger.seed()
+                self._ledgers[account_id] = ledger
+        return ledger
+
+    def accounts(self) -> list[int]:
+        return list(self._ledgers)
+
+    def discard(self, account_id: int) -> None:
+        self._ledgers.pop(account_id, None)
+
+    async def reconcile_all(
+        self, account_ids: set[int] | None = None
+    ) -> dict[int, list[dict[str, Any]]]:
+        results = {}
+        for account_id, ledger in list(self._ledgers.items()):
+            if account_ids is not None and account_id not in account_ids:
+                continue
+            try:
+                results[account_id] = await ledger.reconcile()
+            except Exception as e:
+                logger.bind(category="order").warning(
+                    f"Ledger reconcile failed for account {account_id}: {e}"
+                )
+        return results
+
+
+ledgers = LedgerRegistry()
@@ -5,8 +5,12 @@ from loguru import logger
 
 from app.broker.adapter import BrokerAdapter
 from app.engine.executor import StrategyExecutor
+from app.engine.ledger import AccountLedger, ledgers
 from app.strategies.base import BaseStrategy
 
+# 종료 시 진행 중인 주기가 끝나기를 기다리는 최대 시간
+SHUTDOWN_TIMEOUT = 10.0
+
 
 class TradingManager:
     """Manages all active trading sessions (singleton)."""
@@ -34,6 +38,8 @@ class TradingManager:
         stock_name: str = "",
         interval_seconds: int = 60,
         order_quantity: int = 1,
+        timeframe: str = "D",
+        ledger: AccountLedger | None = None,
     ) -> StrategyExecutor:
         if session_id in self._sessions:
             raise ValueError(f"Session {session_id} already active")
@@ -47,6 +53,8 @@ class TradingManager:
             stock_name=stock_name,
             interval_seconds=interval_seconds,
             order_quantity=order_quantity,
+            timeframe=timeframe,
+            ledger=ledger,
         )
         task = asyncio.create_task(
             self._run_executor(session_id, executor),
@@ -65,8 +73,22 @@ class TradingManager:
         finally:
             self._sessions.pop(session_id, None)
             self._tasks.pop(session_id, None)
+            self._release_ledger(executor.ledger)
             logger.bind(category="engine").info(f"Session {session_id} cleaned up")
 
+    def _release_ledger(self, ledger: AccountLedger | None) -> None:
+        """Drop the account's ledger once no session trades on it any more.
+
+        The next session on the account then starts from a fresh snapshot
+        instead of positions and cash the ledger kept while nothing moved it.
+        """
+        if ledger is None:
+            return
+        if any(e.ledger is ledger for e in self._sessions.values()):
+            return
+        if ledgers.peek(ledger.account_id) is ledger:
+            ledgers.discard(ledger.account_id)
+
     def stop_session(self, session_id: int) -> None:
         executor = self._sessions.get(session_id)
         if executor:
@@ -85,6 +107,27 @@ class TradingManager:
             executor.resume()
             logger.bind(category="engine").info(f"Session {session_id} resumed")
 
+    async def stop_all(self, timeout: float = SHUTDOWN_TIMEOUT) -> None:
+        """Stop every session and wait for its task to end.
+
+        A cycle that is placing an order finishes first, so its fill is
+        recorded before the trade writer drains. Tasks still running after
+        ``timeout`` are cancelled.
+        """
+        tasks = list(self._tasks.values())
+        for executor in list(self._sessions.values()):
+            executor.stop()
+        if not tasks:
+            return
+        _, pending = await asyncio.wait(tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            logger.bind(category="engine").warning(
+                f"Cancelled {len(pending)} sessions that did not stop within {timeout}s"
+            )
+
     def get_active_session_ids(self) -> list[int]:
         return list(self._sessions.keys())
 
@@ -0,0 +1,81 @@
+import asyncio
+
+from loguru import logger
+
+from app.engine.clock import Clock, system_clock
+from app.market.calendar import TradingCalendar, krx_calendar
+from app.ws.manager import ConnectionManager, ws_manager
+
+
+class MarketHours:
+    """Whether the market is open, shared by every executor.
+
+    While the market is closed a single timer sleeps until the next session
+    open computed from the calendar, and executors park on it instead of
+    polling. Each closed period is announced once with a ``market.status``
+    broadcast when it starts and once when the market opens.
+    """
+
+    def __init__(
+        self,
+        calendar: TradingCalendar = krx_calendar,
+        clock: Clock = system_clock,
+        notifier: ConnectionManager = ws_manager,
+    ):
+        self.calendar = calendar
+        self.clock = clock
+        self.notifier = notifier
+        self._opened: asyncio.Event | None = None
+        self._timer: asyncio.Task | None = None
+
+    def is_open(self) -> bool:
+        return self.calendar.is_open(self.clock.now())
+
+    def status(self) -> dict:
+        return self.calendar.status(self.clock.now())
+
+    async def wait_until_open(self, stopped: asyncio.Event) -> bool:
+        """Block until the market opens; return False if ``stopped`` is set first."""
+        if self.is_open():
+            return True
+        opened = asyncio.ensure_future(self._closed_period().wait())
+        stopping = asyncio.ensure_future(stopped.wait())
+        try:
+            await asyncio.wait({opened, stopping}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            opened.cancel()
+            stopping.cancel()
+        return not stopped.is_set()
+
+    def close(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _closed_period(self) -> asyncio.Event:
+        # 휴장 구간마다 타이머 하나만 돌림 (이벤트 루프가 바뀌면 새로 만듦)
+        if (
+            self._timer is None
+            or self._timer.done()
+            or self._timer.get_loop() is not asyncio.get_running_loop()
+        ):
+            self._opened = asyncio.Event()
+            self._timer = asyncio.create_task(self._sleep_until_open(self._opened))
+        return self._opened
+
+    async def _sleep_until_open(self, opened: asyncio.Event) -> None:
+        status = self.status()
+        logger.bind(category="engine").info(
+            f"Market closed ({status['reason']}), next open {status['next_open_at']}"
+        )
+        await self.notifier.broadcast("market.status", "trading", status)
+        # 시계가 일찍 깨어날 수 있으므로 실제로 열렸는지 다시 확인
+        while not self.is_open():
+            now = self.clock.now()
+            remaining = (self.calendar.next_open(now) - now).total_seconds()
+            await self.clock.sleep(max(remaining, 0.001))
+        opened.set()
+        await self.notifier.broadcast("market.status", "trading", self.status())
+
+
+market_hours = MarketHours()
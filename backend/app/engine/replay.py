@@ -0,0 +1,243 @@
+import asyncio
+import statistics
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+import pandas as pd
+
+from app.broker.adapter import BrokerAdapter
+from app.engine.batch import BatchEvaluator
+from app.engine.clock import Clock, ReplayClock
+from app.engine.datasource import ReplayDataSource
+from app.engine.executor import StrategyExecutor
+from app.engine.market_hours import MarketHours
+from app.engine.trade_writer import TradeWriter
+from app.engine.triggers import TriggerIndex
+from app.market.bars import BarAggregator
+from app.market.store import KST, OHLCVStore
+from app.strategies.indicators import IndicatorCache
+from app.strategies.registry import get_strategy
+from app.ws.manager import ConnectionManager
+
+DEFAULT_SPEED = 500.0
+
+
+@dataclass
+class ReplaySession:
+    strategy_type: str
+    parameters: dict
+    stock_code: str
+    interval_seconds: int = 60
+    quantity: int = 1
+    timeframe: str = "D"
+
+
+class EventRecorder(ConnectionManager):
+    """Captures executor status messages with their replay timestamps instead of sending them."""
+
+    def __init__(self, clock: Clock):
+        super().__init__()
+        self.clock = clock
+        self.events: list[dict[str, Any]] = []
+
+    async def send_to_user(
+        self, user_id: int, message_type: str, channel: str, payload: dict
+    ):
+        self.events.append(
+            {
+                "at": self.clock.now().isoformat(),
+                "type": message_type,
+                "channel": channel,
+                "payload": payload,
+            }
+        )
+
+    async def broadcast(self, message_type: str, channel: str, payload: dict):
+        await self.send_to_user(0, message_type, channel, payload)
+
+
+class PaperBroker(BrokerAdapter):
+    """Fills market orders at the replayed quote and keeps positions in memory."""
+
+    def __init__(self, source: ReplayDataSource, clock: Clock, recorder: EventRecorder):
+        self.source = source
+        self.clock = clock
+        self.recorder = recorder
+        self.positions: dict[str, int] = {}
+        self.orders: list[dict[str, Any]] = []
+
+    async def connect(self) -> bool:
+        return True
+
+    async def get_balance(self) -> dict[str, Any]:
+        return {}
+
+    async def get_holdings(self) -> list[dict[str, Any]]:
+        return [
+            {"pdno": code, "hldg_qty": qty}
+            for code, qty in self.positions.items()
+            if qty > 0
+        ]
+
+    async def get_current_price(self, stock_code: str) -> dict[str, Any]:
+        return await self.source.quote(stock_code)
+
+    async def get_ohlcv(
+        self, stock_code: str, period: str = "D", count: int = 60
+    ) -> list[dict[str, Any]]:
+        return []
+
+    async def _fill(self, side: str, stock_code: str, quantity: int, price: float | None):
+        if price is None:
+            price = (await self.source.quote(stock_code))["current_price"]
+        held = self.positions.get(stock_code, 0)
+        self.positions[stock_code] = held + quantity if side == "BUY" else max(0, held - quantity)
+        order = {
+            "at": self.clock.now().isoformat(),
+            "order_no": f"R{len(self.orders) + 1:08d}",
+            "side": side,
+            "stock_code": stock_code,
+            "quantity": quantity,
+            "filled_price": float(price),
+            "filled_quantity": quantity,
+        }
+        self.orders.append(order)
+        self.recorder.events.append(
+            {"at": order["at"], "type": "order.filled", "channel": "trading", "payload": order}
+        )
+        return order
+
+    async def buy_market(self, stock_code: str, quantity: int) -> dict[str, Any]:
+        return await self._fill("BUY", stock_code, quantity, None)
+
+    async def sell_market(self, stock_code: str, quantity: int) -> dict[str, Any]:
+        return await self._fill("SELL", stock_code, quantity, None)
+
+    async def buy_limit(self, stock_code: str, quantity: int, price: int) -> dict[str, Any]:
+        return await self._fill("BUY", stock_code, quantity, price)
+
+    async def sell_limit(self, stock_code: str, quantity: int, price: int) -> dict[str, Any]:
+        return await self._fill("SELL", stock_code, quantity, price)
+
+
+@dataclass
+class ReplayResult:
+    start: datetime
+    end: datetime
+    speed: float
+    events: list[dict[str, Any]]
+    orders: list[dict[str, Any]]
+    # 세션별 사이클 실제 소요 시간 (초)
+    cycle_latencies: dict[int, list[float]] = field(default_factory=dict)
+    wall_seconds: float = 0.0
+
+    def summary(self) -> dict:
+        latencies = [v for values in self.cycle_latencies.values() for v in values]
+        return {
+            "start": self.start.isoformat(),
+            "end": self.end.isoformat(),
+            "speed": self.speed,
+            "wall_seconds": self.wall_seconds,
+            "events": len(self.events),
+            "orders": len(self.orders),
+            "cycles": len(latencies),
+            "cycle_latency_median": statistics.median(latencies) if latencies else None,
+            "cycle_latency_max": max(latencies) if latencies else None,
+        }
+
+
+class MarketReplay:
+    """Drives recorded quotes through real ``StrategyExecutor`` instances at ``speed``x.
+
+    The clock, the data source, the broker, the status sink, the bar
+    aggregator and the evaluator (with its indicator cache) are private to
+    each run; the executor loop, the strategies and the order path are the
+    production code. Session logs are not written to ``trade_logs``.
+    """
+
+    def __init__(
+        self,
+        sessions: list[ReplaySession],
+        ticks: dict[str, pd.DataFrame],
+        start: datetime | None = None,
+        end: datetime | None = None,
+        speed: float = DEFAULT_SPEED,
+        store: OHLCVStore | None = None,
+    ):
+        self.sessions = sessions
+        self.ticks = ticks
+        self.speed = speed
+        self.store = store
+        self.start = start
+        self.end = end
+
+    def _time_range(self, source: ReplayDataSource) -> tuple[datetime, datetime]:
+        span = source.time_range()
+        if span is None and (self.start is None or self.end is None):
+            raise ValueError("No ticks to replay")
+        start = self.start or datetime.fromtimestamp(span[0], KST)
+        end = self.end or datetime.fromtimestamp(span[1] + 1, KST)
+        return start, end
+
+    async def run(self) -> ReplayResult:
+        # 시계는 시작 시각을 알아야 하므로 임시 시계로 시세 범위를 먼저 구함
+        probe = ReplayDataSource(self.ticks, Clock(), self.store)
+        start, end = self._time_range(probe)
+
+        clock = ReplayClock(start, self.speed)
+        source = ReplayDataSource(self.ticks, clock, self.store)
+        recorder = EventRecorder(clock)
+        broker = PaperBroker(source, clock, recorder)
+        hours = MarketHours(clock=clock, notifier=recorder)
+        triggers = TriggerIndex()
+        # 재생 주문은 PaperBroker 에 남기고 DB에는 쓰지 않음 (시작하지 않은 큐는 버려짐)
+        trades = TradeWriter()
+        bars = BarAggregator()
+        evaluator = BatchEvaluator(indicators=IndicatorCache())
+        latencies: dict[int, list[float]] = {}
+
+        executors = []
+        for i, spec in enumerate(self.sessions, start=1):
+            executor = StrategyExecutor(
+                session_id=i,
+                user_id=0,
+                broker=broker,
+                strategy=get_strategy(spec.strategy_type, spec.parameters),
+                stock_code=spec.stock_code,
+                interval_seconds=spec.interval_seconds,
+                order_quantity=spec.quantity,
+                timeframe=spec.timeframe,
+                clock=clock,
+                data_source=source,
+                notifier=recorder,
+                hours=hours,
+                triggers=triggers,
+                trades=trades,
+                bars=bars,
+                evaluator=evaluator,
+                on_cycle=latencies.setdefault(i, []).append,
+                persist_logs=False,
+            )
+            executors.append(executor)
+
+        wall_start = time.perf_counter()
+        tasks = [asyncio.create_task(e.run()) for e in executors]
+        while (remaining := (end - clock.now()).total_seconds()) > 0:
+            await asyncio.sleep(remaining / self.speed)
+        for e in executors:
+            e.stop()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        hours.close()
+
+        return ReplayResult(
+            start=start,
+            end=end,
+            speed=self.speed,
+            events=recorder.events,
+            orders=broker.orders,
+            cycle_latencies=latencies,
+            wall_seconds=time.perf_counter() - wall_start,
+        )
+
@@ -0,0 +1,336 @@
+import asyncio
+import json
+import os
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import bindparam, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.core.database import write_session
+from app.models.trade import Trade
+from app.models.trade_session import TradeSession
+from app.services.dashboard_service import summary_cache
+from app.services.pnl_service import DayTotals, add_daily_pnl, trade_day
+
+DEFAULT_BATCH_SIZE = 200
+DEFAULT_FLUSH_INTERVAL = 0.5
+# 종료 중에는 이 횟수만큼 시도한 뒤 남은 행을 파일로 넘김 (실행 중에는 계속 재시도)
+MAX_WRITE_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.1
+MAX_RETRY_DELAY = 5.0
+
+# 세션별 보유 수량과 평균 단가
+Position = tuple[int, float]
+
+
+def apply_fill(
+    position: Position, side: str, quantity: int, price: float
+) -> tuple[Position, float]:
+    """Fold one fill into an average-cost position; return it and the realized PnL."""
+    held, avg_cost = position
+    if side == "BUY":
+        total = held + quantity
+        return (total, (held * avg_cost + quantity * price) / total if total else 0.0), 0.0
+    sold = min(quantity, held)
+    remaining = held - sold
+    return (remaining, avg_cost if remaining else 0.0), (price - avg_cost) * sold
+
+
+def _spill_line(row: dict[str, Any]) -> str:
+    return json.dumps({**row, "created_at": row["created_at"].isoformat()}, ensure_ascii=False) + "\n"
+
+
+class TradeWriter:
+    """Write-behind persistence of engine orders.
+
+    ``record`` only enqueues the trade row, so the order path never waits on
+    the database. A background task collects rows until ``batch_size`` or
+    ``flush_interval`` and writes each batch in one transaction: one bulk
+    insert into ``trades``, one counter update per session (``total_trades``
+    and realized ``total_pnl`` at average cost) and one upsert of the
+    ``daily_pnl`` rollup per session and trading day. ``stop`` drains the
+    queue before returning.
+
+    Rows are never dropped. A batch that fails to commit stays at the head
+    of the queue and is retried with backoff while the writer runs; if the
+    database is still failing when ``stop`` is called, the unwritten rows
+    are appended to ``spill_path`` and written first on the next ``start``.
+    ``failing`` and ``last_error`` report an ongoing outage.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] = write_session,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        spill_path: str | Path | None = None,
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.spill_path = Path(spill_path or Path(settings.DATA_DIR) / "trade_spill.jsonl")
+        self._queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+        self._task: asyncio.Task | None = None
+        self._closing = False
+        self._positions: dict[int, Position] = {}
+        self._accounts: dict[int, int] = {}
+        self.written = 0
+        self.spilled = 0
+        self.failing = False
+        self.last_error: str | None = None
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def record(
+        self,
+        session_id: int,
+        user_id: int,
+        stock_code: str,
+        side: str,
+        quantity: int,
+        price: float,
+        status: str,
+        stock_name: str = "",
+        result: dict[str, Any] | None = None,
+        signal_reason: str = "",
+    ) -> None:
+        result = result or {}
+        filled_quantity = result.get("filled_quantity")
+        if filled_quantity is None and status == "filled":
+            filled_quantity = quantity
+        self._queue.put_nowait(
+            {
+                "session_id": session_id,
+                "user_id": user_id,
+                "stock_code": stock_code,
+                "stock_name": stock_name or stock_code,
+                "side": side,
+                "order_type": "MARKET",
+                "quantity": quantity,
+                "price": price,
+                "filled_price": result.get("filled_price"),
+                "filled_quantity": filled_quantity,
+                "status": status,
+                "kis_order_no": result.get("order_no") or None,
+                "signal_reason": signal_reason,
+                # 기록 시점이 아니라 주문 시점
+                "created_at": datetime.now(timezone.utc),
+            }
+        )
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._closing = False
+            self._task = asyncio.create_task(self._run(), name="trade-writer")
+
+    async def flush(self) -> None:
+        """Wait until every recorded trade has been written."""
+        if self._task is None or self._task.done():
+            while not self._queue.empty():
+                size = min(self._queue.qsize(), self.batch_size)
+                batch = [self._queue.get_nowait() for _ in range(size)]
+                await self._write(batch)
+                for _ in batch:
+                    self._queue.task_done()
+            return
+        await self._queue.join()
+
+    async def stop(self) -> None:
+        """Write everything still queued, without waiting for the flush interval.
+
+        Rows the database still refuses after ``MAX_WRITE_ATTEMPTS`` are
+        spilled to ``spill_path`` instead of being retried forever.
+        """
+        self._closing = True
+        if self._task is not None and not self._task.done():
+            self._queue.put_nowait(None)
+            await self._task
+        self._task = None
+        await self.flush()
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        await self._replay_spill()
+        closing = False
+        while not closing:
+            item = await self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+            batch = [item]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), deadline - loop.time())
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    # stop() 요청: 모은 배치를 바로 쓰고 종료
+                    self._queue.task_done()
+                    closing = True
+                    break
+                batch.append(item)
+            try:
+                await self._write(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _write(self, batch: list[dict[str, Any]], spill: bool = True) -> bool:
+        """Commit one batch, retrying until it succeeds or the writer is stopping.
+
+        Returns False when the batch was not committed; it has then been
+        spilled to ``spill_path`` unless ``spill`` is False.
+        """
+        log = logger.bind(category="order")
+        attempt = 0
+        delay = RETRY_BASE_DELAY
+        while True:
+            attempt += 1
+            try:
+                async with self.session_factory() as db:
+                    positions = await self._write_batch(db, batch)
+                    await db.commit()
+            except Exception as e:
+                self.failing = True
+                self.last_error = str(e)
+                log.error(f"Trade write failed ({len(batch)} rows, attempt {attempt}): {e}")
+                if self._closing and attempt >= MAX_WRITE_ATTEMPTS:
+                    if spill:
+                        self._spill(batch)
+                    return False
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, MAX_RETRY_DELAY)
+                continue
+            # 커밋된 뒤에만 반영해야 재시도 때 같은 체결이 두 번 들어가지 않음
+            self._positions.update(positions)
+            self.written += len(batch)
+            self.failing = False
+            for user_id in {row["user_id"] for row in batch}:
+                summary_cache.invalidate(user_id)
+            return True
+
+    def _spill(self, batch: list[dict[str, Any]]) -> None:
+        self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.spill_path, "a", encoding="utf-8") as f:
+            for row in batch:
+                f.write(_spill_line(row))
+            f.flush()
+            os.fsync(f.fileno())
+        self.spilled += len(batch)
+        logger.bind(category="order").error(
+            f"Spilled {len(batch)} unwritten trade rows to {self.spill_path}"
+        )
+
+    async def _replay_spill(self) -> None:
+        """Write rows spilled by an earlier run before anything recorded since."""
+        if not self.spill_path.exists():
+            return
+        with open(self.spill_path, encoding="utf-8") as f:
+            rows = [json.loads(line) for line in f if line.strip()]
+        total = len(rows)
+        for row in rows:
+            row["created_at"] = datetime.fromisoformat(row["created_at"])
+        while rows:
+            batch = rows[: self.batch_size]
+            if not await self._write(batch, spill=False):
+                return  # 남은 행은 파일에 그대로 두고 다음 시작 때 다시 시도
+            rows = rows[len(batch) :]
+            # 커밋한 행을 파일에서 빼 두어야 중간에 멈춰도 두 번 쓰지 않음
+            tmp = self.spill_path.with_suffix(".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                for row in rows:
+                    f.write(_spill_line(row))
+            os.replace(tmp, self.spill_path)
+        self.spill_path.unlink()
+        logger.bind(category="order").info(f"Replayed {total} spilled trade rows")
+
+    async def _write_batch(
+        self, db: AsyncSession, batch: list[dict[str, Any]]
+    ) -> dict[int, Position]:
+        filled = [row for row in batch if row["status"] == "filled" and row["session_id"]]
+        session_ids = {row["session_id"] for row in filled}
+        positions = {sid: self._positions[sid] for sid in session_ids if sid in self._positions}
+        await self._load_positions(db, session_ids - positions.keys(), positions)
+        await self._load_accounts(db, session_ids - self._accounts.keys())
+
+        await db.execute(insert(Trade), batch)
+
+        counters: dict[int, list] = {}
+        days: dict[tuple[int, date], DayTotals] = {}
+        for row in filled:
+            sid = row["session_id"]
+            price = row["filled_price"] or row["price"]
+            quantity = row["filled_quantity"] or row["quantity"]
+            positions[sid], pnl = apply_fill(positions[sid], row["side"], quantity, price)
+            counter = counters.setdefault(sid, [0, 0.0])
+            counter[0] += 1
+            counter[1] += pnl
+            account_id = self._accounts.get(sid)
+            if account_id is None:
+                continue  # 세션이 이미 삭제됨
+            key = (sid, trade_day(row["created_at"]))
+            if key not in days:
+                days[key] = DayTotals(row["user_id"], account_id, sid, key[1])
+            days[key].add(row["side"], quantity, price, pnl)
+
+        if counters:
+            table = TradeSession.__table__
+            await db.execute(
+                update(table)
+                .where(table.c.id == bindparam("sid"))
+                .values(
+                    total_trades=table.c.total_trades + bindparam("trades"),
+                    total_pnl=table.c.total_pnl + bindparam("pnl"),
+                ),
+                [{"sid": sid, "trades": n, "pnl": pnl} for sid, (n, pnl) in counters.items()],
+            )
+        await add_daily_pnl(db, list(days.values()))
+        return positions
+
+    async def _load_accounts(self, db: AsyncSession, session_ids: set[int]) -> None:
+        if not session_ids:
+            return
+        rows = await db.execute(
+            select(TradeSession.id, TradeSession.account_id).where(
+                TradeSession.id.in_(session_ids)
+            )
+        )
+        self._accounts.update({row.id: row.account_id for row in rows})
+
+    async def _load_positions(
+        self, db: AsyncSession, session_ids: set[int], positions: dict[int, Position]
+    ) -> None:
+        """Rebuild positions of sessions this writer has not seen yet from their stored fills."""
+        if not session_ids:
+            return
+        for sid in session_ids:
+            positions[sid] = (0, 0.0)
+        rows = await db.execute(
+            select(
+                Trade.session_id,
+                Trade.side,
+                Trade.quantity,
+                Trade.price,
+                Trade.filled_price,
+                Trade.filled_quantity,
+            )
+            .where(Trade.session_id.in_(session_ids), Trade.status == "filled")
+            .order_by(Trade.id)
+        )
+        for row in rows:
+            positions[row.session_id], _ = apply_fill(
+                positions[row.session_id],
+                row.side,
+                row.filled_quantity or row.quantity,
+                row.filled_price or row.price,
+            )
+
+
+trade_writer = TradeWriter()
@@ -0,0 +1,89 @@
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass, field
+from typing import Callable, Hashable
+
+Wake = Callable[[float], None]
+
+
+@dataclass
+class _SymbolBands:
+    # (하한, 키), (상한, 키) 를 각각 정렬해 두고 가격이 벗어난 쪽만 잘라냄
+    lows: list[tuple[float, int]] = field(default_factory=list)
+    highs: list[tuple[float, int]] = field(default_factory=list)
+
+
+class TriggerIndex:
+    """Price bands of waiting sessions, indexed per symbol.
+
+    Each session publishes the band within which its signal cannot change.
+    ``on_tick`` finds the bands a new price breaks with two binary searches,
+    so a quote costs O(log n + triggered) instead of one evaluation per
+    session. Triggered bands are removed and their ``wake`` callbacks called;
+    the woken session re-evaluates and publishes a new band.
+    """
+
+    def __init__(self):
+        self._symbols: dict[str, _SymbolBands] = {}
+        # key -> (종목, 하한, 상한, 순번, 콜백)
+        self._bands: dict[Hashable, tuple[str, float, float, int, Wake | None]] = {}
+        self._keys: dict[int, Hashable] = {}
+        self._seq = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._bands
+
+    def __len__(self) -> int:
+        return len(self._bands)
+
+    def band(self, key: Hashable) -> tuple[float, float] | None:
+        entry = self._bands.get(key)
+        return (entry[1], entry[2]) if entry else None
+
+    def set_band(
+        self,
+        stock_code: str,
+        key: Hashable,
+        low: float,
+        high: float,
+        wake: Wake | None = None,
+    ) -> None:
+        """Publish (or replace) the inclusive ``[low, high]`` band of ``key``."""
+        self.remove(key)
+        self._seq += 1
+        seq = self._seq
+        bands = self._symbols.setdefault(stock_code, _SymbolBands())
+        insort(bands.lows, (low, seq))
+        insort(bands.highs, (high, seq))
+        self._bands[key] = (stock_code, low, high, seq, wake)
+        self._keys[seq] = key
+
+    def remove(self, key: Hashable) -> None:
+        entry = self._bands.pop(key, None)
+        if entry is None:
+            return
+        stock_code, low, high, seq, _ = entry
+        bands = self._symbols[stock_code]
+        del bands.lows[bisect_left(bands.lows, (low, seq))]
+        del bands.highs[bisect_left(bands.highs, (high, seq))]
+        del self._keys[seq]
+        if not bands.lows:
+            del self._symbols[stock_code]
+
+    def on_tick(self, stock_code: str, price: float) -> list[Hashable]:
+        """Remove and wake every band of ``stock_code`` that ``price`` falls outside of."""
+        bands = self._symbols.get(stock_code)
+        if bands is None:
+            return []
+        # 하한이 가격보다 큰 띠, 상한이 가격보다 작은 띠
+        above = bands.lows[bisect_right(bands.lows, (price, float("inf"))) :]
+        below = bands.highs[: bisect_left(bands.highs, (price, -1))]
+        triggered = [self._keys[seq] for _, seq in above + below]
+        for key in triggered:
+            wake = self._bands[key][4]
+            self.remove(key)
+            if wake is not None:
+                wake(price)
+        return triggered
+
+
+trigger_index = TriggerIndex()
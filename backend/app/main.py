@@ -4,15 +4,32 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import settings
-from app.core.database import init_db
+from app.core.database import close_db, init_db
+from app.core.log_sink import db_log_sink
 from app.core.logging import setup_logging
+from app.engine.manager import trading_manager
+from app.engine.trade_writer import trade_writer
+from app.market.recorder import tick_recorder
+from app.tasks.pnl_backfill import backfill_daily_pnl_if_empty
+from app.tasks.scheduler import start_scheduler, stop_scheduler
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     setup_logging()
     await init_db()
+    await backfill_daily_pnl_if_empty()
+    db_log_sink.start()
+    start_scheduler()
+    trade_writer.start()
     yield
+    stop_scheduler()
+    # 실행기가 먼저 멈춰야 마지막 체결과 시세가 기록기에 들어간 뒤 기록기를 닫음
+    await trading_manager.stop_all()
+    await trade_writer.stop()
+    await db_log_sink.stop()
+    tick_recorder.close()
+    await close_db()
 
 
 def create_app() -> FastAPI:
@@ -28,6 +45,7 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Next-Cursor"],
     )
 
     from app.api.router import api_router
@@ -0,0 +1,164 @@
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from app.market.store import KST, OHLCV_DTYPE, records_to_array, to_frame
+
+# 분봉 타임프레임 -> 봉 길이 (분)
+INTRADAY_TIMEFRAMES: dict[str, int] = {"1m": 1, "5m": 5, "15m": 15, "60m": 60}
+
+DEFAULT_RING_CAPACITY = 500
+
+_KST_OFFSET = 9 * 3600
+
+
+def bucket_start(ts: int, minutes: int) -> int:
+    """Return the start of the ``minutes``-long bar containing ``ts`` (KST aligned)."""
+    # KST는 UTC+9 정시 단위라 epoch 기준으로 나눠도 분/시 경계가 맞음
+    size = minutes * 60
+    return ts - ts % size
+
+
+def resample(bars: np.ndarray, minutes: int) -> np.ndarray:
+    """Aggregate chronologically ordered 1-minute bars into ``minutes``-long bars."""
+    if minutes == 1 or len(bars) == 0:
+        return bars
+    buckets = bars["ts"] - bars["ts"] % (minutes * 60)
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:], len(bars)]
+    out = np.empty(len(starts), dtype=OHLCV_DTYPE)
+    out["ts"] = buckets[starts]
+    out["open"] = bars["open"][starts]
+    out["close"] = bars["close"][ends - 1]
+    out["high"] = np.maximum.reduceat(bars["high"], starts)
+    out["low"] = np.minimum.reduceat(bars["low"], starts)
+    out["volume"] = np.add.reduceat(bars["volume"], starts)
+    return out
+
+
+class BarRing:
+    """Fixed-capacity ring buffer of closed bars."""
+
+    def __init__(self, capacity: int = DEFAULT_RING_CAPACITY):
+        self._buf = np.zeros(capacity, dtype=OHLCV_DTYPE)
+        self._next = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, bar: tuple) -> None:
+        self._buf[self._next] = bar
+        self._next = (self._next + 1) % len(self._buf)
+        self._size = min(self._size + 1, len(self._buf))
+
+    def last_ts(self) -> int | None:
+        if not self._size:
+            return None
+        return int(self._buf["ts"][self._next - 1])
+
+    def array(self) -> np.ndarray:
+        """Return the buffered bars oldest first."""
+        if self._size < len(self._buf):
+            return self._buf[: self._size].copy()
+        return np.concatenate([self._buf[self._next :], self._buf[: self._next]])
+
+
+class _Series:
+    def __init__(self, minutes: int, capacity: int):
+        self.minutes = minutes
+        self.ring = BarRing(capacity)
+        self.forming: list | None = None  # [ts, open, high, low, close, volume]
+
+
+class BarAggregator:
+    """Builds intraday bars incrementally from polled or streamed quotes.
+
+    Every symbol keeps a forming bar and a ring of closed bars per
+    timeframe. A quote that lands in a later bucket closes the forming bar.
+    Quote volume is the exchange's cumulative daily volume, so per-bar volume
+    is the difference between consecutive quotes.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_RING_CAPACITY):
+        self.capacity = capacity
+        self._series: dict[tuple[str, str], _Series] = {}
+        self._cum_volume: dict[str, tuple[int, int]] = {}
+
+    def _get(self, stock_code: str, timeframe: str) -> _Series:
+        key = (stock_code, timeframe)
+        series = self._series.get(key)
+        if series is None:
+            series = _Series(INTRADAY_TIMEFRAMES[timeframe], self.capacity)
+            self._series[key] = series
+        return series
+
+    def track(self, stock_code: str, timeframe: str) -> None:
+        """Start building ``timeframe`` bars for a symbol."""
+        self._get(stock_code, timeframe)
+
+    def seed(self, stock_code: str, timeframe: str, records: list[dict[str, Any]]) -> None:
+        """Pre-fill closed bars from broker history (any order)."""
+        series = self._get(stock_code, timeframe)
+        last = series.ring.last_ts()
+        for bar in records_to_array(records):
+            if last is None or bar["ts"] > last:
+                series.ring.append(tuple(bar))
+
+    def on_tick(
+        self,
+        stock_code: str,
+        price: float,
+        cum_volume: int = 0,
+        ts: int | None = None,
+    ) -> list[str]:
+        """Fold a quote into every tracked timeframe; return timeframes whose bar closed."""
+        ts = int(ts if ts is not None else datetime.now(KST).timestamp())
+        day = (ts + _KST_OFFSET) // 86400
+        prev_day, prev_cum = self._cum_volume.get(stock_code, (day, None))
+        if prev_cum is None or prev_day != day:
+            # 그날 첫 시세: 누적 거래량 기준점만 잡음
+            volume = 0
+            self._cum_volume[stock_code] = (day, cum_volume)
+        else:
+            volume = max(0, cum_volume - prev_cum)
+            self._cum_volume[stock_code] = (day, max(prev_cum, cum_volume))
+
+        closed = []
+        for (code, timeframe), series in self._series.items():
+            if code != stock_code:
+                continue
+            start = bucket_start(ts, series.minutes)
+            bar = series.forming
+            if bar is not None and start < bar[0]:
+                continue  # 이미 지난 봉의 늦게 도착한 시세
+            if bar is not None and start > bar[0]:
+                series.ring.append(tuple(bar))
+                closed.append(timeframe)
+                bar = None
+            if bar is None:
+                series.forming = [start, price, price, price, price, volume]
+            else:
+                bar[2] = max(bar[2], price)
+                bar[3] = min(bar[3], price)
+                bar[4] = price
+                bar[5] += volume
+        return closed
+
+    def last_closed_ts(self, stock_code: str, timeframe: str) -> int | None:
+        return self._get(stock_code, timeframe).ring.last_ts()
+
+    def bars(self, stock_code: str, timeframe: str) -> np.ndarray:
+        return self._get(stock_code, timeframe).ring.array()
+
+    def frame(self, stock_code: str, timeframe: str, count: int | None = None) -> pd.DataFrame:
+        """Closed bars as an OHLCV DataFrame, oldest first."""
+        arr = self.bars(stock_code, timeframe)
+        if count:
+            arr = arr[-count:]
+        return to_frame(arr, timeframe)
+
+
+bar_aggregator = BarAggregator()
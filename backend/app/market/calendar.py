@@ -0,0 +1,148 @@
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+
+from app.config import settings
+from app.market.store import KST
+
+REGULAR_OPEN = time(9, 0)
+REGULAR_CLOSE = time(15, 30)
+
+# KRX 휴장일 (공휴일, 대체공휴일, 선거일, 연말 휴장일). 매년 12월 거래소 공지로 갱신
+KRX_HOLIDAYS: frozenset[date] = frozenset(
+    date(int(d[:4]), int(d[4:6]), int(d[6:]))
+    for d in (
+        # 2025
+        "20250101", "20250127", "20250128", "20250129", "20250130", "20250303",
+        "20250501", "20250505", "20250506", "20250603", "20250606", "20250815",
+        "20251003", "20251006", "20251007", "20251008", "20251009", "20251225",
+        "20251231",
+        # 2026
+        "20260101", "20260216", "20260217", "20260218", "20260302", "20260501",
+        "20260505", "20260525", "20260603", "20260817", "20260924", "20260925",
+        "20260928", "20261005", "20261009", "20261225", "20261231",
+        # 2027
+        "20270101", "20270208", "20270209", "20270301", "20270505", "20270513",
+        "20270816", "20270914", "20270915", "20270916", "20271004", "20271011",
+        "20271227", "20271231",
+    )
+)
+
+# 개장/폐장 시각이 바뀌는 날: 연초 첫 거래일은 10시 개장, 수능일은 한 시간씩 늦춰짐
+KRX_SPECIAL_SESSIONS: dict[date, tuple[time, time]] = {
+    date(2025, 1, 2): (time(10, 0), REGULAR_CLOSE),
+    date(2025, 11, 13): (time(10, 0), time(16, 30)),
+    date(2026, 1, 2): (time(10, 0), REGULAR_CLOSE),
+    date(2026, 11, 19): (time(10, 0), time(16, 30)),
+    date(2027, 1, 4): (time(10, 0), REGULAR_CLOSE),
+}
+
+_WEEKDAYS = "월화수목금토일"
+
+
+@dataclass(frozen=True)
+class Session:
+    day: date
+    open: datetime
+    close: datetime
+
+
+class TradingCalendar:
+    """Trading days and session hours of an exchange.
+
+    Weekends and ``holidays`` are closed; ``special_sessions`` override the
+    regular hours for delayed opens and early closes. Session bounds are
+    inclusive of the open and exclusive of the close.
+    """
+
+    def __init__(
+        self,
+        holidays: frozenset[date] | set[date] = frozenset(),
+        special_sessions: dict[date, tuple[time, time]] | None = None,
+        regular_hours: tuple[time, time] = (REGULAR_OPEN, REGULAR_CLOSE),
+    ):
+        self.holidays = frozenset(holidays)
+        self.special_sessions = dict(special_sessions or {})
+        self.regular_hours = regular_hours
+
+    def is_trading_day(self, day: date) -> bool:
+        return day.weekday() < 5 and day not in self.holidays
+
+    def previous_trading_day(self, day: date) -> date:
+        """The last trading day strictly before ``day``."""
+        for _ in range(366):
+            day -= timedelta(days=1)
+            if self.is_trading_day(day):
+                return day
+        raise ValueError(f"No trading day within a year before {day.isoformat()}")
+
+    def session(self, day: date) -> Session | None:
+        if not self.is_trading_day(day):
+            return None
+        open_t, close_t = self.special_sessions.get(day, self.regular_hours)
+        return Session(
+            day=day,
+            open=datetime.combine(day, open_t, KST),
+            close=datetime.combine(day, close_t, KST),
+        )
+
+    def is_open(self, now: datetime) -> bool:
+        session = self.session(now.astimezone(KST).date())
+        return session is not None and session.open <= now < session.close
+
+    def next_session(self, now: datetime) -> Session:
+        """The session that is open at ``now`` or, failing that, the next one to open."""
+        day = now.astimezone(KST).date()
+        for _ in range(366):
+            session = self.session(day)
+            if session is not None and now < session.close:
+                return session
+            day += timedelta(days=1)
+        raise ValueError(f"No trading session within a year of {now.isoformat()}")
+
+    def next_open(self, now: datetime) -> datetime:
+        """``now`` while the market is open, otherwise the next session's open."""
+        session = self.next_session(now)
+        return max(now, session.open)
+
+    def status(self, now: datetime) -> dict:
+        """Market status as sent to clients with ``waiting_market`` updates."""
+        now = now.astimezone(KST)
+        today = now.date()
+        session = self.session(today)
+        if session is not None and session.open <= now < session.close:
+            reason, next_open = "open", None
+        else:
+            if today.weekday() >= 5:
+                reason = "weekend"
+            elif today in self.holidays:
+                reason = "holiday"
+            elif session is not None and now < session.open:
+                reason = "before_open"
+            else:
+                reason = "after_close"
+            next_open = self.next_open(now)
+
+        return {
+            "is_open": next_open is None,
+            "reason": reason,
+            "next_open": self._label(next_open, today) if next_open else None,
+            "next_open_at": next_open.isoformat() if next_open else None,
+            "current_time": now.strftime("%H:%M:%S"),
+        }
+
+    @staticmethod
+    def _label(at: datetime, today: date) -> str:
+        days = (at.date() - today).days
+        if days == 0:
+            prefix = "오늘"
+        elif days == 1:
+            prefix = "내일"
+        else:
+            prefix = f"{at.month}/{at.day}({_WEEKDAYS[at.weekday()]})"
+        return f"{prefix} {at.strftime('%H:%M')}"
+
+
+krx_calendar = TradingCalendar(
+    holidays=KRX_HOLIDAYS | set(settings.market_holidays_list),
+    special_sessions=KRX_SPECIAL_SESSIONS,
+)
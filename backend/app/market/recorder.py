@@ -0,0 +1,275 @@
+import mmap
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Iterator
+
+import numpy as np
+import pandas as pd
+
+from app.config import settings
+from app.market.store import KST, date_to_ts
+
+QUOTE, CANDLE = 0, 1
+
+TICK_DTYPE = np.dtype(
+    [
+        ("ts", "<i8"),  # epoch milliseconds (수신 시각 또는 봉 시작 시각)
+        ("code", "S8"),
+        ("kind", "u1"),  # QUOTE / CANDLE
+        ("timeframe", "S3"),  # 시세는 빈 값, 봉은 D/1m/5m/15m/60m
+        ("open", "<f8"),
+        ("high", "<f8"),
+        ("low", "<f8"),
+        ("close", "<f8"),  # 시세는 현재가
+        ("volume", "<i8"),  # 시세는 당일 누적 거래량
+    ]
+)
+
+# 파일 헤더: 매직 넘버 + 기록된 레코드 수 (레코드 기록 직후 갱신)
+_MAGIC = int.from_bytes(b"RTICK001", "little")
+_HEADER = np.dtype([("magic", "<u8"), ("count", "<u8")])
+
+DEFAULT_CHUNK_RECORDS = 1 << 16
+DEFAULT_MAX_RECORDS = 1 << 22
+
+
+class TickRecorder:
+    """Append-only, fixed-width binary log of every quote and candle the engine observes.
+
+    One file per day (``YYYYMMDD.NNN.ticks``) is mapped into memory and grown
+    in chunks, so recording a quote is a single in-memory struct write. A
+    file that reaches ``max_records`` rolls over to the next segment, and the
+    first record of a new day starts a new file. The header's record count
+    is updated after every write, so a crash loses at most the record being
+    written.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        chunk_records: int = DEFAULT_CHUNK_RECORDS,
+        max_records: int = DEFAULT_MAX_RECORDS,
+        enabled: bool = True,
+    ):
+        self.root = Path(root)
+        self.chunk_records = chunk_records
+        self.max_records = max_records
+        self.enabled = enabled
+        self._day: str | None = None
+        self._path: Path | None = None
+        self._file = None
+        self._mm: mmap.mmap | None = None
+        self._header: np.ndarray | None = None
+        self._data: np.ndarray | None = None
+        self._count = 0
+        self._capacity = 0
+        self._day_end_ms = 0
+
+    # -- writing ---------------------------------------------------------
+
+    def _segment_paths(self, day: str) -> list[Path]:
+        return sorted(self.root.glob(f"{day}.*.ticks"))
+
+    def _map(self, capacity: int) -> None:
+        size = _HEADER.itemsize + capacity * TICK_DTYPE.itemsize
+        self._file.truncate(size)
+        self._mm = mmap.mmap(self._file.fileno(), size)
+        self._header = np.frombuffer(self._mm, dtype=_HEADER, count=1)
+        self._data = np.frombuffer(
+            self._mm, dtype=TICK_DTYPE, count=capacity, offset=_HEADER.itemsize
+        )
+        self._capacity = capacity
+
+    def _unmap(self) -> None:
+        # numpy 뷰가 남아 있으면 mmap을 닫을 수 없음
+        self._header = None
+        self._data = None
+        if self._mm is not None:
+            self._mm.flush()
+            self._mm.close()
+            self._mm = None
+
+    def _open(self, day: str) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        segments = self._segment_paths(day)
+        count = 0
+        if segments:
+            path = segments[-1]
+            count = len(read_tick_file(path))
+            if count >= self.max_records:
+                path = self.root / f"{day}.{len(segments):03d}.ticks"
+                count = 0
+        else:
+            path = self.root / f"{day}.000.ticks"
+
+        self._file = open(path, "r+b" if path.exists() else "w+b")
+        self._path = path
+        self._day = day
+        self._map(max(count + self.chunk_records, self.chunk_records))
+        self._header["magic"] = _MAGIC
+        self._header["count"] = count
+        self._count = count
+
+    def _grow(self) -> None:
+        capacity = min(self._capacity + self.chunk_records, self.max_records)
+        self._unmap()
+        self._map(capacity)
+
+    def _rotate(self, now_ms: int) -> None:
+        self.close()
+        now = datetime.fromtimestamp(now_ms / 1000, KST)
+        midnight = datetime(now.year, now.month, now.day, tzinfo=KST) + timedelta(days=1)
+        self._open(now.strftime("%Y%m%d"))
+        self._day_end_ms = int(midnight.timestamp() * 1000)
+
+    def record(
+        self,
+        stock_code: str,
+        kind: int,
+        close: float,
+        open_: float = 0.0,
+        high: float = 0.0,
+        low: float = 0.0,
+        volume: int = 0,
+        timeframe: str = "",
+        ts_ms: int | None = None,
+    ) -> None:
+        if not self.enabled:
+            return
+        now_ms = int(time.time() * 1000)
+        if ts_ms is None:
+            ts_ms = now_ms
+        # 날짜 문자열은 자정을 넘길 때만 다시 계산
+        if now_ms >= self._day_end_ms or self._count >= self.max_records:
+            self._rotate(now_ms)
+        elif self._count >= self._capacity:
+            self._grow()
+
+        self._data[self._count] = (
+            ts_ms,
+            stock_code.encode(),
+            kind,
+            timeframe.encode(),
+            open_,
+            high,
+            low,
+            close,
+            volume,
+        )
+        self._count += 1
+        self._header["count"] = self._count
+
+    def record_quote(self, quote: dict[str, Any]) -> None:
+        self.record(
+            str(quote.get("stock_code", "")),
+            QUOTE,
+            float(quote.get("current_price", 0)),
+            open_=float(quote.get("open_price", 0)),
+            high=float(quote.get("high", 0)),
+            low=float(quote.get("low", 0)),
+            volume=int(quote.get("volume", 0)),
+        )
+
+    def record_candles(
+        self, stock_code: str, timeframe: str, candles: list[dict[str, Any]]
+    ) -> None:
+        for c in candles:
+            self.record(
+                stock_code,
+                CANDLE,
+                float(c.get("close", 0)),
+                open_=float(c.get("open", 0)),
+                high=float(c.get("high", 0)),
+                low=float(c.get("low", 0)),
+                volume=int(c.get("volume", 0)),
+                timeframe=timeframe,
+                ts_ms=date_to_ts(str(c["date"])) * 1000,
+            )
+
+    def flush(self) -> None:
+        if self._mm is not None:
+            self._mm.flush()
+
+    def close(self) -> None:
+        """Unmap the current file and trim its unused tail."""
+        if self._file is None:
+            return
+        self._unmap()
+        self._file.truncate(_HEADER.itemsize + self._count * TICK_DTYPE.itemsize)
+        self._file.close()
+        self._file = None
+        self._day = None
+        self._day_end_ms = 0
+        self._count = 0
+        self._capacity = 0
+
+
+# -- reading -------------------------------------------------------------
+
+
+def read_tick_file(path: str | Path) -> np.ndarray:
+    """Return the records of one log file as a read-only memmap view."""
+    path = Path(path)
+    size = path.stat().st_size if path.exists() else 0
+    if size < _HEADER.itemsize:
+        return np.empty(0, dtype=TICK_DTYPE)
+    header = np.fromfile(path, dtype=_HEADER, count=1)[0]
+    if int(header["magic"]) != _MAGIC:
+        raise ValueError(f"Not a tick log: {path}")
+    available = (size - _HEADER.itemsize) // TICK_DTYPE.itemsize
+    count = min(int(header["count"]), available)
+    if count == 0:
+        return np.empty(0, dtype=TICK_DTYPE)
+    return np.memmap(path, dtype=TICK_DTYPE, mode="r", offset=_HEADER.itemsize, shape=(count,))
+
+
+def iter_tick_files(
+    root: str | Path, start: date | None = None, end: date | None = None
+) -> Iterator[np.ndarray]:
+    """Yield each log file's records in day and segment order."""
+    lo = start.strftime("%Y%m%d") if start else ""
+    hi = end.strftime("%Y%m%d") if end else "99999999"
+    for path in sorted(Path(root).glob("*.ticks")):
+        day = path.name.split(".", 1)[0]
+        if lo <= day <= hi:
+            yield read_tick_file(path)
+
+
+def read_ticks(
+    root: str | Path,
+    day: date,
+    stock_code: str | None = None,
+    kind: int | None = None,
+) -> np.ndarray:
+    """All records of one day, optionally filtered, as one structured array."""
+    parts = []
+    for arr in iter_tick_files(root, day, day):
+        mask = np.ones(len(arr), dtype=bool)
+        if stock_code is not None:
+            mask &= arr["code"] == stock_code.encode()
+        if kind is not None:
+            mask &= arr["kind"] == kind
+        parts.append(arr[mask])
+    if not parts:
+        return np.empty(0, dtype=TICK_DTYPE)
+    return np.concatenate(parts)
+
+
+def quotes_for_replay(records: np.ndarray) -> dict[str, pd.DataFrame]:
+    """Split recorded quotes per stock into the frames ``ReplayDataSource`` takes."""
+    quotes = records[records["kind"] == QUOTE]
+    frames = {}
+    for code in np.unique(quotes["code"]):
+        rows = quotes[quotes["code"] == code]
+        frames[code.decode()] = pd.DataFrame(
+            {
+                "ts": rows["ts"] // 1000,
+                "price": rows["close"],
+                "volume": rows["volume"],
+            }
+        )
+    return frames
+
+
+tick_recorder = TickRecorder(Path(settings.DATA_DIR) / "ticks", enabled=settings.TICK_RECORDING)
@@ -0,0 +1,179 @@
+import os
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from app.config import settings
+
+KST = timezone(timedelta(hours=9))
+
+OHLCV_DTYPE = np.dtype(
+    [
+        ("ts", "<i8"),
+        ("open", "<f8"),
+        ("high", "<f8"),
+        ("low", "<f8"),
+        ("close", "<f8"),
+        ("volume", "<i8"),
+    ]
+)
+
+
+def date_to_ts(value: str) -> int:
+    """Convert a KIS ``YYYYMMDD`` (or ``YYYYMMDDHHMM``) string to epoch seconds."""
+    value = value.replace("-", "")
+    if len(value) >= 12:
+        dt = datetime.strptime(value[:12], "%Y%m%d%H%M")
+    else:
+        dt = datetime.strptime(value[:8], "%Y%m%d")
+    return int(dt.replace(tzinfo=KST).timestamp())
+
+
+def ts_to_date(ts: int, timeframe: str = "D") -> str:
+    dt = datetime.fromtimestamp(int(ts), KST)
+    return dt.strftime("%Y%m%d") if timeframe in ("D", "W", "M") else dt.strftime("%Y%m%d%H%M")
+
+
+def records_to_array(records: list[dict[str, Any]]) -> np.ndarray:
+    """Convert broker candle dicts into a sorted, de-duplicated record array."""
+    arr = np.empty(len(records), dtype=OHLCV_DTYPE)
+    for i, r in enumerate(records):
+        arr[i] = (
+            date_to_ts(str(r["date"])),
+            float(r.get("open", 0)),
+            float(r.get("high", 0)),
+            float(r.get("low", 0)),
+            float(r.get("close", 0)),
+            int(r.get("volume", 0)),
+        )
+    arr = arr[np.argsort(arr["ts"], kind="stable")]
+    if len(arr) > 1:
+        # 같은 봉이 여러 번 오면 마지막 값을 사용
+        keep = np.append(arr["ts"][1:] != arr["ts"][:-1], True)
+        arr = arr[keep]
+    return arr
+
+
+def to_frame(arr: np.ndarray, timeframe: str = "D") -> pd.DataFrame:
+    """Build the OHLCV DataFrame the strategies expect, oldest candle first."""
+    return pd.DataFrame(
+        {
+            "date": [ts_to_date(ts, timeframe) for ts in arr["ts"]],
+            "open": arr["open"],
+            "high": arr["high"],
+            "low": arr["low"],
+            "close": arr["close"],
+            "volume": arr["volume"],
+        }
+    )
+
+
+class OHLCVStore:
+    """Append-only on-disk candle store, one fixed-width file per (stock, timeframe).
+
+    Files hold raw ``OHLCV_DTYPE`` records sorted by timestamp. Reads are
+    memory-mapped, so range queries hand back NumPy views without copying.
+    """
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+
+    def _path(self, stock_code: str, timeframe: str) -> Path:
+        return self.root / timeframe / f"{stock_code}.ohlcv"
+
+    def read(
+        self,
+        stock_code: str,
+        timeframe: str = "D",
+        start: int | None = None,
+        end: int | None = None,
+    ) -> np.ndarray:
+        """Return candles with ``start <= ts <= end`` as a read-only memmap view."""
+        path = self._path(stock_code, timeframe)
+        if not path.exists() or path.stat().st_size < OHLCV_DTYPE.itemsize:
+            return np.empty(0, dtype=OHLCV_DTYPE)
+        arr = np.memmap(path, dtype=OHLCV_DTYPE, mode="r")
+        lo = 0 if start is None else int(np.searchsorted(arr["ts"], start, side="left"))
+        hi = len(arr) if end is None else int(np.searchsorted(arr["ts"], end, side="right"))
+        return arr[lo:hi]
+
+    def tail(self, stock_code: str, timeframe: str = "D", count: int = 60) -> np.ndarray:
+        arr = self.read(stock_code, timeframe)
+        return arr[-count:] if count else arr[:0]
+
+    def last_ts(self, stock_code: str, timeframe: str = "D") -> int | None:
+        arr = self.read(stock_code, timeframe)
+        return int(arr["ts"][-1]) if len(arr) else None
+
+    def ingest(
+        self,
+        stock_code: str,
+        timeframe: str,
+        records: list[dict[str, Any]] | np.ndarray,
+        completed_before: int | None = None,
+    ) -> int:
+        """Store candles, returning how many new ones were written.
+
+        Candles newer than the stored tail are appended in place. Candles that
+        fall inside the stored range (a backfilled gap) trigger a one-off
+        merge and atomic rewrite. Bars at or after ``completed_before`` are
+        still forming and are skipped.
+        """
+        incoming = records if isinstance(records, np.ndarray) else records_to_array(records)
+        if completed_before is not None:
+            incoming = incoming[incoming["ts"] < completed_before]
+        if len(incoming) == 0:
+            return 0
+
+        path = self._path(stock_code, timeframe)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        existing = self.read(stock_code, timeframe)
+
+        if len(existing) == 0 or incoming["ts"][0] > existing["ts"][-1]:
+            with open(path, "ab") as f:
+                f.write(incoming.tobytes())
+            return len(incoming)
+
+        new = incoming[~np.isin(incoming["ts"], existing["ts"])]
+        if len(new) == 0:
+            return 0
+        merged = np.concatenate([np.asarray(existing), new])
+        merged.sort(order="ts")
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            f.write(merged.tobytes())
+        os.replace(tmp, path)
+        return len(new)
+
+    def find_gaps(
+        self, stock_code: str, start: date, end: date, timeframe: str = "D"
+    ) -> list[tuple[date, date]]:
+        """Return contiguous trading-day ranges between start and end with no daily candle."""
+        # calendar 모듈이 이 모듈의 KST 를 가져다 쓰므로 순환 import 를 피해 여기서 import
+        from app.market.calendar import krx_calendar
+
+        stored = {
+            datetime.fromtimestamp(int(ts), KST).date()
+            for ts in self.read(stock_code, timeframe)["ts"]
+        }
+        gaps: list[tuple[date, date]] = []
+        gap_start: date | None = None
+        day = start
+        while day <= end:
+            trading = krx_calendar.is_trading_day(day)
+            missing = trading and day not in stored
+            if missing and gap_start is None:
+                gap_start = day
+            elif not missing and trading and gap_start is not None:
+                gaps.append((gap_start, day - timedelta(days=1)))
+                gap_start = None
+            day += timedelta(days=1)
+        if gap_start is not None:
+            gaps.append((gap_start, end))
+        return gaps
+
+
+ohlcv_store = OHLCVStore(Path(settings.DATA_DIR) / "ohlcv")
@@ -4,5 +4,6 @@ from app.models.strategy import Strategy
 from app.models.trade_session import TradeSession
 from app.models.trade import Trade
 from app.models.trade_log import TradeLog
+from app.models.daily_pnl import DailyPnl
 
-__all__ = ["User", "KISAccount", "Strategy", "TradeSession", "Trade", "TradeLog"]
+__all__ = ["User", "KISAccount", "Strategy", "TradeSession", "Trade", "TradeLog", "DailyPnl"]
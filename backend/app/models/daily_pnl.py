@@ -0,0 +1,37 @@
+from datetime import date, datetime
+
+from sqlalchemy import Date, DateTime, Float, ForeignKey, Index, Integer, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class DailyPnl(Base):
+    """Filled trades of one session on one KST trading day, rolled up."""
+
+    __tablename__ = "daily_pnl"
+    __table_args__ = (
+        UniqueConstraint("session_id", "trade_date", name="uq_daily_pnl_session_date"),
+        # 대시보드/분석: 사용자별 기간 조회
+        Index("ix_daily_pnl_user_date", "user_id", "trade_date"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id"), nullable=False
+    )
+    account_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("kis_accounts.id"), nullable=False
+    )
+    session_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("trade_sessions.id"), nullable=False
+    )
+    trade_date: Mapped[date] = mapped_column(Date, nullable=False)
+    trades: Mapped[int] = mapped_column(Integer, default=0)
+    buy_amount: Mapped[float] = mapped_column(Float, default=0.0)
+    sell_amount: Mapped[float] = mapped_column(Float, default=0.0)
+    realized_pnl: Mapped[float] = mapped_column(Float, default=0.0)
+    fees: Mapped[float] = mapped_column(Float, default=0.0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
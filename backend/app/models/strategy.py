@@ -2,10 +2,9 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, func
-from sqlalchemy.dialects.sqlite import JSON
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.core.database import Base
+from app.core.database import Base, JSONType
 
 if TYPE_CHECKING:
     from app.models.user import User
@@ -21,11 +20,11 @@ class Strategy(Base):
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     strategy_type: Mapped[str] = mapped_column(String(50), nullable=False)
     parameters: Mapped[Optional[Dict[str, Any]]] = mapped_column(
-        JSON, default=dict
+        JSONType, default=dict
     )
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, server_default=func.now()
+        DateTime(timezone=True), server_default=func.now()
     )
 
     # Relationships
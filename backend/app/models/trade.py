@@ -1,7 +1,7 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import DateTime, Float, ForeignKey, Integer, String, Text, func
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -13,10 +13,14 @@ if TYPE_CHECKING:
 
 class Trade(Base):
     __tablename__ = "trades"
+    __table_args__ = (
+        # /trades, 최근 체결, 오늘 체결 수
+        Index("ix_trades_user_created", "user_id", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     session_id: Mapped[Optional[int]] = mapped_column(
-        Integer, ForeignKey("trade_sessions.id"), nullable=True
+        Integer, ForeignKey("trade_sessions.id"), nullable=True, index=True
     )
     user_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("users.id"), nullable=False
@@ -32,11 +36,12 @@ class Trade(Base):
     status: Mapped[str] = mapped_column(String(20), default="pending")
     kis_order_no: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     signal_reason: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # ORM 삽입도 마이크로초까지 같은 형식으로 저장해야 (created_at, id) 커서 비교가 맞음
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, server_default=func.now()
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), server_default=func.now()
     )
     updated_at: Mapped[Optional[datetime]] = mapped_column(
-        DateTime, onupdate=func.now(), nullable=True
+        DateTime(timezone=True), onupdate=func.now(), nullable=True
     )
 
     # Relationships
@@ -1,11 +1,10 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, func
-from sqlalchemy.dialects.sqlite import JSON
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.core.database import Base
+from app.core.database import Base, JSONType
 
 if TYPE_CHECKING:
     from app.models.user import User
@@ -13,6 +12,16 @@ if TYPE_CHECKING:
 
 class TradeLog(Base):
     __tablename__ = "trade_logs"
+    __table_args__ = (
+        # /logs: 사용자별 최신순, category 또는 level 필터
+        Index("ix_trade_logs_user_created", "user_id", "created_at", "id"),
+        Index("ix_trade_logs_user_category_created", "user_id", "category", "created_at", "id"),
+        Index("ix_trade_logs_user_level_created", "user_id", "level", "created_at", "id"),
+        # metadata @> '{"stock_code": ...}' 검색용 (PostgreSQL 전용)
+        Index("ix_trade_logs_metadata_gin", "metadata", postgresql_using="gin").ddl_if(
+            dialect="postgresql"
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     session_id: Mapped[Optional[int]] = mapped_column(
@@ -25,10 +34,11 @@ class TradeLog(Base):
     category: Mapped[str] = mapped_column(String(30), nullable=False)
     message: Mapped[str] = mapped_column(Text, nullable=False)
     metadata_json: Mapped[Optional[Dict[str, Any]]] = mapped_column(
-        "metadata", JSON, nullable=True
+        "metadata", JSONType, nullable=True
     )
+    # ORM 삽입도 마이크로초까지 같은 형식으로 저장해야 (created_at, id) 커서 비교가 맞음
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, server_default=func.now()
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), server_default=func.now()
     )
 
     # Relationships
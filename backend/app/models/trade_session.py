@@ -1,11 +1,10 @@
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from sqlalchemy import DateTime, Float, ForeignKey, Integer, String, func
-from sqlalchemy.dialects.sqlite import JSON
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.core.database import Base
+from app.core.database import Base, JSONType
 
 if TYPE_CHECKING:
     from app.models.account import KISAccount
@@ -16,6 +15,11 @@ if TYPE_CHECKING:
 
 class TradeSession(Base):
     __tablename__ = "trade_sessions"
+    __table_args__ = (
+        # /trading/active, 대시보드 실행 중 세션 수 / /trading/sessions 최신순
+        Index("ix_trade_sessions_user_status", "user_id", "status"),
+        Index("ix_trade_sessions_user_created", "user_id", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(
@@ -31,23 +35,23 @@ class TradeSession(Base):
     stock_name: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     quantity: Mapped[int] = mapped_column(Integer, default=1)
     status: Mapped[str] = mapped_column(String(20), default="pending")
-    config: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, default=dict)
+    config: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONType, default=dict)
     total_pnl: Mapped[float] = mapped_column(Float, default=0.0)
     total_trades: Mapped[int] = mapped_column(Integer, default=0)
     started_at: Mapped[Optional[datetime]] = mapped_column(
-        DateTime, nullable=True
+        DateTime(timezone=True), nullable=True
     )
     stopped_at: Mapped[Optional[datetime]] = mapped_column(
-        DateTime, nullable=True
+        DateTime(timezone=True), nullable=True
     )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, server_default=func.now()
+        DateTime(timezone=True), server_default=func.now()
     )
 
-    # Relationships
+    # Relationships (체결 내역은 total_trades/total_pnl 카운터로 대신하고 필요할 때만 명시적으로 로드)
     user: Mapped["User"] = relationship("User", back_populates="trade_sessions")
     account: Mapped["KISAccount"] = relationship("KISAccount")
     strategy: Mapped["Strategy"] = relationship("Strategy")
     trades: Mapped[List["Trade"]] = relationship(
-        "Trade", back_populates="session", lazy="selectin"
+        "Trade", back_populates="session", lazy="raise"
     )
@@ -21,22 +21,22 @@ class User(Base):
     username: Mapped[str] = mapped_column(String(50), unique=True, nullable=False)
     password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, server_default=func.now()
+        DateTime(timezone=True), server_default=func.now()
     )
 
-    # Relationships
+    # Relationships (필요한 엔드포인트에서 selectinload 등으로 명시적으로 로드)
     accounts: Mapped[List["KISAccount"]] = relationship(
-        "KISAccount", back_populates="user", lazy="selectin"
+        "KISAccount", back_populates="user", lazy="raise"
     )
     strategies: Mapped[List["Strategy"]] = relationship(
-        "Strategy", back_populates="user", lazy="selectin"
+        "Strategy", back_populates="user", lazy="raise"
     )
     trade_sessions: Mapped[List["TradeSession"]] = relationship(
-        "TradeSession", back_populates="user", lazy="selectin"
+        "TradeSession", back_populates="user", lazy="raise"
     )
     trades: Mapped[List["Trade"]] = relationship(
-        "Trade", back_populates="user", lazy="selectin"
+        "Trade", back_populates="user", lazy="raise"
     )
     trade_logs: Mapped[List["TradeLog"]] = relationship(
-        "TradeLog", back_populates="user", lazy="selectin"
+        "TradeLog", back_populates="user", lazy="raise"
     )
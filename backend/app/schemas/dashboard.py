@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import date, datetime
 from typing import List
 
 from pydantic import BaseModel
@@ -27,6 +27,15 @@ class HoldingsResponse(BaseModel):
     total_evaluation: float
 
 
+class DailyPnlItem(BaseModel):
+    trade_date: date
+    trades: int
+    turnover: float
+    realized_pnl: float
+    fees: float
+    net_pnl: float
+
+
 class RecentTradeItem(BaseModel):
     id: int
     stock_code: str
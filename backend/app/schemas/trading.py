@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import BaseModel, ConfigDict
 
@@ -11,6 +11,8 @@ class TradingStartRequest(BaseModel):
     stock_name: Optional[str] = None
     interval_seconds: int = 60
     quantity: int = 1
+    # D=일봉(interval_seconds마다 평가), 분봉은 봉 마감 시점에 평가
+    timeframe: Literal["D", "1m", "5m", "15m", "60m"] = "D"
 
 
 class AccountInfo(BaseModel):
@@ -68,3 +70,12 @@ class BuyableQuantityResponse(BaseModel):
     available_cash: int
     max_buyable_quantity: int
     message: Optional[str] = None
+
+
+class TradeWriterStatus(BaseModel):
+    # 체결 기록이 DB 에 쓰이지 못하고 재시도 중인지 (failing) 와 누적 통계
+    pending: int
+    written: int
+    spilled: int
+    failing: bool
+    last_error: Optional[str] = None
@@ -1,34 +1,76 @@
-from datetime import datetime, timezone
+from datetime import datetime
 
-from sqlalchemy import func, select
+from sqlalchemy import event, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
+from app.core.cache import TTLCache
 from app.engine.state import SessionState
+from app.market.store import KST
+from app.models.daily_pnl import DailyPnl
 from app.models.trade import Trade
 from app.models.trade_session import TradeSession
+from app.schemas.dashboard import DashboardSummary
 
 
-async def get_active_session_count(db: AsyncSession, user_id: int) -> int:
-    result = await db.execute(
-        select(func.count(TradeSession.id)).where(
-            TradeSession.user_id == user_id,
-            TradeSession.status == SessionState.RUNNING,
-        )
+class SummaryCache(TTLCache[int, DashboardSummary]):
+    """Per-user dashboard summaries, dropped whenever a session or trade changes.
+
+    Each user has a generation counter that ``invalidate`` bumps. A summary
+    computed while an invalidation happened is not stored, so a slow
+    computation cannot put back numbers from before the change.
+    """
+
+    def __init__(self, ttl: float):
+        super().__init__(ttl)
+        self._generations: dict[int, int] = {}
+
+    def generation(self, user_id: int) -> int:
+        return self._generations.get(user_id, 0)
+
+    def put_if_current(self, user_id: int, summary: DashboardSummary, generation: int) -> None:
+        if self.generation(user_id) == generation:
+            self.put(user_id, summary)
+
+    def invalidate(self, user_id: int) -> None:
+        super().invalidate(user_id)
+        if self.ttl > 0:
+            self._generations[user_id] = self.generation(user_id) + 1
+
+    def clear(self) -> None:
+        super().clear()
+        self._generations.clear()
+
+
+summary_cache = SummaryCache(ttl=settings.DASHBOARD_CACHE_SECONDS)
+
+
+def invalidate_summary(db: AsyncSession, user_id: int) -> None:
+    """Drop the user's cached summary now and again once ``db`` commits.
+
+    The second drop covers summaries computed between the change and its commit.
+    """
+    summary_cache.invalidate(user_id)
+    event.listen(
+        db.sync_session, "after_commit", lambda _: summary_cache.invalidate(user_id), once=True
     )
-    return result.scalar() or 0
 
 
-async def get_today_trade_count(db: AsyncSession, user_id: int) -> int:
-    today_start = datetime.now(timezone.utc).replace(
-        hour=0, minute=0, second=0, microsecond=0
+async def get_summary_counts(db: AsyncSession, user_id: int) -> tuple[int, int]:
+    """Running sessions and today's (KST) trades in one round trip.
+
+    Today's count sums the ``daily_pnl`` rollup rows instead of counting trades.
+    """
+    active = select(func.count(TradeSession.id)).where(
+        TradeSession.user_id == user_id,
+        TradeSession.status == SessionState.RUNNING,
     )
-    result = await db.execute(
-        select(func.count(Trade.id)).where(
-            Trade.user_id == user_id,
-            Trade.created_at >= today_start,
-        )
+    today = select(func.coalesce(func.sum(DailyPnl.trades), 0)).where(
+        DailyPnl.user_id == user_id,
+        DailyPnl.trade_date == datetime.now(KST).date(),
     )
-    return result.scalar() or 0
+    row = (await db.execute(select(active.scalar_subquery(), today.scalar_subquery()))).one()
+    return row[0] or 0, row[1] or 0
 
 
 async def get_recent_trades(
@@ -1,4 +1,26 @@
+import asyncio
+import time
+from datetime import date, datetime, timedelta
+from typing import Awaitable, Callable
+
+import pandas as pd
+from loguru import logger
+
 from app.broker.adapter import BrokerAdapter
+from app.market.calendar import krx_calendar
+from app.market.store import KST, ohlcv_store, to_frame
+
+# KIS 기간별 시세는 한 번에 최대 100개 봉을 반환하므로 약 140일 단위로 나눠 조회
+_BACKFILL_CHUNK_DAYS = 140
+
+# 실패한 갱신을 다시 시도하기까지 기다리는 시간 (초)
+REFRESH_RETRY_SECONDS = 30.0
+
+# 종목별 마지막 브로커 갱신 성공일 (성공하면 그날은 다시 묻지 않음)
+_refreshed: dict[str, date] = {}
+# 갱신에 실패한 종목은 이 시각(monotonic) 이후에 다시 시도
+_retry_at: dict[str, float] = {}
+_refresh_locks: dict[str, asyncio.Lock] = {}
 
 
 async def get_current_price(broker: BrokerAdapter, stock_code: str) -> dict:
@@ -9,3 +31,163 @@ async def get_ohlcv(
     broker: BrokerAdapter, stock_code: str, period: str = "D", count: int = 60
 ) -> list[dict]:
     return await broker.get_ohlcv(stock_code, period, count)
+
+
+def _today_start_ts(now: datetime | None = None) -> int:
+    now = now or datetime.now(KST)
+    return int(datetime(now.year, now.month, now.day, tzinfo=KST).timestamp())
+
+
+async def backfill_ohlcv(
+    broker: BrokerAdapter,
+    stock_code: str,
+    start: date,
+    end: date,
+    timeframe: str = "D",
+) -> int:
+    """Fetch every missing daily candle between start and end into the store."""
+    completed_before = _today_start_ts()
+    written = 0
+    for gap_start, gap_end in ohlcv_store.find_gaps(stock_code, start, end, timeframe):
+        chunk_start = gap_start
+        while chunk_start <= gap_end:
+            chunk_end = min(gap_end, chunk_start + timedelta(days=_BACKFILL_CHUNK_DAYS))
+            records = await broker.get_ohlcv_range(
+                stock_code,
+                timeframe,
+                chunk_start.strftime("%Y%m%d"),
+                chunk_end.strftime("%Y%m%d"),
+            )
+            written += ohlcv_store.ingest(
+                stock_code, timeframe, records, completed_before=completed_before
+            )
+            chunk_start = chunk_end + timedelta(days=1)
+    if written:
+        logger.bind(category="market").info(
+            f"Backfilled {written} candles for {stock_code} ({start} ~ {end})"
+        )
+    return written
+
+
+def _needs_refresh(stock_code: str, today: date) -> bool:
+    return _refreshed.get(stock_code) != today and _retry_at.get(stock_code, 0.0) <= time.monotonic()
+
+
+async def _refresh_daily(
+    stock_code: str,
+    count: int,
+    today: date,
+    get_broker: Callable[[], Awaitable[BrokerAdapter]],
+) -> None:
+    try:
+        broker = await get_broker()
+        # 주말/공휴일 여유분을 포함해 필요한 봉 수만큼 거슬러 올라감
+        start = today - timedelta(days=count * 7 // 5 + 10)
+        await backfill_ohlcv(broker, stock_code, start, today - timedelta(days=1))
+    except Exception as e:
+        _retry_at[stock_code] = time.monotonic() + REFRESH_RETRY_SECONDS
+        logger.bind(category="market").warning(
+            f"Daily candle refresh failed for {stock_code}, "
+            f"retrying in {REFRESH_RETRY_SECONDS:.0f}s: {e}"
+        )
+        raise
+    _refreshed[stock_code] = today
+    _retry_at.pop(stock_code, None)
+
+
+async def load_daily_history(
+    stock_code: str,
+    count: int,
+    get_broker: Callable[[], Awaitable[BrokerAdapter]],
+) -> pd.DataFrame:
+    """Return the last ``count`` completed daily candles, oldest first.
+
+    Candles are served from the local store. The broker is only asked for
+    whatever is missing, once per stock per day when that succeeds; a failed
+    refresh raises and is retried after ``REFRESH_RETRY_SECONDS``.
+    """
+    today = datetime.now(KST).date()
+    arr = ohlcv_store.tail(stock_code, "D", count)
+    last_day = (
+        datetime.fromtimestamp(int(arr["ts"][-1]), KST).date() if len(arr) else None
+    )
+    stale = last_day is None or last_day < krx_calendar.previous_trading_day(today)
+
+    if (len(arr) < count or stale) and _needs_refresh(stock_code, today):
+        # 같은 종목을 동시에 조회하는 세션들이 브로커를 한 번만 부르도록 직렬화
+        async with _refresh_locks.setdefault(stock_code, asyncio.Lock()):
+            if _needs_refresh(stock_code, today):
+                await _refresh_daily(stock_code, count, today, get_broker)
+        arr = ohlcv_store.tail(stock_code, "D", count)
+
+    return to_frame(arr)
+
+
+def with_live_bar(
+    history: pd.DataFrame, price_data: dict, now: datetime | None = None
+) -> pd.DataFrame:
+    """Append today's still-forming candle built from a current-price quote."""
+    live = pd.DataFrame(
+        [
+            {
+                "date": (now or datetime.now(KST)).strftime("%Y%m%d"),
+                "open": float(price_data.get("open_price") or price_data["current_price"]),
+                "high": float(price_data.get("high") or price_data["current_price"]),
+                "low": float(price_data.get("low") or price_data["current_price"]),
+                "close": float(price_data["current_price"]),
+                "volume": int(price_data.get("volume", 0)),
+            }
+        ]
+    )
+    if history.empty:
+        return live
+    return pd.concat([history, live], ignore_index=True)
+
+
+async def with_today_bar(
+    history: pd.DataFrame,
+    stock_code: str,
+    get_broker: Callable[[], Awaitable[BrokerAdapter]],
+    now: datetime | None = None,
+) -> pd.DataFrame:
+    """Append today's candle from a quote once today's session has opened.
+
+    The store only holds completed days, so without this a daily chart
+    misses the forming bar during the session and today's bar after it.
+    """
+    now = now or datetime.now(KST)
+    session = krx_calendar.session(now.astimezone(KST).date())
+    if session is None or now < session.open:
+        return history
+    try:
+        broker = await get_broker()
+        price_data = await broker.get_current_price(stock_code)
+    except Exception as e:
+        logger.bind(category="market").warning(f"No live bar for {stock_code}: {e}")
+        return history
+    if not price_data or float(price_data.get("current_price") or 0) <= 0:
+        return history
+    return with_live_bar(history, price_data, now=now)
+
+
+def load_frames(
+    stock_codes: list[str],
+    start: date | None = None,
+    end: date | None = None,
+    timeframe: str = "D",
+) -> dict[str, pd.DataFrame]:
+    """Read stored candles for a universe, e.g. as backtest or optimizer input."""
+    start_ts = (
+        int(datetime(start.year, start.month, start.day, tzinfo=KST).timestamp())
+        if start
+        else None
+    )
+    end_ts = (
+        int(datetime(end.year, end.month, end.day, 23, 59, tzinfo=KST).timestamp())
+        if end
+        else None
+    )
+    return {
+        code: to_frame(ohlcv_store.read(code, timeframe, start_ts, end_ts), timeframe)
+        for code in stock_codes
+    }
@@ -0,0 +1,271 @@
+import asyncio
+import bisect
+import itertools
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, AsyncIterator
+
+import numpy as np
+import pandas as pd
+
+from app.engine.backtest import run_backtest
+from app.strategies.registry import get_strategy, get_strategy_class
+
+OHLCV_FIELDS = ("open", "high", "low", "close", "volume")
+
+METRICS = ("total_return", "sharpe", "max_drawdown", "win_rate", "trades")
+_LOWER_IS_BETTER = {"max_drawdown"}
+
+# number 타입 파라미터를 균등 분할할 때의 기본 점 개수
+DEFAULT_NUMBER_POINTS = 11
+
+
+def _param_values(spec: dict, max_points: int | None) -> list:
+    if "min" not in spec or "max" not in spec:
+        raise ValueError("min/max required to expand a parameter")
+    lo, hi = spec["min"], spec["max"]
+    if spec.get("type") == "integer":
+        span = int(hi) - int(lo) + 1
+        if max_points is None or span <= max_points:
+            return list(range(int(lo), int(hi) + 1))
+        return sorted({int(round(v)) for v in np.linspace(lo, hi, max_points)})
+    points = max_points or DEFAULT_NUMBER_POINTS
+    return [float(v) for v in np.linspace(lo, hi, points)]
+
+
+def _resolve_axes(
+    schema: dict, ranges: dict[str, list] | None, max_points: int | None
+) -> dict[str, list]:
+    ranges = ranges or {}
+    axes = {}
+    for name, spec in schema.items():
+        if name in ranges:
+            axes[name] = list(ranges[name])
+        elif "min" in spec and "max" in spec:
+            axes[name] = _param_values(spec, max_points)
+        elif "default" in spec:
+            axes[name] = [spec["default"]]
+        else:
+            raise ValueError(f"Parameter '{name}' needs an explicit range")
+    return axes
+
+
+def expand_grid(
+    schema: dict,
+    ranges: dict[str, list] | None = None,
+    max_points: int | None = None,
+) -> list[dict]:
+    """Expand a ``parameter_schema()`` into every parameter combination.
+
+    Integer parameters cover every value between min and max unless
+    ``max_points`` caps them. ``ranges`` overrides the values of individual
+    parameters, which is required for parameters without min/max.
+    """
+    axes = _resolve_axes(schema, ranges, max_points)
+    names = list(axes)
+    return [dict(zip(names, combo)) for combo in itertools.product(*axes.values())]
+
+
+def sample_random(
+    schema: dict,
+    n: int,
+    ranges: dict[str, list] | None = None,
+    seed: int | None = None,
+) -> list[dict]:
+    """Draw ``n`` random parameter sets uniformly from the schema bounds."""
+    rng = random.Random(seed)
+    samples = []
+    for _ in range(n):
+        params = {}
+        for name, spec in schema.items():
+            if ranges and name in ranges:
+                params[name] = rng.choice(list(ranges[name]))
+            elif "min" in spec and "max" in spec:
+                if spec.get("type") == "integer":
+                    params[name] = rng.randint(int(spec["min"]), int(spec["max"]))
+                else:
+                    params[name] = rng.uniform(spec["min"], spec["max"])
+            elif "default" in spec:
+                params[name] = spec["default"]
+            else:
+                raise ValueError(f"Parameter '{name}' needs an explicit range")
+        samples.append(params)
+    return samples
+
+
+class SharedOHLCV:
+    """Packs per-symbol OHLCV frames into one shared memory block.
+
+    Worker processes attach to the block by name and read the candles in
+    place, so a sweep ships the history once instead of pickling it per task.
+    """
+
+    def __init__(self, frames: dict[str, pd.DataFrame]):
+        self.symbols = list(frames)
+        self.lengths = [len(frames[s]) for s in self.symbols]
+        shape = (len(self.symbols), len(OHLCV_FIELDS), max(self.lengths, default=0))
+        nbytes = max(int(np.prod(shape)) * 8, 1)
+        self._shm = shared_memory.SharedMemory(create=True, size=nbytes)
+        block = np.ndarray(shape, dtype=np.float64, buffer=self._shm.buf)
+        block.fill(np.nan)
+        for i, symbol in enumerate(self.symbols):
+            df = frames[symbol]
+            for j, name in enumerate(OHLCV_FIELDS):
+                block[i, j, : len(df)] = df[name].to_numpy(dtype=np.float64)
+        self.shape = shape
+
+    @property
+    def descriptor(self) -> tuple:
+        return (self._shm.name, self.shape, self.symbols, self.lengths)
+
+    def close(self) -> None:
+        self._shm.close()
+        self._shm.unlink()
+
+    def __enter__(self) -> "SharedOHLCV":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+# 워커 프로세스 전역 상태 (initializer에서 설정)
+_worker_shm: shared_memory.SharedMemory | None = None
+_worker_frames: dict[str, pd.DataFrame] = {}
+
+
+def attach_frames(descriptor: tuple) -> None:
+    """Process-pool initializer: map a ``SharedOHLCV`` block into this worker."""
+    global _worker_shm, _worker_frames
+    name, shape, symbols, lengths = descriptor
+    _worker_shm = shared_memory.SharedMemory(name=name)
+    # The parent owns the block; keep this process's tracker from unlinking it.
+    resource_tracker.unregister(_worker_shm._name, "shared_memory")
+    block = np.ndarray(shape, dtype=np.float64, buffer=_worker_shm.buf)
+    _worker_frames = {
+        symbol: pd.DataFrame(
+            {f: block[i, j, :length] for j, f in enumerate(OHLCV_FIELDS)}, copy=False
+        )
+        for i, (symbol, length) in enumerate(zip(symbols, lengths))
+    }
+
+
+def worker_frames() -> dict[str, pd.DataFrame]:
+    """Candles attached by ``attach_frames`` in this worker, by symbol."""
+    return _worker_frames
+
+
+def _evaluate_params(
+    strategy_type: str, params: dict, fee_rate: float
+) -> tuple[dict, dict[str, dict]]:
+    per_symbol = {}
+    for symbol, df in _worker_frames.items():
+        strategy = get_strategy(strategy_type, params)
+        per_symbol[symbol] = run_backtest(strategy, df, fee_rate).metrics()
+    return params, per_symbol
+
+
+def aggregate_metrics(per_symbol: dict[str, dict]) -> dict:
+    """Mean of each metric across symbols, with the trade counts summed."""
+    if not per_symbol:
+        return {m: 0.0 for m in METRICS}
+    rows = list(per_symbol.values())
+    summary = {m: float(np.mean([r[m] for r in rows])) for m in METRICS}
+    summary["trades"] = int(sum(r["trades"] for r in rows))
+    return summary
+
+
+@dataclass
+class SweepResult:
+    params: dict[str, Any]
+    metrics: dict[str, float]
+    per_symbol: dict[str, dict] = field(default_factory=dict, repr=False)
+    rank: int = 0
+
+
+class ParameterSweep:
+    """Fans backtests of many parameter sets out over a process pool."""
+
+    def __init__(
+        self,
+        strategy_type: str,
+        frames: dict[str, pd.DataFrame],
+        candidates: list[dict],
+        metric: str = "sharpe",
+        fee_rate: float = 0.0,
+        max_workers: int | None = None,
+    ):
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric: {metric}")
+        get_strategy_class(strategy_type)
+        self.strategy_type = strategy_type
+        self.frames = frames
+        self.metric = metric
+        self.fee_rate = fee_rate
+        self.max_workers = max_workers
+        self.candidates = [p for p in candidates if self._is_valid(p)]
+        self._leaderboard: list[SweepResult] = []
+        self._keys: list[float] = []
+
+    def _is_valid(self, params: dict) -> bool:
+        try:
+            get_strategy(self.strategy_type, params)
+        except ValueError:
+            return False
+        return True
+
+    def _score(self, result: SweepResult) -> float:
+        value = result.metrics[self.metric]
+        return value if self.metric in _LOWER_IS_BETTER else -value
+
+    def _insert(self, result: SweepResult) -> None:
+        key = self._score(result)
+        idx = bisect.bisect_right(self._keys, key)
+        self._keys.insert(idx, key)
+        self._leaderboard.insert(idx, result)
+        result.rank = idx + 1
+
+    async def stream(self) -> AsyncIterator[SweepResult]:
+        """Yield results as workers finish, each with its current rank."""
+        if not self.candidates:
+            return
+
+        loop = asyncio.get_running_loop()
+        shared = SharedOHLCV(self.frames)
+        pool = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=attach_frames,
+            initargs=(shared.descriptor,),
+        )
+        try:
+            futures = [
+                loop.run_in_executor(
+                    pool, _evaluate_params, self.strategy_type, params, self.fee_rate
+                )
+                for params in self.candidates
+            ]
+            for fut in asyncio.as_completed(futures):
+                params, per_symbol = await fut
+                result = SweepResult(
+                    params=params,
+                    metrics=aggregate_metrics(per_symbol),
+                    per_symbol=per_symbol,
+                )
+                self._insert(result)
+                yield result
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+            shared.close()
+
+    async def run(self) -> list[SweepResult]:
+        async for _ in self.stream():
+            pass
+        return self.ranked()
+
+    def ranked(self, top: int | None = None) -> list[SweepResult]:
+        board = self._leaderboard if top is None else self._leaderboard[:top]
+        for i, result in enumerate(board):
+            result.rank = i + 1
+        return list(board)
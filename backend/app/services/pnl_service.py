@@ -0,0 +1,103 @@
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.market.store import KST
+from app.models.daily_pnl import DailyPnl
+
+_SUMMED = ("trades", "buy_amount", "sell_amount", "realized_pnl", "fees")
+
+
+def trade_day(created_at: datetime) -> date:
+    """KST trading day of a trade timestamp (naive values are UTC)."""
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    return created_at.astimezone(KST).date()
+
+
+def trade_fees(side: str, amount: float) -> float:
+    """Estimated broker commission, plus the transaction tax on sells."""
+    fees = amount * settings.TRADE_FEE_RATE
+    if side == "SELL":
+        fees += amount * settings.SELL_TAX_RATE
+    return fees
+
+
+@dataclass
+class DayTotals:
+    user_id: int
+    account_id: int
+    session_id: int
+    trade_date: date
+    trades: int = 0
+    buy_amount: float = 0.0
+    sell_amount: float = 0.0
+    realized_pnl: float = 0.0
+    fees: float = 0.0
+
+    def add(self, side: str, quantity: int, price: float, pnl: float) -> None:
+        amount = quantity * price
+        self.trades += 1
+        if side == "BUY":
+            self.buy_amount += amount
+        else:
+            self.sell_amount += amount
+        self.realized_pnl += pnl
+        self.fees += trade_fees(side, amount)
+
+    def row(self) -> dict:
+        return {
+            "user_id": self.user_id,
+            "account_id": self.account_id,
+            "session_id": self.session_id,
+            "trade_date": self.trade_date,
+            **{name: getattr(self, name) for name in _SUMMED},
+        }
+
+
+async def add_daily_pnl(db: AsyncSession, totals: list[DayTotals]) -> None:
+    """Add ``totals`` onto the rollup rows, creating the rows that do not exist yet."""
+    if not totals:
+        return
+    dialect = db.get_bind().dialect.name
+    insert = pg_insert if dialect == "postgresql" else sqlite_insert
+    stmt = insert(DailyPnl.__table__)
+    table = DailyPnl.__table__
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[table.c.session_id, table.c.trade_date],
+            set_={
+                **{name: table.c[name] + stmt.excluded[name] for name in _SUMMED},
+                "updated_at": func.now(),
+            },
+        ),
+        [t.row() for t in totals],
+    )
+
+
+async def get_daily_pnl(
+    db: AsyncSession, user_id: int, start: date, end: date
+) -> list[dict]:
+    """Per-day totals of a user over ``[start, end]``, summed across sessions."""
+    result = await db.execute(
+        select(
+            DailyPnl.trade_date,
+            func.sum(DailyPnl.trades).label("trades"),
+            func.sum(DailyPnl.buy_amount + DailyPnl.sell_amount).label("turnover"),
+            func.sum(DailyPnl.realized_pnl).label("realized_pnl"),
+            func.sum(DailyPnl.fees).label("fees"),
+        )
+        .where(
+            DailyPnl.user_id == user_id,
+            DailyPnl.trade_date >= start,
+            DailyPnl.trade_date <= end,
+        )
+        .group_by(DailyPnl.trade_date)
+        .order_by(DailyPnl.trade_date)
+    )
+    return [dict(row._mapping) for row in result]
@@ -0,0 +1,286 @@
+import asyncio
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from app.engine.backtest import generate_signals, simulate
+from app.services.optimizer_service import (
+    METRICS,
+    SharedOHLCV,
+    aggregate_metrics,
+    attach_frames,
+    worker_frames,
+)
+from app.strategies.registry import get_strategy, get_strategy_class
+
+# (train_start, train_end, test_start, test_end) 종목별 봉 인덱스, 끝은 미포함
+Bounds = tuple[int, int, int, int]
+
+
+@dataclass
+class Window:
+    """One walk-forward step as half-open ranges on the common calendar."""
+
+    index: int
+    train: tuple[int, int]
+    test: tuple[int, int]
+    train_period: tuple[str, str] = ("", "")
+    test_period: tuple[str, str] = ("", "")
+
+
+def rolling_windows(
+    n_bars: int,
+    train_size: int,
+    test_size: int,
+    step: int | None = None,
+    anchored: bool = False,
+) -> list[Window]:
+    """Split ``n_bars`` into consecutive train/test windows.
+
+    Each test window directly follows its train window and the windows move
+    forward by ``step`` bars (``test_size`` by default), so the test windows
+    tile the out-of-sample period. ``anchored`` keeps every train window
+    starting at the first bar instead of rolling it.
+    """
+    if train_size < 1 or test_size < 1:
+        raise ValueError("train_size and test_size must be positive")
+    step = step or test_size
+    windows = []
+    start = 0
+    while start + train_size + test_size <= n_bars:
+        train_end = start + train_size
+        windows.append(
+            Window(
+                index=len(windows),
+                train=(0 if anchored else start, train_end),
+                test=(train_end, train_end + test_size),
+            )
+        )
+        start += step
+    return windows
+
+
+def _evaluate_windows(
+    strategy_type: str,
+    params: dict,
+    fee_rate: float,
+    bounds: dict[str, list[Bounds]],
+) -> tuple[dict, list[dict[str, dict]], list[dict[str, dict]]]:
+    """Backtest one parameter set on every window of every symbol.
+
+    Signals only depend on each bar's trailing history, so they are generated
+    once over the full series and every overlapping window reuses them; a
+    window is just a slice of the signal and close arrays.
+    """
+    n_windows = len(next(iter(bounds.values()), []))
+    train: list[dict[str, dict]] = [{} for _ in range(n_windows)]
+    test: list[dict[str, dict]] = [{} for _ in range(n_windows)]
+    for symbol, df in worker_frames().items():
+        strategy = get_strategy(strategy_type, params)
+        signals = generate_signals(strategy, df)
+        close = df["close"].to_numpy(dtype=float)
+        for i, (tr_a, tr_b, te_a, te_b) in enumerate(bounds[symbol]):
+            if tr_b > tr_a:
+                train[i][symbol] = simulate(close[tr_a:tr_b], signals[tr_a:tr_b], fee_rate).metrics()
+            if te_b > te_a:
+                test[i][symbol] = simulate(close[te_a:te_b], signals[te_a:te_b], fee_rate).metrics()
+    return params, train, test
+
+
+@dataclass
+class WindowResult:
+    window: Window
+    best_params: dict[str, Any]
+    train_metrics: dict[str, float]
+    test_metrics: dict[str, float]
+    per_symbol: dict[str, dict] = field(default_factory=dict, repr=False)
+
+
+@dataclass
+class WalkForwardReport:
+    metric: str
+    windows: list[WindowResult]
+    out_of_sample: dict[str, float]
+    in_sample: dict[str, float]
+    # 학습 구간 대비 검증 구간 성과 비율 (1에 가까울수록 과최적화가 적음)
+    efficiency: float | None
+    param_stability: list[tuple[dict, int]]
+
+    def summary(self) -> dict:
+        return {
+            "metric": self.metric,
+            "windows": len(self.windows),
+            "out_of_sample": self.out_of_sample,
+            "in_sample": self.in_sample,
+            "efficiency": self.efficiency,
+            "param_stability": [
+                {"params": params, "windows": count} for params, count in self.param_stability
+            ],
+        }
+
+
+def _summarize(results: list[dict[str, float]], chained: bool) -> dict[str, float]:
+    if not results:
+        return {m: 0.0 for m in METRICS}
+    summary = {m: float(np.mean([r[m] for r in results])) for m in METRICS}
+    if chained:
+        # 겹치지 않는 검증 구간은 수익률을 이어 붙여 누적 수익률로 봄
+        summary["total_return"] = float(
+            (np.prod([1 + r["total_return"] / 100 for r in results]) - 1) * 100
+        )
+    summary["max_drawdown"] = float(max(r["max_drawdown"] for r in results))
+    summary["trades"] = int(sum(r["trades"] for r in results))
+    return summary
+
+
+class WalkForwardAnalysis:
+    """Rolling train/test optimization with aggregated out-of-sample metrics.
+
+    For every window the candidate with the best in-sample ``metric`` is
+    picked and scored on the following test window. Candidates are spread
+    over a process pool that reads the candles from shared memory; each task
+    scores one parameter set on all windows at once so the signals of
+    overlapping windows are computed a single time.
+    """
+
+    def __init__(
+        self,
+        strategy_type: str,
+        frames: dict[str, pd.DataFrame],
+        candidates: list[dict],
+        train_size: int,
+        test_size: int,
+        step: int | None = None,
+        anchored: bool = False,
+        metric: str = "sharpe",
+        fee_rate: float = 0.0,
+        max_workers: int | None = None,
+    ):
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric: {metric}")
+        get_strategy_class(strategy_type)
+        self.strategy_type = strategy_type
+        self.frames = frames
+        self.metric = metric
+        self.fee_rate = fee_rate
+        self.max_workers = max_workers
+        self.candidates = [p for p in candidates if self._is_valid(p)]
+
+        self._keys = {symbol: self._bar_keys(df) for symbol, df in frames.items()}
+        self.calendar = (
+            np.unique(np.concatenate(list(self._keys.values())))
+            if frames
+            else np.array([])
+        )
+        self.windows = rolling_windows(len(self.calendar), train_size, test_size, step, anchored)
+        for w in self.windows:
+            w.train_period = (self._label(w.train[0]), self._label(w.train[1] - 1))
+            w.test_period = (self._label(w.test[0]), self._label(w.test[1] - 1))
+
+    def _is_valid(self, params: dict) -> bool:
+        try:
+            get_strategy(self.strategy_type, params)
+        except ValueError:
+            return False
+        return True
+
+    @staticmethod
+    def _bar_keys(df: pd.DataFrame) -> np.ndarray:
+        # 날짜가 있으면 날짜로, 없으면 봉 순서로 종목 간 구간을 맞춤
+        if "date" in df:
+            return df["date"].astype(str).to_numpy()
+        return np.arange(len(df))
+
+    def _label(self, i: int) -> str:
+        return str(self.calendar[i])
+
+    def _bounds(self) -> dict[str, list[Bounds]]:
+        def position(keys: np.ndarray, i: int) -> int:
+            if i >= len(self.calendar):
+                return len(keys)
+            return int(np.searchsorted(keys, self.calendar[i]))
+
+        return {
+            symbol: [
+                (
+                    position(keys, w.train[0]),
+                    position(keys, w.train[1]),
+                    position(keys, w.test[0]),
+                    position(keys, w.test[1]),
+                )
+                for w in self.windows
+            ]
+            for symbol, keys in self._keys.items()
+        }
+
+    def _better(self, a: float, b: float) -> bool:
+        return a < b if self.metric == "max_drawdown" else a > b
+
+    async def run(self) -> WalkForwardReport:
+        if not self.candidates or not self.windows:
+            empty = _summarize([], chained=False)
+            return WalkForwardReport(self.metric, [], empty, dict(empty), None, [])
+
+        loop = asyncio.get_running_loop()
+        bounds = self._bounds()
+        shared = SharedOHLCV(self.frames)
+        pool = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=attach_frames,
+            initargs=(shared.descriptor,),
+        )
+        try:
+            scored = await asyncio.gather(
+                *(
+                    loop.run_in_executor(
+                        pool,
+                        _evaluate_windows,
+                        self.strategy_type,
+                        params,
+                        self.fee_rate,
+                        bounds,
+                    )
+                    for params in self.candidates
+                )
+            )
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+            shared.close()
+
+        results = []
+        for w in self.windows:
+            best = None
+            for params, train, test in scored:
+                train_metrics = aggregate_metrics(train[w.index])
+                if best is None or self._better(
+                    train_metrics[self.metric], best[1][self.metric]
+                ):
+                    best = (params, train_metrics, test[w.index])
+            params, train_metrics, test_per_symbol = best
+            results.append(
+                WindowResult(
+                    window=w,
+                    best_params=params,
+                    train_metrics=train_metrics,
+                    test_metrics=aggregate_metrics(test_per_symbol),
+                    per_symbol=test_per_symbol,
+                )
+            )
+
+        out_of_sample = _summarize([r.test_metrics for r in results], chained=True)
+        in_sample = _summarize([r.train_metrics for r in results], chained=False)
+        mean_is = float(np.mean([r.train_metrics[self.metric] for r in results]))
+        mean_oos = float(np.mean([r.test_metrics[self.metric] for r in results]))
+        stability = Counter(tuple(sorted(r.best_params.items())) for r in results)
+        return WalkForwardReport(
+            metric=self.metric,
+            windows=results,
+            out_of_sample=out_of_sample,
+            in_sample=in_sample,
+            efficiency=mean_oos / mean_is if mean_is else None,
+            param_stability=[(dict(k), n) for k, n in stability.most_common()],
+        )
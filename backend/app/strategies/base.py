@@ -1,15 +1,45 @@
 from abc import ABC, abstractmethod
 
+import numpy as np
 import pandas as pd
 
 from app.engine.signals import Signal
 
+# Candles handed to ``evaluate`` when a strategy needs no more than this.
+DEFAULT_HISTORY = 60
+
+
+def price_band(
+    price: float, breakpoints: list[float], tolerance: float = 0.0
+) -> tuple[float, float]:
+    """Closed price range around ``price`` that contains none of ``breakpoints``.
+
+    ``tolerance`` shrinks finite ends by that fraction of the price, for
+    breakpoints that are solved numerically rather than given exactly.
+    """
+    low, high = -np.inf, np.inf
+    for b in breakpoints:
+        if b == price:
+            return price, price
+        if b < price:
+            low = max(low, b)
+        else:
+            high = min(high, b)
+    margin = tolerance * abs(price)
+    if np.isfinite(low):
+        low = min(float(np.nextafter(low, np.inf)) + margin, price)
+    if np.isfinite(high):
+        high = max(float(np.nextafter(high, -np.inf)) - margin, price)
+    return low, high
+
 
 class BaseStrategy(ABC):
     """Abstract base class for all trading strategies."""
 
     name: str = ""
     description: str = ""
+    # True when the class overrides ``evaluate_batch`` with a vectorised version
+    batchable: bool = False
 
     def __init__(self, parameters: dict):
         self.parameters = parameters
@@ -34,6 +64,49 @@ class BaseStrategy(ABC):
     def get_signal_reason(self) -> str:
         return self._last_reason
 
+    def required_history(self) -> int:
+        """Return the number of candles ``evaluate`` needs to produce a signal."""
+        return 1
+
+    def signal_band(
+        self, current_price: float, ohlcv_df: pd.DataFrame
+    ) -> tuple[float, float] | None:
+        """Price range over which ``evaluate`` keeps returning the same signal.
+
+        ``ohlcv_df`` is the frame just evaluated, whose last candle is the
+        live bar closing at ``current_price``. While only that close moves
+        inside the returned inclusive ``(low, high)`` the signal cannot
+        change. ``None`` means the strategy has to be evaluated every cycle.
+        """
+        return None
+
+    @classmethod
+    def evaluate_batch(
+        cls,
+        closes: np.ndarray,
+        params: list[dict],
+        current_prices: np.ndarray | None = None,
+    ) -> tuple[list[Signal], list[str]]:
+        """Evaluate many close series at once.
+
+        ``closes`` is an (n_series, n_bars) matrix, oldest bar first, and
+        ``params`` holds one parameter dict per row. Returns the signal and
+        reason each row would get from ``evaluate``.
+
+        The default runs ``evaluate`` row by row on a close-only frame, with
+        the last close as the current price unless ``current_prices`` is
+        given. Classes with ``batchable = True`` replace it with a
+        vectorised version.
+        """
+        signals: list[Signal] = []
+        reasons: list[str] = []
+        for i, (row, p) in enumerate(zip(closes, params)):
+            strategy = cls(p)
+            price = float(row[-1] if current_prices is None else current_prices[i])
+            signals.append(strategy.evaluate(price, pd.DataFrame({"close": row}), None))
+            reasons.append(strategy.get_signal_reason())
+        return signals, reasons
+
     @classmethod
     @abstractmethod
     def parameter_schema(cls) -> dict:
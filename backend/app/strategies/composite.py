@@ -0,0 +1,323 @@
+import ast
+import operator
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from app.engine.signals import Signal
+from app.strategies import indicators
+from app.strategies.base import BaseStrategy
+
+PRICE_FIELDS = ("open", "high", "low", "close", "volume")
+
+# 지표 함수 -> (계산 함수, 필요한 추가 봉 수)
+INDICATORS = {
+    "sma": (indicators.sma, 0),
+    "ema": (indicators.ema, 0),
+    "rsi": (indicators.rsi, 1),
+}
+
+_BINARY_OPS = {
+    ast.Add: "add",
+    ast.Sub: "sub",
+    ast.Mult: "mul",
+    ast.Div: "div",
+}
+
+# a > b 는 b < a 로 바꿔 같은 비교가 하나의 노드를 공유하게 함
+_COMPARE_OPS = {
+    ast.Lt: ("lt", False),
+    ast.LtE: ("le", False),
+    ast.Gt: ("lt", True),
+    ast.GtE: ("le", True),
+}
+
+_COMMUTATIVE = {"add", "mul", "and", "or"}
+
+# 참/거짓을 내는 연산. 규칙의 최상위와 and/or/not 의 피연산자는 이 중 하나여야 함
+_CONDITION_OPS = {"lt", "le", "and", "or", "not", "cross_above", "cross_below"}
+
+# 지표 기간과 prev() 봉 수의 상한 (다른 전략의 기간 파라미터 최대값과 같음)
+MAX_PERIOD = 200
+
+_NUMPY_OPS = {
+    "add": operator.add,
+    "sub": operator.sub,
+    "mul": operator.mul,
+    "lt": operator.lt,
+    "le": operator.le,
+    "and": np.logical_and,
+    "or": np.logical_or,
+}
+
+
+def _shift(values: Any, periods: int) -> Any:
+    if np.ndim(values) == 0:
+        return values
+    shifted = np.full(len(values), np.nan)
+    if periods < len(values):
+        shifted[periods:] = values[: len(values) - periods]
+    return shifted
+
+
+@dataclass(frozen=True)
+class _Step:
+    op: str
+    arg: Any  # 상수 값, 가격 필드, 지표 기간, 시프트 폭
+    inputs: tuple[int, ...]
+    history: int
+    label: str
+
+
+class EvaluationPlan:
+    """Rules compiled into a flat list of steps.
+
+    Every distinct subexpression is one step, so an indicator referenced by
+    both the buy and the sell rule is computed once per bar. Steps are in
+    dependency order and each writes one value slot.
+    """
+
+    def __init__(self, rules: dict[str, str]):
+        self.steps: list[_Step] = []
+        self._slots: dict[tuple, int] = {}
+        self.roots: dict[str, int] = {}
+        for name, text in rules.items():
+            try:
+                tree = ast.parse(text.strip(), mode="eval")
+            except SyntaxError as e:
+                raise ValueError(f"Invalid {name} expression: {e.msg}") from e
+            root = self._compile(tree.body)
+            if not self._is_condition(root):
+                raise ValueError(
+                    f"{name} rule must be a condition (comparison, cross or and/or/not): {text}"
+                )
+            self.roots[name] = root
+        self.history = max([self.steps[s].history for s in self.roots.values()] + [1])
+
+    def _emit(self, op: str, arg: Any, inputs: tuple[int, ...], history: int, label: str) -> int:
+        if op in _COMMUTATIVE:
+            inputs = tuple(sorted(inputs))
+        key = (op, arg, inputs)
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = len(self.steps)
+            self.steps.append(_Step(op, arg, inputs, history, label))
+            self._slots[key] = slot
+        return slot
+
+    def _is_condition(self, slot: int) -> bool:
+        step = self.steps[slot]
+        if step.op == "prev":
+            return self._is_condition(step.inputs[0])
+        return step.op in _CONDITION_OPS
+
+    def _condition(self, node: ast.AST) -> int:
+        slot = self._compile(node)
+        if not self._is_condition(slot):
+            raise ValueError(f"'{ast.unparse(node)}' is not a condition")
+        return slot
+
+    def _combine(self, op: str, inputs: list[int], label: str, extra: int = 0) -> int:
+        history = max(self.steps[i].history for i in inputs) + extra
+        return self._emit(op, None, tuple(inputs), history, label)
+
+    def _compile(self, node: ast.AST) -> int:
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) \
+                and not isinstance(node.value, bool):
+            return self._emit("const", float(node.value), (), 0, repr(node.value))
+
+        if isinstance(node, ast.Name):
+            if node.id in PRICE_FIELDS:
+                return self._emit("field", node.id, (), 1, node.id)
+            if node.id == "price":
+                return self._emit("price", None, (), 0, "price")
+            raise ValueError(f"Unknown name '{node.id}'")
+
+        if isinstance(node, ast.UnaryOp):
+            if isinstance(node.op, ast.Not):
+                return self._combine("not", [self._condition(node.operand)], ast.unparse(node))
+            if isinstance(node.op, ast.USub):
+                return self._combine("neg", [self._compile(node.operand)], ast.unparse(node))
+
+        if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPS:
+            inputs = [self._compile(node.left), self._compile(node.right)]
+            return self._combine(_BINARY_OPS[type(node.op)], inputs, ast.unparse(node))
+
+        if isinstance(node, ast.BoolOp):
+            op = "and" if isinstance(node.op, ast.And) else "or"
+            slot = self._condition(node.values[0])
+            for value in node.values[1:]:
+                slot = self._combine(op, [slot, self._condition(value)], ast.unparse(node))
+            return slot
+
+        if isinstance(node, ast.Compare):
+            # 연쇄 비교 (a < b < c) 는 쌍별 비교의 and
+            slot = None
+            left = node.left
+            for cmp_op, right in zip(node.ops, node.comparators):
+                if type(cmp_op) not in _COMPARE_OPS:
+                    raise ValueError(f"Unsupported comparison in '{ast.unparse(node)}'")
+                op, swap = _COMPARE_OPS[type(cmp_op)]
+                inputs = [self._compile(left), self._compile(right)]
+                if swap:
+                    inputs.reverse()
+                label = f"{ast.unparse(left)} {_op_text(cmp_op)} {ast.unparse(right)}"
+                pair = self._combine(op, inputs, label)
+                slot = pair if slot is None else self._combine("and", [slot, pair], ast.unparse(node))
+                left = right
+            return slot
+
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and not node.keywords:
+            return self._compile_call(node.func.id, node.args, ast.unparse(node))
+
+        raise ValueError(f"Unsupported expression '{ast.unparse(node)}'")
+
+    def _compile_call(self, name: str, args: list[ast.AST], label: str) -> int:
+        if name in INDICATORS:
+            window = _int_arg(name, args)
+            return self._emit(name, window, (), window + INDICATORS[name][1], label)
+
+        if name in ("cross_above", "cross_below"):
+            if len(args) != 2:
+                raise ValueError(f"{name}() takes two arguments")
+            inputs = [self._compile(args[0]), self._compile(args[1])]
+            return self._combine(name, inputs, label, extra=1)
+
+        if name == "prev":
+            if len(args) not in (1, 2):
+                raise ValueError("prev() takes an expression and an optional bar count")
+            periods = _int_arg(name, args[1:]) if len(args) == 2 else 1
+            inner = self._compile(args[0])
+            history = self.steps[inner].history + periods
+            return self._emit("prev", periods, (inner,), history, label)
+
+        raise ValueError(f"Unknown function '{name}'")
+
+    def run(self, ohlcv_df: pd.DataFrame, current_price: float) -> list[Any]:
+        """Evaluate every step once; returns the value of each slot."""
+        values: list[Any] = []
+        for step in self.steps:
+            args = [values[i] for i in step.inputs]
+            if step.op == "const":
+                value = step.arg
+            elif step.op == "field":
+                value = ohlcv_df[step.arg].to_numpy(dtype=float)
+            elif step.op == "price":
+                value = float(current_price)
+            elif step.op in INDICATORS:
+                series = INDICATORS[step.op][0](ohlcv_df, step.arg).to_numpy(dtype=float)
+                # 가격 필드와 같은 길이로 맞춤 (마지막 봉 기준)
+                value = series[len(series) - len(ohlcv_df):]
+            elif step.op == "div":
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    value = np.divide(args[0], args[1])
+            elif step.op == "neg":
+                value = np.negative(args[0])
+            elif step.op == "not":
+                value = np.logical_not(args[0])
+            elif step.op == "prev":
+                value = _shift(args[0], step.arg)
+            elif step.op == "cross_above":
+                value = (args[0] > args[1]) & (_shift(args[0], 1) <= _shift(args[1], 1))
+            elif step.op == "cross_below":
+                value = (args[0] < args[1]) & (_shift(args[0], 1) >= _shift(args[1], 1))
+            else:
+                value = _NUMPY_OPS[step.op](*args)
+            values.append(value)
+        return values
+
+    def indicator_slots(self) -> list[int]:
+        return [i for i, step in enumerate(self.steps) if step.op in INDICATORS]
+
+
+def _op_text(cmp_op: ast.cmpop) -> str:
+    return {ast.Lt: "<", ast.LtE: "<=", ast.Gt: ">", ast.GtE: ">="}[type(cmp_op)]
+
+
+def _int_arg(name: str, args: list[ast.AST]) -> int:
+    if len(args) != 1 or not isinstance(args[0], ast.Constant) \
+            or not isinstance(args[0].value, int) or isinstance(args[0].value, bool):
+        raise ValueError(f"{name}() takes one integer argument")
+    if not 1 <= args[0].value <= MAX_PERIOD:
+        raise ValueError(f"{name}() period must be between 1 and {MAX_PERIOD}")
+    return args[0].value
+
+
+@lru_cache(maxsize=256)
+def compile_rules(buy_rule: str, sell_rule: str) -> EvaluationPlan:
+    """Compile (and memoize) a rule pair so sessions with the same rules share one plan."""
+    rules = {}
+    if buy_rule:
+        rules["buy"] = buy_rule
+    if sell_rule:
+        rules["sell"] = sell_rule
+    return EvaluationPlan(rules)
+
+
+def _last(value: Any) -> Any:
+    return value[-1] if np.ndim(value) else value
+
+
+class CompositeStrategy(BaseStrategy):
+    name = "composite"
+    description = (
+        "조합 전략 - 지표와 가격으로 쓴 매수/매도 조건식을 평가 "
+        "(예: rsi(14) < 30 and close > sma(20))"
+    )
+
+    def validate_parameters(self) -> None:
+        self.buy_rule = str(self.parameters.get("buy_rule", "") or "").strip()
+        self.sell_rule = str(self.parameters.get("sell_rule", "") or "").strip()
+        if not self.buy_rule and not self.sell_rule:
+            raise ValueError("buy_rule or sell_rule is required")
+        self.plan = compile_rules(self.buy_rule, self.sell_rule)
+
+    def required_history(self) -> int:
+        return self.plan.history
+
+    def evaluate(
+        self,
+        current_price: float,
+        ohlcv_df: pd.DataFrame,
+        holdings: dict | None,
+    ) -> Signal:
+        if len(ohlcv_df) < self.plan.history:
+            self._last_reason = f"Insufficient data: need {self.plan.history} candles"
+            return Signal.HOLD
+
+        values = self.plan.run(ohlcv_df, current_price)
+        details = ", ".join(
+            f"{self.plan.steps[i].label}={_last(values[i]):,.2f}"
+            for i in self.plan.indicator_slots()
+        )
+        suffix = f" ({details})" if details else ""
+
+        for side, signal, rule in (
+            ("buy", Signal.BUY, self.buy_rule),
+            ("sell", Signal.SELL, self.sell_rule),
+        ):
+            slot = self.plan.roots.get(side)
+            if slot is not None and bool(_last(values[slot])):
+                self._last_reason = f"{side.capitalize()} rule matched: {rule}{suffix}"
+                return signal
+
+        self._last_reason = f"No rule matched{suffix}"
+        return Signal.HOLD
+
+    @classmethod
+    def parameter_schema(cls) -> dict:
+        return {
+            "buy_rule": {
+                "type": "string",
+                "default": "rsi(14) < 30 and close > sma(20)",
+                "description": "매수 조건식",
+            },
+            "sell_rule": {
+                "type": "string",
+                "default": "rsi(14) > 70 or cross_below(close, sma(20))",
+                "description": "매도 조건식",
+            },
+        }
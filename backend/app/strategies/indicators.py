@@ -0,0 +1,146 @@
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Hashable, Iterator
+
+import numpy as np
+import pandas as pd
+from ta.momentum import RSIIndicator
+from ta.trend import EMAIndicator, SMAIndicator
+
+
+class IndicatorCache:
+    """LRU memo for indicator series shared by every strategy in the process.
+
+    Entries are keyed by (stock_code, timeframe, indicator, params, last bar),
+    so sessions that look at the same candles in the same cycle compute each
+    indicator once.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def get_or_compute(
+        self,
+        key: Hashable,
+        compute: Callable[[], Any],
+        usable: Callable[[Any], bool] | None = None,
+    ) -> Any:
+        """Return the cached value for ``key``, computing it on a miss.
+
+        A cached value that ``usable`` rejects counts as a miss and is
+        replaced by a fresh ``compute()``.
+        """
+        try:
+            value = self._entries[key]
+            if usable is not None and not usable(value):
+                raise KeyError(key)
+        except KeyError:
+            self.misses += 1
+            value = compute()
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            return value
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return value
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+indicator_cache = IndicatorCache()
+
+# 지표 함수가 쓰는 캐시. 재생처럼 별도 캐시가 필요한 곳은 use_indicator_cache 로 바꿔 끼움
+_active_cache: ContextVar[IndicatorCache] = ContextVar("indicator_cache", default=indicator_cache)
+
+
+@contextmanager
+def use_indicator_cache(cache: IndicatorCache) -> Iterator[IndicatorCache]:
+    """Route indicator lookups made inside the block to ``cache``."""
+    token = _active_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _active_cache.reset(token)
+
+
+def _cache_key(ohlcv_df: pd.DataFrame, indicator: str, params: tuple) -> tuple | None:
+    """Build the cache key, or None when the frame is not tagged with its symbol."""
+    stock_code = ohlcv_df.attrs.get("stock_code")
+    if not stock_code or ohlcv_df.empty:
+        return None
+    last = ohlcv_df.iloc[-1]
+    last_bar = (str(last.get("date", "")), float(last["close"]))
+    return (stock_code, ohlcv_df.attrs.get("timeframe", "D"), indicator, params, last_bar)
+
+
+def _cached(
+    ohlcv_df: pd.DataFrame, indicator: str, params: tuple, compute: Callable[[], pd.Series]
+) -> pd.Series:
+    key = _cache_key(ohlcv_df, indicator, params)
+    if key is None:
+        return compute()
+    return _active_cache.get().get_or_compute(key, compute)
+
+
+def sma(ohlcv_df: pd.DataFrame, window: int) -> pd.Series:
+    """Simple moving average of the close.
+
+    Each value depends only on the last ``window`` candles, so frames of any
+    length that end on the same bar share one series: it is computed on the
+    longest frame seen and every caller gets the tail matching its own frame,
+    with the first ``window - 1`` values left empty as if computed on it.
+    """
+    n = len(ohlcv_df)
+
+    def compute() -> pd.Series:
+        return SMAIndicator(ohlcv_df["close"].astype(float), window=window).sma_indicator()
+
+    key = _cache_key(ohlcv_df, "sma", (window,))
+    if key is None:
+        return compute()
+    series = _active_cache.get().get_or_compute(key, compute, lambda cached: len(cached) >= n)
+    values = series.to_numpy(dtype=float)[len(series) - n :].copy()
+    values[: window - 1] = np.nan
+    return pd.Series(values, index=ohlcv_df.index, name=series.name)
+
+
+def rsi(ohlcv_df: pd.DataFrame, window: int) -> pd.Series:
+    """Wilder RSI of the close.
+
+    The smoothing is seeded from the first candle, so the frame length is
+    part of the key.
+    """
+    return _cached(
+        ohlcv_df,
+        "rsi",
+        (window, len(ohlcv_df)),
+        lambda: RSIIndicator(ohlcv_df["close"].astype(float), window=window).rsi(),
+    )
+
+
+def ema(ohlcv_df: pd.DataFrame, window: int) -> pd.Series:
+    """Exponential moving average of the close, seeded from the first candle."""
+    return _cached(
+        ohlcv_df,
+        "ema",
+        (window, len(ohlcv_df)),
+        lambda: EMAIndicator(ohlcv_df["close"].astype(float), window=window).ema_indicator(),
+    )
@@ -1,4 +1,5 @@
 from app.strategies.base import BaseStrategy
+from app.strategies.composite import CompositeStrategy
 from app.strategies.rsi_strategy import RSIStrategy
 from app.strategies.sma_crossover import SMACrossoverStrategy
 from app.strategies.threshold_strategy import ThresholdStrategy
@@ -7,14 +8,19 @@ _REGISTRY: dict[str, type[BaseStrategy]] = {
     "sma_crossover": SMACrossoverStrategy,
     "rsi": RSIStrategy,
     "threshold": ThresholdStrategy,
+    "composite": CompositeStrategy,
 }
 
 
-def get_strategy(strategy_type: str, parameters: dict) -> BaseStrategy:
+def get_strategy_class(strategy_type: str) -> type[BaseStrategy]:
     cls = _REGISTRY.get(strategy_type)
     if cls is None:
         raise ValueError(f"Unknown strategy type: {strategy_type}")
-    return cls(parameters)
+    return cls
+
+
+def get_strategy(strategy_type: str, parameters: dict) -> BaseStrategy:
+    return get_strategy_class(strategy_type)(parameters)
 
 
 def get_available_strategies() -> list[dict]:
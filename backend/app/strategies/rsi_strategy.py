@@ -1,13 +1,15 @@
+import numpy as np
 import pandas as pd
-from ta.momentum import RSIIndicator
 
 from app.engine.signals import Signal
-from app.strategies.base import BaseStrategy
+from app.strategies import indicators
+from app.strategies.base import BaseStrategy, price_band
 
 
 class RSIStrategy(BaseStrategy):
     name = "rsi"
     description = "RSI 전략 - RSI가 과매도 기준 이하이면 매수, 과매수 기준 이상이면 매도"
+    batchable = True
 
     def validate_parameters(self) -> None:
         self.rsi_period = int(self.parameters.get("rsi_period", 14))
@@ -16,6 +18,9 @@ class RSIStrategy(BaseStrategy):
         if self.oversold >= self.overbought:
             raise ValueError("oversold must be less than overbought")
 
+    def required_history(self) -> int:
+        return self.rsi_period + 1
+
     def evaluate(
         self,
         current_price: float,
@@ -26,24 +31,92 @@ class RSIStrategy(BaseStrategy):
             self._last_reason = f"Insufficient data: need {self.rsi_period + 1} candles"
             return Signal.HOLD
 
-        close = ohlcv_df["close"].astype(float)
-        rsi = RSIIndicator(close, window=self.rsi_period).rsi()
-        current_rsi = rsi.iloc[-1]
+        rsi = indicators.rsi(ohlcv_df, self.rsi_period)
+        signal, self._last_reason = self._classify(rsi.iloc[-1])
+        return signal
+
+    def signal_band(
+        self, current_price: float, ohlcv_df: pd.DataFrame
+    ) -> tuple[float, float] | None:
+        closes = ohlcv_df["close"].to_numpy(dtype=float)
+        if len(closes) < self.rsi_period + 1:
+            return -np.inf, np.inf
+
+        # 직전 봉까지의 Wilder 평균 상승/하락폭 (evaluate_batch 와 같은 점화식)
+        alpha = 1.0 / self.rsi_period
+        diff = np.diff(closes[:-1])
+        gain = loss = 0.0
+        for d in diff:
+            gain = (1 - alpha) * gain + alpha * max(d, 0.0)
+            loss = (1 - alpha) * loss + alpha * max(-d, 0.0)
+        if gain == 0 or loss == 0:
+            return None
+        gain *= 1 - alpha
+        loss *= 1 - alpha
+        prev_close = closes[-2]
+
+        def price_at(level: float) -> float:
+            # RSI는 현재가의 증가함수이므로 기준선과 만나는 가격을 바로 풀 수 있음
+            rs = level / (100 - level)
+            if rs * loss >= gain:
+                return prev_close + (rs * loss - gain) / alpha
+            return prev_close - (gain / rs - loss) / alpha
+
+        return price_band(
+            current_price, [price_at(self.oversold), price_at(self.overbought)], tolerance=1e-9
+        )
 
+    def _classify(self, current_rsi: float) -> tuple[Signal, str]:
         if pd.isna(current_rsi):
-            self._last_reason = "RSI value not available"
-            return Signal.HOLD
+            return Signal.HOLD, "RSI value not available"
 
         if current_rsi <= self.oversold:
-            self._last_reason = f"RSI oversold: {current_rsi:.1f} <= {self.oversold}"
-            return Signal.BUY
+            return Signal.BUY, f"RSI oversold: {current_rsi:.1f} <= {self.oversold}"
 
         if current_rsi >= self.overbought:
-            self._last_reason = f"RSI overbought: {current_rsi:.1f} >= {self.overbought}"
-            return Signal.SELL
+            return Signal.SELL, f"RSI overbought: {current_rsi:.1f} >= {self.overbought}"
+
+        return Signal.HOLD, f"RSI neutral: {current_rsi:.1f}"
+
+    @classmethod
+    def evaluate_batch(
+        cls,
+        closes: np.ndarray,
+        params: list[dict],
+        current_prices: np.ndarray | None = None,
+    ) -> tuple[list[Signal], list[str]]:
+        strategies = [cls(p) for p in params]
+        n_bars = closes.shape[1]
+        periods = np.array([s.rsi_period for s in strategies])
+        last_rsi = np.full(len(strategies), np.nan)
+
+        # Wilder smoothing (ewm, adjust=False) 를 기간별로 모든 행에 대해 한 번에 계산
+        diff = np.diff(closes, axis=1, prepend=np.nan)
+        up = np.where(diff > 0, diff, 0.0)
+        down = np.where(diff < 0, -diff, 0.0)
+        for period in np.unique(periods):
+            rows = np.flatnonzero(periods == period)
+            if n_bars < period + 1:
+                continue
+            alpha = 1.0 / period
+            gain = up[rows, 0]
+            loss = down[rows, 0]
+            for t in range(1, n_bars):
+                gain = (1 - alpha) * gain + alpha * up[rows, t]
+                loss = (1 - alpha) * loss + alpha * down[rows, t]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                last_rsi[rows] = np.where(loss == 0, 100.0, 100 - 100 / (1 + gain / loss))
 
-        self._last_reason = f"RSI neutral: {current_rsi:.1f}"
-        return Signal.HOLD
+        signals, reasons = [], []
+        for strategy, value in zip(strategies, last_rsi):
+            if n_bars < strategy.rsi_period + 1:
+                signals.append(Signal.HOLD)
+                reasons.append(f"Insufficient data: need {strategy.rsi_period + 1} candles")
+                continue
+            signal, reason = strategy._classify(value)
+            signals.append(signal)
+            reasons.append(reason)
+        return signals, reasons
 
     @classmethod
     def parameter_schema(cls) -> dict:
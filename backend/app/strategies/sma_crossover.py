@@ -1,13 +1,15 @@
+import numpy as np
 import pandas as pd
-from ta.trend import SMAIndicator
 
 from app.engine.signals import Signal
-from app.strategies.base import BaseStrategy
+from app.strategies import indicators
+from app.strategies.base import BaseStrategy, price_band
 
 
 class SMACrossoverStrategy(BaseStrategy):
     name = "sma_crossover"
     description = "이동평균 교차 전략 - 단기 MA가 장기 MA를 상향돌파하면 매수, 하향돌파하면 매도"
+    batchable = True
 
     def validate_parameters(self) -> None:
         self.short_period = int(self.parameters.get("short_period", 5))
@@ -15,6 +17,9 @@ class SMACrossoverStrategy(BaseStrategy):
         if self.short_period >= self.long_period:
             raise ValueError("short_period must be less than long_period")
 
+    def required_history(self) -> int:
+        return self.long_period + 1
+
     def evaluate(
         self,
         current_price: float,
@@ -25,40 +30,88 @@ class SMACrossoverStrategy(BaseStrategy):
             self._last_reason = f"Insufficient data: need {self.long_period + 1} candles"
             return Signal.HOLD
 
-        close = ohlcv_df["close"].astype(float)
-        short_ma = SMAIndicator(close, window=self.short_period).sma_indicator()
-        long_ma = SMAIndicator(close, window=self.long_period).sma_indicator()
+        short_ma = indicators.sma(ohlcv_df, self.short_period)
+        long_ma = indicators.sma(ohlcv_df, self.long_period)
+
+        signal, self._last_reason = self._classify(
+            short_ma.iloc[-2], long_ma.iloc[-2], short_ma.iloc[-1], long_ma.iloc[-1]
+        )
+        return signal
 
-        prev_short = short_ma.iloc[-2]
-        prev_long = long_ma.iloc[-2]
-        curr_short = short_ma.iloc[-1]
-        curr_long = long_ma.iloc[-1]
+    def signal_band(
+        self, current_price: float, ohlcv_df: pd.DataFrame
+    ) -> tuple[float, float] | None:
+        closes = ohlcv_df["close"].to_numpy(dtype=float)
+        n = len(closes)
+        if n < self.long_period + 1:
+            return -np.inf, np.inf
+        # 현재 봉 종가 p에 대해 단기-장기 차이는 p의 증가함수이므로 교차 지점은 하나뿐
+        short_rest = closes[n - self.short_period : n - 1].sum() / self.short_period
+        long_rest = closes[n - self.long_period : n - 1].sum() / self.long_period
+        slope = 1 / self.short_period - 1 / self.long_period
+        crossing = (long_rest - short_rest) / slope
+        return price_band(current_price, [crossing], tolerance=1e-9)
 
+    def _classify(
+        self, prev_short: float, prev_long: float, curr_short: float, curr_long: float
+    ) -> tuple[Signal, str]:
         if pd.isna(prev_short) or pd.isna(prev_long):
-            self._last_reason = "MA values not available yet"
-            return Signal.HOLD
+            return Signal.HOLD, "MA values not available yet"
 
         # Golden cross: short crosses above long
         if prev_short <= prev_long and curr_short > curr_long:
-            self._last_reason = (
+            return Signal.BUY, (
                 f"Golden cross: SMA{self.short_period}({curr_short:.0f}) > "
                 f"SMA{self.long_period}({curr_long:.0f})"
             )
-            return Signal.BUY
 
         # Death cross: short crosses below long
         if prev_short >= prev_long and curr_short < curr_long:
-            self._last_reason = (
+            return Signal.SELL, (
                 f"Death cross: SMA{self.short_period}({curr_short:.0f}) < "
                 f"SMA{self.long_period}({curr_long:.0f})"
             )
-            return Signal.SELL
 
-        self._last_reason = (
+        return Signal.HOLD, (
             f"No crossover: SMA{self.short_period}={curr_short:.0f}, "
             f"SMA{self.long_period}={curr_long:.0f}"
         )
-        return Signal.HOLD
+
+    @classmethod
+    def evaluate_batch(
+        cls,
+        closes: np.ndarray,
+        params: list[dict],
+        current_prices: np.ndarray | None = None,
+    ) -> tuple[list[Signal], list[str]]:
+        strategies = [cls(p) for p in params]
+        n_bars = closes.shape[1]
+        windows = np.array([(s.short_period, s.long_period) for s in strategies])
+        # 행별 (이전 단기, 이전 장기, 현재 단기, 현재 장기) 이동평균
+        averages = np.full((len(strategies), 4), np.nan)
+
+        for period in np.unique(windows):
+            if n_bars < period + 1:
+                continue
+            curr = closes[:, n_bars - period :].mean(axis=1)
+            prev = closes[:, n_bars - period - 1 : n_bars - 1].mean(axis=1)
+            is_short = windows[:, 0] == period
+            is_long = windows[:, 1] == period
+            averages[is_short, 0] = prev[is_short]
+            averages[is_short, 2] = curr[is_short]
+            averages[is_long, 1] = prev[is_long]
+            averages[is_long, 3] = curr[is_long]
+
+        signals, reasons = [], []
+        for strategy, row in zip(strategies, averages):
+            if n_bars < strategy.long_period + 1:
+                signals.append(Signal.HOLD)
+                reasons.append(f"Insufficient data: need {strategy.long_period + 1} candles")
+                continue
+            signal, reason = strategy._classify(*row)
+            signals.append(signal)
+            reasons.append(reason)
+        return signals, reasons
 
     @classmethod
     def parameter_schema(cls) -> dict:
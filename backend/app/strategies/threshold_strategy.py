@@ -1,12 +1,14 @@
+import numpy as np
 import pandas as pd
 
 from app.engine.signals import Signal
-from app.strategies.base import BaseStrategy
+from app.strategies.base import BaseStrategy, price_band
 
 
 class ThresholdStrategy(BaseStrategy):
     name = "threshold"
     description = "가격 기준 전략 - 현재가가 매수가 이하이면 매수, 매도가 이상이면 매도"
+    batchable = True
 
     def validate_parameters(self) -> None:
         self.buy_price = float(self.parameters.get("buy_price", 0))
@@ -22,23 +24,41 @@ class ThresholdStrategy(BaseStrategy):
         ohlcv_df: pd.DataFrame,
         holdings: dict | None,
     ) -> Signal:
+        signal, self._last_reason = self._classify(current_price)
+        return signal
+
+    def signal_band(
+        self, current_price: float, ohlcv_df: pd.DataFrame
+    ) -> tuple[float, float] | None:
+        return price_band(current_price, [self.buy_price, self.sell_price])
+
+    def _classify(self, current_price: float) -> tuple[Signal, str]:
         if current_price <= self.buy_price:
-            self._last_reason = (
+            return Signal.BUY, (
                 f"Price {current_price:,.0f} <= buy threshold {self.buy_price:,.0f}"
             )
-            return Signal.BUY
 
         if current_price >= self.sell_price:
-            self._last_reason = (
+            return Signal.SELL, (
                 f"Price {current_price:,.0f} >= sell threshold {self.sell_price:,.0f}"
             )
-            return Signal.SELL
 
-        self._last_reason = (
+        return Signal.HOLD, (
             f"Price {current_price:,.0f} between "
             f"{self.buy_price:,.0f} and {self.sell_price:,.0f}"
         )
-        return Signal.HOLD
+
+    @classmethod
+    def evaluate_batch(
+        cls,
+        closes: np.ndarray,
+        params: list[dict],
+        current_prices: np.ndarray | None = None,
+    ) -> tuple[list[Signal], list[str]]:
+        if current_prices is None:
+            current_prices = closes[:, -1]
+        results = [cls(p)._classify(float(price)) for p, price in zip(params, current_prices)]
+        return [r[0] for r in results], [r[1] for r in results]
 
     @classmethod
     def parameter_schema(cls) -> dict:
@@ -0,0 +1,16 @@
+from app.engine.ledger import ledgers
+from app.engine.manager import trading_manager
+
+
+async def reconcile_active_ledgers():
+    """실행 중인 세션이 있는 계좌의 원장을 KIS 잔고와 맞춥니다."""
+    active = {
+        executor.ledger.account_id
+        for executor in list(trading_manager.sessions.values())
+        if executor.ledger is not None
+    }
+    # 세션이 모두 끝난 계좌의 원장은 버리고 다음 시작 때 새로 만듦
+    for account_id in list(ledgers.accounts()):
+        if account_id not in active:
+            ledgers.discard(account_id)
+    await ledgers.reconcile_all(active)
@@ -0,0 +1,62 @@
+import asyncio
+from datetime import date, datetime, time, timedelta, timezone
+
+from loguru import logger
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.core.database import write_session
+from app.core.log_archive import LogArchive, log_archive
+from app.models.trade_log import TradeLog
+
+
+def _day_bounds(day: date) -> tuple[datetime, datetime]:
+    start = datetime.combine(day, time.min, tzinfo=timezone.utc)
+    return start, start + timedelta(days=1)
+
+
+async def archive_trade_logs(
+    session_factory: async_sessionmaker[AsyncSession] = write_session,
+    archive: LogArchive = log_archive,
+    hot_days: int = settings.LOG_HOT_DAYS,
+    retention_days: int = settings.LOG_ARCHIVE_RETENTION_DAYS,
+    today: date | None = None,
+) -> dict[str, int]:
+    """Move whole UTC days older than ``hot_days`` out of ``trade_logs`` into the archive.
+
+    Each day is written to its partition file before its rows are deleted,
+    so a crash in between only leaves rows that the next run archives again.
+    Partitions older than ``retention_days`` are then removed.
+    """
+    today = today or datetime.now(timezone.utc).date()
+    cutoff, _ = _day_bounds(today - timedelta(days=hot_days))
+    archived = 0
+
+    while True:
+        # 하루 단위로 세션을 열고 닫아 기록기들이 쓰기 연결을 오래 기다리지 않게 함
+        async with session_factory() as db:
+            oldest = await db.scalar(
+                select(func.min(TradeLog.created_at)).where(TradeLog.created_at < cutoff)
+            )
+            if oldest is None:
+                break
+            if oldest.tzinfo is not None:
+                oldest = oldest.astimezone(timezone.utc)
+            day = oldest.date()
+            start, end = _day_bounds(day)
+            in_day = (TradeLog.created_at >= start) & (TradeLog.created_at < end)
+            result = await db.execute(select(TradeLog.__table__).where(in_day).order_by(TradeLog.id))
+            rows = [dict(row._mapping) for row in result]
+            if not rows:
+                logger.warning(f"Trade logs before {cutoff} fall outside day {day}; stopping")
+                break
+            await asyncio.to_thread(archive.write_day, day, rows)
+            await db.execute(delete(TradeLog).where(in_day))
+            await db.commit()
+            archived += len(rows)
+
+    pruned = archive.prune(today - timedelta(days=retention_days)) if retention_days > 0 else []
+    if archived or pruned:
+        logger.info(f"Archived {archived} trade logs, pruned {len(pruned)} archive days")
+    return {"archived": archived, "pruned": len(pruned)}
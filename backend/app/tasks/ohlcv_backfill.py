@@ -0,0 +1,27 @@
+from datetime import datetime, timedelta
+
+from loguru import logger
+
+from app.engine.manager import trading_manager
+from app.market.store import KST
+from app.services.market_service import backfill_ohlcv
+
+# 장 마감 후 실행 시 확인할 과거 구간 (일)
+BACKFILL_LOOKBACK_DAYS = 30
+
+
+async def backfill_active_symbols():
+    """장 마감 후 실행 중인 세션 종목의 일봉 누락 구간을 채웁니다."""
+    today = datetime.now(KST).date()
+    start = today - timedelta(days=BACKFILL_LOOKBACK_DAYS)
+    seen: set[str] = set()
+    for executor in list(trading_manager.sessions.values()):
+        if executor.stock_code in seen:
+            continue
+        seen.add(executor.stock_code)
+        try:
+            await backfill_ohlcv(executor.broker, executor.stock_code, start, today)
+        except Exception as e:
+            logger.bind(category="market").warning(
+                f"OHLCV backfill failed for {executor.stock_code}: {e}"
+            )
@@ -0,0 +1,94 @@
+"""Rebuild the ``daily_pnl`` rollup from the stored trades.
+
+    python -m app.tasks.pnl_backfill              # every user
+    python -m app.tasks.pnl_backfill --user-id 3  # one user
+
+The trade writer keeps the rollup current; this job fills it for trades
+recorded before the rollup existed, or repairs it after manual edits.
+Run it while no session is trading.
+"""
+
+import argparse
+import asyncio
+from datetime import date
+
+from loguru import logger
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.database import write_session
+from app.engine.trade_writer import Position, apply_fill
+from app.models.daily_pnl import DailyPnl
+from app.models.trade import Trade
+from app.models.trade_session import TradeSession
+from app.services.pnl_service import DayTotals, add_daily_pnl, trade_day
+
+
+async def rebuild_daily_pnl(
+    session_factory: async_sessionmaker[AsyncSession] = write_session,
+    user_id: int | None = None,
+) -> int:
+    """Recompute the rollup rows from filled trades; return how many rows were written."""
+    query = (
+        select(
+            Trade.session_id,
+            Trade.user_id,
+            Trade.side,
+            Trade.quantity,
+            Trade.price,
+            Trade.filled_price,
+            Trade.filled_quantity,
+            Trade.created_at,
+            TradeSession.account_id,
+        )
+        .join(TradeSession, Trade.session_id == TradeSession.id)
+        .where(Trade.status == "filled")
+        .order_by(Trade.session_id, Trade.id)
+    )
+    clear = delete(DailyPnl)
+    if user_id is not None:
+        query = query.where(Trade.user_id == user_id)
+        clear = clear.where(DailyPnl.user_id == user_id)
+
+    positions: dict[int, Position] = {}
+    days: dict[tuple[int, date], DayTotals] = {}
+    async with session_factory() as db:
+        await db.execute(clear)
+        async for row in await db.stream(query):
+            sid = row.session_id
+            price = row.filled_price or row.price
+            quantity = row.filled_quantity or row.quantity
+            positions[sid], pnl = apply_fill(positions.get(sid, (0, 0.0)), row.side, quantity, price)
+            key = (sid, trade_day(row.created_at))
+            if key not in days:
+                days[key] = DayTotals(row.user_id, row.account_id, sid, key[1])
+            days[key].add(row.side, quantity, price, pnl)
+        await add_daily_pnl(db, list(days.values()))
+        await db.commit()
+    return len(days)
+
+
+async def backfill_daily_pnl_if_empty(
+    session_factory: async_sessionmaker[AsyncSession] = write_session,
+) -> None:
+    """Build the rollup once for databases that have trades but no rollup rows yet."""
+    async with session_factory() as db:
+        has_rollup = await db.scalar(select(DailyPnl.id).limit(1))
+        has_fills = await db.scalar(
+            select(Trade.id).where(Trade.status == "filled", Trade.session_id.is_not(None)).limit(1)
+        )
+    if has_rollup is None and has_fills is not None:
+        rows = await rebuild_daily_pnl(session_factory)
+        logger.info(f"Backfilled {rows} daily PnL rows")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.tasks.pnl_backfill")
+    parser.add_argument("--user-id", type=int, default=None)
+    args = parser.parse_args(argv)
+    rows = asyncio.run(rebuild_daily_pnl(user_id=args.user_id))
+    logger.info(f"Wrote {rows} daily PnL rows")
+
+
+if __name__ == "__main__":
+    main()
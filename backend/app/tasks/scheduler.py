@@ -6,6 +6,41 @@ scheduler = AsyncIOScheduler()
 
 def start_scheduler():
     if not scheduler.running:
+        from app.market.store import KST
+        from app.config import settings
+        from app.tasks.ledger_reconcile import reconcile_active_ledgers
+        from app.tasks.log_retention import archive_trade_logs
+        from app.tasks.ohlcv_backfill import backfill_active_symbols
+
+        scheduler.add_job(
+            backfill_active_symbols,
+            "cron",
+            day_of_week="mon-fri",
+            hour=16,
+            minute=0,
+            timezone=KST,
+            id="ohlcv_backfill",
+            replace_existing=True,
+        )
+        scheduler.add_job(
+            reconcile_active_ledgers,
+            "cron",
+            day_of_week="mon-fri",
+            hour="9-15",
+            minute=f"*/{settings.LEDGER_RECONCILE_MINUTES}",
+            timezone=KST,
+            id="ledger_reconcile",
+            replace_existing=True,
+        )
+        scheduler.add_job(
+            archive_trade_logs,
+            "cron",
+            hour=3,
+            minute=0,
+            timezone=KST,
+            id="trade_log_archive",
+            replace_existing=True,
+        )
         scheduler.start()
         logger.info("APScheduler started")
 
@@ -0,0 +1,99 @@
+"""Run the benchmark suite.
+
+    python -m benchmarks                          # run everything, print a table
+    python -m benchmarks -k strategy --rounds 5   # only matching cases
+    python -m benchmarks -o baseline.json         # save machine-readable results
+    python -m benchmarks --compare baseline.json  # fail on regressions
+
+The suite runs offline: the database and candle store live in a temporary
+directory and the broker is simulated.
+"""
+
+import argparse
+import importlib
+import os
+import sys
+import tempfile
+
+SUITES = ["bench_strategies", "bench_engine", "bench_api", "bench_db"]
+
+
+def _isolate_environment() -> None:
+    # app 모듈을 import하기 전에 DB/데이터 경로를 임시 디렉터리로 돌림
+    workdir = tempfile.mkdtemp(prefix="richer-bench-")
+    os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{workdir}/bench.db"
+    os.environ["DATA_DIR"] = os.path.join(workdir, "data")
+    os.environ["LOG_DIR"] = os.path.join(workdir, "logs")
+    os.environ["SQL_ECHO"] = "false"
+
+
+def _format_seconds(value: float | None) -> str:
+    if value is None:
+        return "-"
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if value >= scale:
+            return f"{value / scale:.2f}{unit}"
+    return f"{value / 1e-9:.0f}ns"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("-k", "--filter", help="only run cases whose key contains this text")
+    parser.add_argument("--rounds", type=int, help="override the number of timed rounds")
+    parser.add_argument("-o", "--output", help="write results as JSON to this path")
+    parser.add_argument("--compare", metavar="BASELINE", help="compare against a saved JSON report")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=None,
+        help="allowed slowdown before a case counts as a regression (default 0.15)",
+    )
+    args = parser.parse_args(argv)
+
+    _isolate_environment()
+
+    from loguru import logger
+
+    from benchmarks import harness
+
+    logger.remove()
+    for suite in SUITES:
+        importlib.import_module(f"benchmarks.{suite}")
+
+    cases = [c for c in harness.registered_cases() if not args.filter or args.filter in c.key]
+    if not cases:
+        print("No benchmark matches the filter", file=sys.stderr)
+        return 2
+
+    def show(result: harness.BenchResult) -> None:
+        print(
+            f"{result.key:<60} median {_format_seconds(result.median):>9}  "
+            f"min {_format_seconds(result.min):>9}  ±{_format_seconds(result.stdev):>9}"
+        )
+
+    results = harness.run(cases, args.rounds, on_result=show)
+    report = harness.build_report(results)
+    if args.output:
+        harness.save_report(report, args.output)
+
+    if not args.compare:
+        return 0
+
+    tolerance = args.tolerance if args.tolerance is not None else harness.DEFAULT_TOLERANCE
+    baseline = harness.load_report(args.compare)
+    if args.filter:
+        baseline["results"] = [r for r in baseline["results"] if args.filter in r["key"]]
+    comparisons = harness.compare(baseline, report, tolerance)
+    print(f"\nCompared with {args.compare} (tolerance {tolerance:.0%})")
+    for c in comparisons:
+        change = f"{c.change:+.1%}" if c.change is not None else ""
+        print(
+            f"{c.status:<12} {c.key:<60} "
+            f"{_format_seconds(c.baseline):>9} -> {_format_seconds(c.current):>9} {change}"
+        )
+    regressions = [c for c in comparisons if c.status == "regression"]
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+from httpx import ASGITransport, AsyncClient
+
+from app.core.database import Base, async_session, engine
+from app.main import app
+from app.models.account import KISAccount
+from app.models.strategy import Strategy
+from app.models.trade import Trade
+from app.models.trade_log import TradeLog
+from app.models.trade_session import TradeSession
+from benchmarks.harness import benchmark
+
+SESSIONS = 50
+TRADES_PER_SESSION = 20
+LOGS = 10_000
+
+_client: AsyncClient | None = None
+
+
+async def _seeded_client() -> AsyncClient:
+    """Fresh schema with one user, ``SESSIONS`` sessions, their trades and ``LOGS`` logs."""
+    global _client
+    if _client is not None:
+        return _client
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    client = AsyncClient(transport=ASGITransport(app=app), base_url="http://bench")
+    res = await client.post(
+        "/api/v1/auth/register",
+        json={"username": "bench", "password": "benchpass123"},
+    )
+    token = res.json()["access_token"]
+    client.headers["Authorization"] = f"Bearer {token}"
+    user_id = (await client.get("/api/v1/auth/me")).json()["id"]
+
+    async with async_session() as db:
+        account = KISAccount(
+            user_id=user_id, label="bench", app_key="-", app_secret="-", account_no="00000000"
+        )
+        strategy = Strategy(
+            user_id=user_id,
+            name="bench",
+            strategy_type="sma_crossover",
+            parameters={"short_period": 5, "long_period": 20},
+        )
+        db.add_all([account, strategy])
+        await db.flush()
+
+        for i in range(SESSIONS):
+            session = TradeSession(
+                user_id=user_id,
+                account_id=account.id,
+                strategy_id=strategy.id,
+                stock_code=f"{i:06d}",
+                status="stopped",
+            )
+            db.add(session)
+            await db.flush()
+            db.add_all(
+                Trade(
+                    session_id=session.id,
+                    user_id=user_id,
+                    stock_code=session.stock_code,
+                    side="BUY" if j % 2 == 0 else "SELL",
+                    quantity=1,
+                    price=70000.0,
+                    status="filled",
+                )
+                for j in range(TRADES_PER_SESSION)
+            )
+        db.add_all(
+            TradeLog(
+                user_id=user_id,
+                level="INFO",
+                category=("engine", "strategy", "order")[i % 3],
+                message=f"bench log {i}",
+            )
+            for i in range(LOGS)
+        )
+        await db.commit()
+
+    _client = client
+    return client
+
+
+def _get(path: str, **params):
+    async def setup():
+        client = await _seeded_client()
+
+        async def op():
+            res = await client.get(path, params=params)
+            res.raise_for_status()
+
+        return op
+
+    return setup()
+
+
+@benchmark("api.trading_sessions")
+def api_trading_sessions():
+    return _get("/api/v1/trading/sessions")
+
+
+@benchmark(
+    "api.logs",
+    params=[{"page": 1}, {"page": 100}, {"page": 1, "category": "order"}],
+)
+def api_logs(page: int, category: str | None = None):
+    params = {"page": page, "size": 50}
+    if category:
+        params["category"] = category
+    return _get("/api/v1/logs", **params)
+
+
+@benchmark("api.trades", params=[{"page": 1}, {"page": 40}])
+def api_trades(page: int):
+    return _get("/api/v1/trades", page=page, size=20)
+
+
+@benchmark(
+    "api.logs_export",
+    params=[{"format": "csv"}, {"format": "ndjson"}, {"format": "csv", "gzip": True}],
+    rounds=5,
+)
+def api_logs_export(format: str, gzip: bool = False):
+    return _get("/api/v1/logs/export", format=format, gzip=gzip)
@@ -0,0 +1,87 @@
+import asyncio
+import os
+import shutil
+import tempfile
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.database import Base, configure_sqlite
+from app.models.trade_log import TradeLog
+from benchmarks.harness import benchmark
+
+ROWS = 20_000
+WRITERS = 8
+READERS = 8
+
+
+@asynccontextmanager
+async def _engines(profile: str):
+    """Read and write session factories over a fresh, seeded SQLite file.
+
+    The engines are disposed and the file removed on exit.
+    """
+    workdir = tempfile.mkdtemp(prefix="richer-bench-db-")
+    path = os.path.join(workdir, "db.sqlite")
+    url = f"sqlite+aiosqlite:///{path}"
+    read_engine = create_async_engine(url)
+    if profile == "tuned":
+        configure_sqlite(read_engine)
+        # 쓰기는 연결 하나로 직렬화
+        write_engine = create_async_engine(url, pool_size=1, max_overflow=0)
+        configure_sqlite(write_engine)
+    else:
+        write_engine = read_engine
+
+    try:
+        async with read_engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            now = datetime.now(timezone.utc)
+            await conn.execute(
+                insert(TradeLog),
+                [
+                    {
+                        "user_id": 1,
+                        "level": "INFO",
+                        "category": "engine",
+                        "message": f"seed {i}",
+                        "created_at": now,
+                    }
+                    for i in range(ROWS)
+                ],
+            )
+        yield (
+            async_sessionmaker(read_engine, class_=AsyncSession),
+            async_sessionmaker(write_engine, class_=AsyncSession),
+        )
+    finally:
+        await write_engine.dispose()
+        await read_engine.dispose()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+@benchmark("db.mixed_write_latency", params=[{"profile": "default"}, {"profile": "tuned"}], rounds=5)
+async def db_mixed_write_latency(profile: str):
+    """One burst of concurrent single-row commits while readers page through logs."""
+    async with _engines(profile) as (read_session, write_session):
+
+        async def write():
+            async with write_session() as db:
+                db.add(TradeLog(user_id=1, level="INFO", category="order", message="bench"))
+                await db.commit()
+
+        async def read():
+            async with read_session() as db:
+                await db.execute(
+                    select(TradeLog)
+                    .where(TradeLog.user_id == 1)
+                    .order_by(TradeLog.created_at.desc(), TradeLog.id.desc())
+                    .limit(50)
+                )
+
+        async def op():
+            await asyncio.gather(*(write() for _ in range(WRITERS)), *(read() for _ in range(READERS)))
+
+        yield op
@@ -0,0 +1,121 @@
+import asyncio
+import shutil
+import tempfile
+
+from app.broker.rate_limiter import TokenBucketRateLimiter
+from app.engine.executor import StrategyExecutor
+from app.engine.triggers import TriggerIndex
+from app.market.recorder import TickRecorder
+from app.strategies.registry import get_strategy
+from app.ws.manager import ConnectionManager
+from benchmarks.harness import benchmark
+from benchmarks.sim_broker import SimulatedBroker
+
+# 대기 없이 락/스케줄링 비용만 보이도록 충분히 큰 충전 속도
+_UNTHROTTLED_RATE = 1_000_000.0
+
+
+@benchmark(
+    "rate_limiter.acquire",
+    params=[{"tasks": 1}, {"tasks": 10}, {"tasks": 100}],
+)
+def rate_limiter_acquire(tasks: int, per_task: int = 20):
+    """``tasks`` coroutines each acquiring ``per_task`` tokens from one bucket."""
+    limiter = TokenBucketRateLimiter(max_tokens=15, refill_rate=_UNTHROTTLED_RATE)
+
+    async def worker():
+        for _ in range(per_task):
+            await limiter.acquire()
+
+    async def op():
+        await asyncio.gather(*(worker() for _ in range(tasks)))
+
+    return op
+
+
+@benchmark(
+    "executor.execute_cycle",
+    params=[{"sessions": 1}, {"sessions": 20}],
+)
+async def executor_cycle(sessions: int):
+    """One evaluation cycle of ``sessions`` concurrent SMA sessions on a simulated broker."""
+    broker = SimulatedBroker(seed=sessions)
+    executors = [
+        StrategyExecutor(
+            session_id=i,
+            user_id=1,
+            broker=broker,
+            strategy=get_strategy("sma_crossover", {"short_period": 5, "long_period": 20}),
+            stock_code=f"{i % 5:06d}",
+        )
+        for i in range(sessions)
+    ]
+    # 첫 사이클에서 일봉 이력을 로컬 저장소에 채워 이후 측정은 정상 상태로 진행
+    await asyncio.gather(*(e._execute_cycle() for e in executors))
+
+    async def op():
+        await asyncio.gather(*(e._execute_cycle() for e in executors))
+
+    return op
+
+
+@benchmark(
+    "triggers.on_tick",
+    params=[{"sessions": 100}, {"sessions": 10_000}],
+)
+def triggers_on_tick(sessions: int):
+    """A quote that breaks 2% of ``sessions`` hold bands on one symbol."""
+    index = TriggerIndex()
+    bands = [(100 - 1 - i % 50, 100 + 1 + i % 50) for i in range(sessions)]
+    for key, band in enumerate(bands):
+        index.set_band("005930", key, *band)
+
+    def op():
+        for key in index.on_tick("005930", 101.5):
+            index.set_band("005930", key, *bands[key])
+
+    return op
+
+
+@benchmark("recorder.record_quote")
+def recorder_record_quote():
+    """Appending one quote to the memory-mapped tick log (the hot-path cost of recording)."""
+    workdir = tempfile.mkdtemp(prefix="richer-ticks-")
+    recorder = TickRecorder(workdir)
+    quote = {"stock_code": "005930", "current_price": 70000, "high": 71000, "low": 69000, "volume": 1}
+
+    def op():
+        recorder.record_quote(quote)
+
+    try:
+        yield op
+    finally:
+        recorder.close()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+class _FakeWebSocket:
+    def __init__(self):
+        self.sent = 0
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_text(self, text: str) -> None:
+        self.sent += 1
+
+
+@benchmark(
+    "ws.send_to_user",
+    params=[{"connections": 1}, {"connections": 10}, {"connections": 100}],
+)
+async def ws_send_to_user(connections: int):
+    manager = ConnectionManager()
+    for _ in range(connections):
+        await manager.connect(_FakeWebSocket(), user_id=1)
+    payload = {"session_id": 1, "stock_code": "005930", "status": "running", "message": "ok"}
+
+    async def op():
+        await manager.send_to_user(1, "session.status", "trading", payload)
+
+    return op
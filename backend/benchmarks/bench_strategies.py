@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+
+from app.strategies.registry import get_available_strategies, get_strategy
+from benchmarks.harness import benchmark
+
+HISTORY_LENGTHS = [60, 250, 1000]
+
+# parameter_schema 기본값이 없는 전략용 파라미터
+_PARAMS = {
+    "threshold": {"buy_price": 69000, "sell_price": 71000},
+}
+
+
+def random_walk(n: int, seed: int = 0, start: float = 70000.0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = start * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    return pd.DataFrame(
+        {
+            "date": pd.bdate_range(end="2026-01-02", periods=n).strftime("%Y%m%d"),
+            "open": close,
+            "high": close * 1.01,
+            "low": close * 0.99,
+            "close": close,
+            "volume": np.full(n, 1_000_000),
+        }
+    )
+
+
+def default_parameters(strategy_type: str) -> dict:
+    if strategy_type in _PARAMS:
+        return dict(_PARAMS[strategy_type])
+    info = {s["type_name"]: s for s in get_available_strategies()}[strategy_type]
+    return {
+        name: spec["default"]
+        for name, spec in info["parameter_schema"].items()
+        if "default" in spec
+    }
+
+
+@benchmark(
+    "strategy.evaluate",
+    params=[
+        {"strategy": s["type_name"], "bars": n}
+        for s in get_available_strategies()
+        for n in HISTORY_LENGTHS
+    ],
+)
+def strategy_evaluate(strategy: str, bars: int):
+    instance = get_strategy(strategy, default_parameters(strategy))
+    # 지표 캐시를 거치지 않도록 종목 태그 없는 프레임으로 순수 계산 비용을 측정
+    frame = random_walk(bars)
+    price = float(frame["close"].iloc[-1])
+    return lambda: instance.evaluate(price, frame, None)
@@ -0,0 +1,244 @@
+import asyncio
+import inspect
+import json
+import platform
+import statistics
+import subprocess
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+# 라운드 하나가 이 시간보다 짧으면 반복 횟수를 늘려 타이머 오차를 줄임
+MIN_ROUND_SECONDS = 0.02
+DEFAULT_ROUNDS = 15
+DEFAULT_TOLERANCE = 0.15
+
+Setup = Callable[..., Any]
+
+
+@dataclass
+class Case:
+    name: str
+    setup: Setup
+    params: dict = field(default_factory=dict)
+    rounds: int = DEFAULT_ROUNDS
+
+    @property
+    def key(self) -> str:
+        if not self.params:
+            return self.name
+        args = ",".join(f"{k}={v}" for k, v in self.params.items())
+        return f"{self.name}[{args}]"
+
+
+@dataclass
+class BenchResult:
+    key: str
+    name: str
+    params: dict
+    rounds: int
+    number: int
+    # 모두 1회 실행당 초
+    min: float
+    median: float
+    mean: float
+    stdev: float
+
+    @property
+    def ops_per_sec(self) -> float:
+        return 1.0 / self.median if self.median > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        return {**asdict(self), "ops_per_sec": self.ops_per_sec}
+
+
+_CASES: list[Case] = []
+
+
+def benchmark(name: str, params: list[dict] | None = None, rounds: int = DEFAULT_ROUNDS):
+    """Register a benchmark.
+
+    The decorated function is the setup: it receives one parameter set as
+    keyword arguments and returns the operation to time, either a plain
+    callable or a coroutine function. Setups may themselves be async. A
+    setup that needs teardown can instead ``yield`` the operation, like a
+    pytest fixture; the code after the ``yield`` runs once timing is done.
+    """
+
+    def decorator(setup: Setup) -> Setup:
+        for p in params or [{}]:
+            _CASES.append(Case(name=name, setup=setup, params=p, rounds=rounds))
+        return setup
+
+    return decorator
+
+
+def registered_cases() -> list[Case]:
+    return list(_CASES)
+
+
+async def _time_once(op: Callable, number: int, is_async: bool) -> float:
+    start = time.perf_counter()
+    if is_async:
+        for _ in range(number):
+            await op()
+    else:
+        for _ in range(number):
+            op()
+    return time.perf_counter() - start
+
+
+async def _start(setup: Any) -> tuple[Callable, Callable[[], Awaitable[None]]]:
+    """Resolve a setup's return value into the operation and its teardown."""
+
+    async def nothing() -> None:
+        return None
+
+    if inspect.isasyncgen(setup):
+        op = await anext(setup)
+        return op, lambda: anext(setup, None)
+    if inspect.isgenerator(setup):
+        op = next(setup)
+
+        async def finish() -> None:
+            next(setup, None)
+
+        return op, finish
+    if inspect.isawaitable(setup):
+        setup = await setup
+    return setup, nothing
+
+
+async def run_case(case: Case, rounds: int | None = None) -> BenchResult:
+    op, teardown = await _start(case.setup(**case.params))
+    try:
+        return await _measure(case, op, rounds)
+    finally:
+        await teardown()
+
+
+async def _measure(case: Case, op: Callable, rounds: int | None) -> BenchResult:
+    is_async = inspect.iscoroutinefunction(op)
+
+    # 워밍업 겸 반복 횟수 보정
+    number = 1
+    while True:
+        elapsed = await _time_once(op, number, is_async)
+        if elapsed >= MIN_ROUND_SECONDS or number >= 1_000_000:
+            break
+        number *= 10 if elapsed < MIN_ROUND_SECONDS / 10 else 2
+
+    samples = [
+        await _time_once(op, number, is_async) / number
+        for _ in range(rounds or case.rounds)
+    ]
+    return BenchResult(
+        key=case.key,
+        name=case.name,
+        params=case.params,
+        rounds=len(samples),
+        number=number,
+        min=min(samples),
+        median=statistics.median(samples),
+        mean=statistics.fmean(samples),
+        stdev=statistics.stdev(samples) if len(samples) > 1 else 0.0,
+    )
+
+
+async def run_cases(
+    cases: list[Case],
+    rounds: int | None = None,
+    on_result: Callable[[BenchResult], None] | None = None,
+) -> list[BenchResult]:
+    results = []
+    for case in cases:
+        result = await run_case(case, rounds)
+        results.append(result)
+        if on_result:
+            on_result(result)
+    return results
+
+
+def _git_revision() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return out.stdout.strip() or None
+
+
+def build_report(results: list[BenchResult]) -> dict:
+    return {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "git_revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": [r.to_dict() for r in results],
+    }
+
+
+def save_report(report: dict, path: str | Path) -> None:
+    Path(path).write_text(json.dumps(report, indent=2, ensure_ascii=False))
+
+
+def load_report(path: str | Path) -> dict:
+    return json.loads(Path(path).read_text())
+
+
+@dataclass
+class Comparison:
+    key: str
+    status: str  # ok, regression, improvement, new, missing
+    baseline: float | None
+    current: float | None
+
+    @property
+    def change(self) -> float | None:
+        if not self.baseline or self.current is None:
+            return None
+        return self.current / self.baseline - 1.0
+
+
+def compare(
+    baseline: dict, current: dict, tolerance: float = DEFAULT_TOLERANCE
+) -> list[Comparison]:
+    """Compare median timings of two reports.
+
+    A case regresses when its median is more than ``tolerance`` slower than
+    the baseline median.
+    """
+    before = {r["key"]: r["median"] for r in baseline["results"]}
+    after = {r["key"]: r["median"] for r in current["results"]}
+    comparisons = []
+    for key, value in after.items():
+        old = before.get(key)
+        if old is None:
+            status = "new"
+        elif value > old * (1 + tolerance):
+            status = "regression"
+        elif value < old * (1 - tolerance):
+            status = "improvement"
+        else:
+            status = "ok"
+        comparisons.append(Comparison(key, status, old, value))
+    for key, old in before.items():
+        if key not in after:
+            comparisons.append(Comparison(key, "missing", old, None))
+    return comparisons
+
+
+def run(
+    cases: list[Case],
+    rounds: int | None = None,
+    on_result: Callable[[BenchResult], None] | None = None,
+) -> list[BenchResult]:
+    return asyncio.run(run_cases(cases, rounds, on_result))
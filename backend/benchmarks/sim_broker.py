@@ -0,0 +1,107 @@
+import asyncio
+import random
+from datetime import date, timedelta
+from typing import Any
+
+from app.broker.adapter import BrokerAdapter
+
+
+class SimulatedBroker(BrokerAdapter):
+    """Offline broker producing a deterministic random-walk market.
+
+    ``latency`` adds an artificial round-trip delay to every call so
+    benchmarks can model network-bound paths without a real KIS account.
+    """
+
+    def __init__(self, seed: int = 0, latency: float = 0.0, base_price: float = 70000.0):
+        self.latency = latency
+        self.base_price = base_price
+        self._rng = random.Random(seed)
+        self._prices: dict[str, float] = {}
+        self.orders: list[dict[str, Any]] = []
+
+    async def _delay(self) -> None:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+    def _tick(self, stock_code: str) -> float:
+        price = self._prices.get(stock_code, self.base_price)
+        price = max(100.0, round(price * (1 + self._rng.gauss(0, 0.002))))
+        self._prices[stock_code] = price
+        return price
+
+    async def connect(self) -> bool:
+        await self._delay()
+        return True
+
+    async def get_balance(self) -> dict[str, Any]:
+        await self._delay()
+        return {"dnca_tot_amt": "100000000", "tot_evlu_amt": "100000000"}
+
+    async def get_holdings(self) -> list[dict[str, Any]]:
+        await self._delay()
+        return []
+
+    async def get_current_price(self, stock_code: str) -> dict[str, Any]:
+        await self._delay()
+        price = self._tick(stock_code)
+        return {
+            "stock_code": stock_code,
+            "stock_name": stock_code,
+            "current_price": price,
+            "change": 0.0,
+            "change_rate": 0.0,
+            "volume": 1_000_000,
+            "high": price,
+            "low": price,
+            "open_price": price,
+        }
+
+    async def get_ohlcv(
+        self, stock_code: str, period: str = "D", count: int = 60
+    ) -> list[dict[str, Any]]:
+        await self._delay()
+        rng = random.Random(stock_code)
+        day = date.today()
+        price = self.base_price
+        records = []
+        while len(records) < count:
+            day -= timedelta(days=1)
+            if day.weekday() >= 5:
+                continue
+            price = max(100.0, round(price * (1 + rng.gauss(0, 0.015))))
+            records.append(
+                {
+                    "date": day.strftime("%Y%m%d"),
+                    "open": price,
+                    "high": price * 1.01,
+                    "low": price * 0.99,
+                    "close": price,
+                    "volume": 1_000_000,
+                }
+            )
+        return records
+
+    async def _order(self, side: str, stock_code: str, quantity: int, price: int | None):
+        await self._delay()
+        order = {
+            "order_no": f"SIM{len(self.orders) + 1:08d}",
+            "side": side,
+            "stock_code": stock_code,
+            "filled_price": price or self._prices.get(stock_code, self.base_price),
+            "filled_quantity": quantity,
+        }
+        self.orders.append(order)
+        return order
+
+    async def buy_market(self, stock_code: str, quantity: int) -> dict[str, Any]:
+        return await self._order("BUY", stock_code, quantity, None)
+
+    async def sell_market(self, stock_code: str, quantity: int) -> dict[str, Any]:
+        return await self._order("SELL", stock_code, quantity, None)
+
+    async def buy_limit(self, stock_code: str, quantity: int, price: int) -> dict[str, Any]:
+        return await self._order("BUY", stock_code, quantity, price)
+
+    async def sell_limit(self, stock_code: str, quantity: int, price: int) -> dict[str, Any]:
+        return await self._order("SELL", stock_code, quantity, price)
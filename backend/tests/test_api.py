@@ -1,8 +1,35 @@
+import asyncio
+import csv
+import gzip
+import io
+import json
+from datetime import date, datetime, timedelta, timezone
+
 import pytest
 from httpx import ASGITransport, AsyncClient
 
-from app.core.database import Base, engine
+from loguru import logger
+from sqlalchemy import delete, event, func, select
+
+from app.api.deps import principal_cache
+from app.api.v1 import logs as logs_api
+from app.api.v1 import trading as trading_api
+from app.core.database import Base, async_session, engine, write_engine
+from app.core.log_archive import LogArchive
+from app.core.log_sink import DatabaseLogSink
+from app.engine import trade_writer as trade_writer_module
+from app.engine.trade_writer import TradeWriter
 from app.main import app
+from app.services.dashboard_service import summary_cache
+from app.tasks.log_retention import archive_trade_logs
+from app.tasks.pnl_backfill import rebuild_daily_pnl
+from app.models.account import KISAccount
+from app.models.daily_pnl import DailyPnl
+from app.models.trade import Trade
+from app.models.trade_log import TradeLog
+from app.models.trade_session import TradeSession
+from app.models.user import User
+from app.schemas.dashboard import DashboardSummary
 
 
 @pytest.fixture(autouse=True)
@@ -10,6 +37,8 @@ async def setup_db():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     yield
+    principal_cache.clear()
+    summary_cache.clear()
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
 
@@ -33,6 +62,18 @@ async def auth_client(client: AsyncClient):
     return client
 
 
+class TestSqliteProfile:
+    async def test_pragmas_applied(self):
+        async with engine.connect() as conn:
+            assert (await conn.exec_driver_sql("PRAGMA journal_mode")).scalar() == "wal"
+            assert (await conn.exec_driver_sql("PRAGMA synchronous")).scalar() == 1  # NORMAL
+            assert (await conn.exec_driver_sql("PRAGMA busy_timeout")).scalar() == 5000
+
+    async def test_background_writes_share_one_connection(self):
+        assert write_engine is not engine
+        assert write_engine.pool.size() == 1
+
+
 class TestAuthAPI:
     async def test_register(self, client: AsyncClient):
         res = await client.post(
@@ -83,6 +124,25 @@ class TestAuthAPI:
         assert res.status_code == 200
         assert res.json()["username"] == "testuser"
 
+    async def test_deleted_user_rejected_after_cache_entry_goes(self, auth_client: AsyncClient):
+        me = (await auth_client.get("/api/v1/auth/me")).json()
+        async with async_session() as db:
+            await db.execute(delete(User).where(User.id == me["id"]))
+            await db.commit()
+
+        # 존재 확인은 TTL 동안 재사용
+        assert (await auth_client.get("/api/v1/auth/me")).status_code == 200
+        principal_cache.invalidate(me["id"])
+        res = await auth_client.get("/api/v1/auth/me")
+        assert res.status_code == 401
+
+    async def test_user_relationships_are_not_loaded_implicitly(self, auth_client: AsyncClient):
+        me = (await auth_client.get("/api/v1/auth/me")).json()
+        async with async_session() as db:
+            user = await db.get(User, me["id"])
+            with pytest.raises(Exception, match="raise"):
+                user.trades
+
     async def test_refresh_token(self, client: AsyncClient):
         reg_res = await client.post(
             "/api/v1/auth/register",
@@ -116,6 +176,17 @@ class TestStrategiesAPI:
         assert res.status_code == 201
         assert res.json()["name"] == "Test Threshold"
 
+    async def test_create_strategy_invalid_parameters(self, auth_client: AsyncClient):
+        res = await auth_client.post(
+            "/api/v1/strategies",
+            json={
+                "name": "Bad Composite",
+                "strategy_type": "composite",
+                "parameters": {"buy_rule": "close > unknown(3)"},
+            },
+        )
+        assert res.status_code == 400
+
     async def test_list_strategies(self, auth_client: AsyncClient):
         await auth_client.post(
             "/api/v1/strategies",
@@ -160,7 +231,463 @@ class TestDashboardAPI:
         assert "total_balance" in data
         assert "active_sessions" in data
 
+    async def test_summary_cached_until_trade_or_session_change(self, auth_client: AsyncClient):
+        async def summary() -> tuple[int, int]:
+            data = (await auth_client.get("/api/v1/dashboard/summary")).json()
+            return data["active_sessions"], data["total_trades_today"]
+
+        assert await summary() == (0, 0)
+        session_id = await _create_session()
+        async with async_session() as db:
+            (await db.get(TradeSession, session_id)).status = "running"
+            await db.commit()
+        # 직접 바꾼 DB 는 캐시를 비우지 않음
+        assert await summary() == (0, 0)
+
+        writer = TradeWriter()
+        writer.record(
+            session_id=session_id, user_id=1, stock_code="005930",
+            side="BUY", quantity=1, price=100, status="filled",
+        )
+        await writer.flush()
+        assert await summary() == (1, 1)
+
+        res = await auth_client.post(f"/api/v1/trading/stop/{session_id}")
+        assert res.status_code == 200
+        assert await summary() == (0, 1)
+
+    def test_summary_started_before_invalidation_is_not_cached(self):
+        summary = DashboardSummary(
+            total_balance=0, total_profit=0, profit_rate=0, active_sessions=1, total_trades_today=0
+        )
+        generation = summary_cache.generation(1)
+        summary_cache.invalidate(1)
+        summary_cache.put_if_current(1, summary, generation)
+        assert summary_cache.get(1) is None
+        summary_cache.put_if_current(1, summary, summary_cache.generation(1))
+        assert summary_cache.get(1) == summary
+
     async def test_recent_trades(self, auth_client: AsyncClient):
         res = await auth_client.get("/api/v1/dashboard/recent-trades")
         assert res.status_code == 200
         assert isinstance(res.json(), list)
+
+
+async def _create_session() -> int:
+    async with async_session() as db:
+        session = TradeSession(user_id=1, account_id=1, strategy_id=1, stock_code="005930")
+        db.add(session)
+        await db.commit()
+        return session.id
+
+
+async def _session_counters(session_id: int) -> tuple[int, float, int]:
+    async with async_session() as db:
+        session = await db.get(TradeSession, session_id)
+        trades = await db.scalar(select(func.count(Trade.id)).where(Trade.session_id == session_id))
+        return session.total_trades, session.total_pnl, trades
+
+
+class TestTradingSessionsAPI:
+    async def test_listing_reads_counters_not_trades(self, auth_client: AsyncClient):
+        async with async_session() as db:
+            db.add(
+                KISAccount(
+                    user_id=1, label="main", app_key="k", app_secret="s", account_no="12345678"
+                )
+            )
+            await db.commit()
+        session_id = await _create_session()
+        writer = TradeWriter()
+        for side, price in [("BUY", 100), ("SELL", 130)]:
+            writer.record(session_id, 1, "005930", side, 1, price, "filled")
+        await writer.flush()
+
+        statements = []
+
+        def capture(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(engine.sync_engine, "before_cursor_execute", capture)
+        try:
+            listed = (await auth_client.get("/api/v1/trading/sessions")).json()
+            active = (await auth_client.get("/api/v1/trading/active")).json()
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+        assert listed == active
+        assert listed[0]["total_trades"] == 2
+        assert listed[0]["total_pnl"] == 30.0
+        assert listed[0]["account"]["label"] == "main"
+        assert not any("FROM trades" in s for s in statements)
+        assert not any("app_secret" in s for s in statements)
+
+
+class TestHistoryPagination:
+    async def _add_logs(self, n: int):
+        tied = datetime(2026, 1, 5, 9, 0, tzinfo=timezone.utc)
+        async with async_session() as db:
+            for i in range(n):
+                # 절반은 같은 시각 -> id 로 순서가 갈림
+                created_at = tied if i % 2 else tied + timedelta(seconds=i)
+                db.add(
+                    TradeLog(
+                        user_id=1, level="INFO", category="engine",
+                        message=f"log {i}", created_at=created_at,
+                    )
+                )
+            await db.commit()
+
+    async def test_cursor_pages_cover_history_once(self, auth_client: AsyncClient):
+        await self._add_logs(7)
+        seen, cursor = [], None
+        while True:
+            params = {"size": 3, **({"cursor": cursor} if cursor else {})}
+            res = await auth_client.get("/api/v1/logs", params=params)
+            seen += res.json()
+            cursor = res.headers.get("X-Next-Cursor")
+            if cursor is None:
+                break
+
+        assert len({log["id"] for log in seen}) == 7
+        keys = [(log["created_at"], log["id"]) for log in seen]
+        assert keys == sorted(keys, reverse=True)
+        # page 방식도 같은 순서
+        page2 = (await auth_client.get("/api/v1/logs", params={"size": 3, "page": 2})).json()
+        assert page2 == seen[3:6]
+
+    async def test_invalid_cursor(self, auth_client: AsyncClient):
+        res = await auth_client.get("/api/v1/trades", params={"cursor": "not-a-cursor"})
+        assert res.status_code == 400
+
+    async def test_stream_yields_full_history(self, auth_client: AsyncClient):
+        await self._add_logs(5)
+        res = await auth_client.get("/api/v1/logs/stream")
+        assert res.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in res.text.splitlines()]
+        assert [log["message"] for log in lines][0] == "log 4"
+        assert len(lines) == 5
+
+
+async def _add_aged_logs(days_ago: list[int]):
+    now = datetime.now(timezone.utc)
+    async with async_session() as db:
+        for i, days in enumerate(days_ago):
+            db.add(
+                TradeLog(
+                    user_id=1, session_id=None if i % 2 else 7, level="INFO",
+                    category="order" if i % 3 else "engine", message=f"로그 {i}",
+                    metadata_json={"i": i}, created_at=now - timedelta(days=days, minutes=i),
+                )
+            )
+        await db.commit()
+
+
+class TestLogArchive:
+    @pytest.fixture
+    def archive(self, tmp_path, monkeypatch) -> LogArchive:
+        archive = LogArchive(tmp_path / "log_archive")
+        monkeypatch.setattr(logs_api, "log_archive", archive)
+        return archive
+
+    async def _archive(self, archive: LogArchive, **kwargs) -> dict[str, int]:
+        return await archive_trade_logs(async_session, archive, hot_days=14, **kwargs)
+
+    async def test_old_days_move_to_archive(self, auth_client: AsyncClient, archive: LogArchive):
+        await _add_aged_logs([0, 1, 20, 20, 21, 40, 40])
+        before = (await auth_client.get("/api/v1/logs", params={"size": 200})).json()
+
+        assert (await self._archive(archive))["archived"] == 5
+        async with async_session() as db:
+            assert await db.scalar(select(func.count()).select_from(TradeLog)) == 2
+        assert len(archive.days()) >= 3
+        # 다시 실행해도 옮길 것이 없음
+        assert (await self._archive(archive))["archived"] == 0
+
+        after = (await auth_client.get("/api/v1/logs", params={"size": 200})).json()
+        assert after == before
+
+    async def test_cursor_and_page_cross_into_archive(
+        self, auth_client: AsyncClient, archive: LogArchive
+    ):
+        await _add_aged_logs([0, 1, 2, 20, 21, 22, 30])
+        full = (await auth_client.get("/api/v1/logs", params={"size": 200})).json()
+        await self._archive(archive)
+
+        seen, cursor = [], None
+        while True:
+            params = {"size": 2, **({"cursor": cursor} if cursor else {})}
+            res = await auth_client.get("/api/v1/logs", params=params)
+            seen += res.json()
+            cursor = res.headers.get("X-Next-Cursor")
+            if cursor is None:
+                break
+        assert seen == full
+        for page in (2, 3, 4):
+            res = await auth_client.get("/api/v1/logs", params={"size": 2, "page": page})
+            assert res.json() == full[(page - 1) * 2 : page * 2]
+
+        filtered = await auth_client.get("/api/v1/logs", params={"category": "engine"})
+        assert filtered.json() == [log for log in full if log["category"] == "engine"]
+        stream = await auth_client.get("/api/v1/logs/stream")
+        assert [json.loads(line) for line in stream.text.splitlines()] == full
+
+    def test_manifest_skips_partitions_without_matches(self, archive: LogArchive, monkeypatch):
+        def rows(day: date, user_id: int, level: str, n: int) -> list[dict]:
+            at = datetime.combine(day, datetime.min.time())
+            return [
+                {
+                    "id": day.toordinal() * 100 + i, "user_id": user_id, "session_id": None,
+                    "level": level, "category": "engine", "message": f"{day} {i}",
+                    "metadata": None, "created_at": at + timedelta(minutes=i),
+                }
+                for i in range(n)
+            ]
+
+        first = date(2026, 1, 1)
+        for offset in range(10):
+            day = first + timedelta(days=offset)
+            archive.write_day(day, rows(day, 1, "ERROR" if offset == 3 else "INFO", 5))
+        archive.write_day(first + timedelta(days=10), rows(first + timedelta(days=10), 2, "INFO", 5))
+
+        opened = []
+        original = archive._columns
+        monkeypatch.setattr(archive, "_columns", lambda day: opened.append(day) or original(day))
+        assert archive.query(3) == []
+        assert [log.level for log in archive.query(1, level="ERROR")] == ["ERROR"] * 5
+        assert opened == [first + timedelta(days=3)]
+
+        # page offset 가 건너뛰는 날도 열지 않음
+        opened.clear()
+        page = archive.query(1, limit=5, skip=20)
+        assert [log.created_at.date() for log in page] == [first + timedelta(days=5)] * 5
+        assert opened == [first + timedelta(days=5)]
+
+        (archive.root / "manifest.json").unlink()
+        assert len(archive.days()) == 11
+        assert len(archive.query(2)) == 5
+
+    async def test_retention_prunes_old_partitions(self, archive: LogArchive):
+        await _add_aged_logs([20, 400])
+        result = await self._archive(archive, retention_days=365)
+        assert result == {"archived": 2, "pruned": 1}
+        assert len(archive.days()) == 1
+
+
+class TestHistoryExport:
+    async def _add_trades(self, n: int):
+        session_id = await _create_session()
+        async with async_session() as db:
+            for i in range(n):
+                db.add(
+                    Trade(
+                        session_id=session_id, user_id=1, stock_code="005930", stock_name="삼성전자",
+                        side="BUY" if i % 2 else "SELL", quantity=i + 1, price=70000 + i,
+                        status="filled",
+                    )
+                )
+            await db.commit()
+
+    async def test_trades_csv(self, auth_client: AsyncClient):
+        await self._add_trades(1203)  # 배치 경계를 넘김
+        res = await auth_client.get("/api/v1/trades/export")
+        assert res.headers["content-type"].startswith("text/csv")
+        assert 'filename="trades.csv"' in res.headers["content-disposition"]
+        rows = list(csv.DictReader(io.StringIO(res.content.decode("utf-8-sig"))))
+        assert len(rows) == 1203
+        assert rows[0]["stock_name"] == "삼성전자"
+        assert rows[0]["quantity"] == "1203"
+        assert rows[-1]["quantity"] == "1"
+
+    async def test_logs_ndjson_gzip_includes_archive(
+        self, auth_client: AsyncClient, tmp_path, monkeypatch
+    ):
+        archive = LogArchive(tmp_path / "log_archive")
+        monkeypatch.setattr(logs_api, "log_archive", archive)
+        await _add_aged_logs([0, 1, 20, 30])
+        await archive_trade_logs(async_session, archive, hot_days=14)
+
+        res = await auth_client.get("/api/v1/logs/export", params={"format": "ndjson", "gzip": True})
+        assert res.headers["content-type"] == "application/gzip"
+        assert 'filename="trade_logs.ndjson.gz"' in res.headers["content-disposition"]
+        lines = [json.loads(line) for line in gzip.decompress(res.content).decode().splitlines()]
+        stream = await auth_client.get("/api/v1/logs/stream")
+        streamed = [json.loads(line) for line in stream.text.splitlines()]
+        assert lines == streamed
+        assert len(lines) == 4
+        assert lines[0]["metadata"] == {"i": 0}
+
+
+class TestTradeWriter:
+    def _record(
+        self, writer: TradeWriter, session_id: int, side: str, qty: int, price: float, status="filled"
+    ):
+        writer.record(
+            session_id=session_id,
+            user_id=1,
+            stock_code="005930",
+            side=side,
+            quantity=qty,
+            price=price,
+            status=status,
+            result={"order_no": "0001"} if status == "filled" else None,
+        )
+
+    async def test_batches_rows_and_session_counters(self):
+        session_id = await _create_session()
+        writer = TradeWriter()
+        self._record(writer, session_id, "BUY", 2, 100)
+        self._record(writer, session_id, "BUY", 2, 110)
+        self._record(writer, session_id, "SELL", 3, 120)
+        self._record(writer, session_id, "SELL", 1, 90, status="rejected")
+        assert writer.pending == 4
+        await writer.flush()
+
+        # 평균단가 105 에 3주 매도 -> 실현손익 45, 거부된 주문은 기록만 됨
+        assert await _session_counters(session_id) == (3, 45.0, 4)
+
+        # 새 writer 는 저장된 체결로 포지션을 다시 만들어 이어서 계산
+        restarted = TradeWriter()
+        self._record(restarted, session_id, "SELL", 1, 100)
+        await restarted.flush()
+        assert await _session_counters(session_id) == (4, 40.0, 5)
+
+    async def test_daily_rollup_matches_backfill(self, auth_client: AsyncClient):
+        session_id = await _create_session()
+        writer = TradeWriter()
+        self._record(writer, session_id, "BUY", 2, 100)
+        await writer.flush()
+        self._record(writer, session_id, "BUY", 2, 110)
+        self._record(writer, session_id, "SELL", 3, 120)
+        self._record(writer, session_id, "SELL", 1, 90, status="rejected")
+        await writer.flush()
+
+        async def rollup():
+            async with async_session() as db:
+                row = (await db.execute(select(DailyPnl))).scalar_one()
+                return row.trades, row.buy_amount, row.sell_amount, row.realized_pnl, row.fees
+
+        incremental = await rollup()
+        assert incremental[:4] == (3, 420.0, 360.0, 45.0)
+        assert incremental[4] == pytest.approx(780 * 0.00015 + 360 * 0.002)
+
+        assert await rebuild_daily_pnl(async_session) == 1
+        assert await rollup() == pytest.approx(incremental)
+
+        days = (await auth_client.get("/api/v1/dashboard/daily-pnl")).json()
+        assert [(d["trades"], d["turnover"], d["realized_pnl"]) for d in days] == [(3, 780.0, 45.0)]
+        summary = (await auth_client.get("/api/v1/dashboard/summary")).json()
+        assert summary["total_trades_today"] == 3
+
+    async def test_background_writer_drains_on_stop(self):
+        session_id = await _create_session()
+        writer = TradeWriter(batch_size=2, flush_interval=60)
+        writer.start()
+        for _ in range(5):
+            self._record(writer, session_id, "BUY", 1, 100)
+        await writer.stop()
+        assert writer.pending == 0 and writer.written == 5
+        assert (await _session_counters(session_id))[0] == 5
+
+    async def test_failed_batch_is_retried_until_written(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(trade_writer_module, "RETRY_BASE_DELAY", 0.0)
+        session_id = await _create_session()
+        # 긴 장애 (지수 백오프가 2**1024 를 넘는 시도 횟수) 에도 기록기가 죽지 않아야 함
+        sessions = _FlakySessions(failures=1100)
+        writer = TradeWriter(sessions, flush_interval=0.01, spill_path=tmp_path / "spill.jsonl")
+        writer.start()
+        self._record(writer, session_id, "BUY", 2, 100)
+        self._record(writer, session_id, "SELL", 1, 110)
+        await writer.flush()
+        await writer.stop()
+
+        # 시도 횟수 상한을 넘겨도 버리지 않고 쓸 때까지 재시도
+        assert sessions.calls == 1101
+        assert writer.written == 2 and writer.spilled == 0
+        assert not writer.failing
+        assert await _session_counters(session_id) == (2, 10.0, 2)
+
+    async def test_outage_at_stop_spills_and_replays_on_start(
+        self, auth_client: AsyncClient, tmp_path, monkeypatch
+    ):
+        monkeypatch.setattr(trade_writer_module, "RETRY_BASE_DELAY", 0.0)
+        session_id = await _create_session()
+        spill = tmp_path / "spill.jsonl"
+        outage = _FlakySessions(failures=10**6)
+        down = TradeWriter(outage, flush_interval=0.01, spill_path=spill)
+        down.start()
+        self._record(down, session_id, "BUY", 2, 100)
+        self._record(down, session_id, "SELL", 1, 110)
+        while outage.calls < 3:
+            await asyncio.sleep(0.001)
+        monkeypatch.setattr(trading_api, "trade_writer", down)
+        status = (await auth_client.get("/api/v1/trading/writer")).json()
+        assert status["failing"] and status["last_error"] == "database is unavailable"
+
+        await down.stop()
+        assert down.spilled == 2 and down.written == 0
+        assert len(spill.read_text().splitlines()) == 2
+        assert await _session_counters(session_id) == (0, 0.0, 0)
+
+        # 다음 시작 때 파일의 행을 먼저 쓰고 파일을 지움
+        restarted = TradeWriter(flush_interval=0.01, spill_path=spill)
+        restarted.start()
+        self._record(restarted, session_id, "SELL", 1, 120)
+        await restarted.stop()
+        assert restarted.written == 3
+        assert not spill.exists()
+        assert await _session_counters(session_id) == (3, 30.0, 3)
+
+
+class _FlakySessions:
+    """Session factory whose first ``failures`` sessions cannot be opened."""
+
+    def __init__(self, failures: int):
+        self.failures = failures
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise OSError("database is unavailable")
+        return async_session()
+
+
+class TestDatabaseLogSink:
+    async def test_session_logs_reach_logs_endpoint(self, auth_client: AsyncClient):
+        me = (await auth_client.get("/api/v1/auth/me")).json()
+        sink = DatabaseLogSink(batch_size=2)
+        handler = logger.add(sink, level="INFO", filter=sink.accepts, format="{message}")
+        try:
+            log = logger.bind(category="strategy", session_id=7, user_id=me["id"])
+            log.info("signal=HOLD")
+            log.bind(stock_code="005930").warning("price stale")
+            log.debug("below sink level")
+            logger.info("not bound to a session")
+            assert sink.pending == 2
+            await sink.flush()
+        finally:
+            logger.remove(handler)
+
+        assert sink.written == 2
+        res = await auth_client.get("/api/v1/logs", params={"category": "strategy"})
+        logs = res.json()
+        assert {log["message"] for log in logs} == {"signal=HOLD", "price stale"}
+        assert all(log["session_id"] == 7 for log in logs)
+        warning = next(log for log in logs if log["level"] == "WARNING")
+        assert warning["metadata"] == {"stock_code": "005930"}
+
+    async def test_full_buffer_drops_and_counts(self):
+        sink = DatabaseLogSink(max_queue=3)
+        handler = logger.add(sink, level="INFO", filter=sink.accepts, format="{message}")
+        try:
+            log = logger.bind(category="engine", session_id=1, user_id=1)
+            for i in range(5):
+                log.info(f"tick {i}")
+        finally:
+            logger.remove(handler)
+        assert (sink.pending, sink.dropped) == (3, 2)
+
+        sink.start()
+        await sink.stop()
+        assert sink.written == 3 and sink.pending == 0
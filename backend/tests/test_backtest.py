@@ -0,0 +1,137 @@
+import numpy as np
+import pandas as pd
+
+from app.engine.backtest import BUY, HOLD, SELL, generate_signals, run_backtest, simulate
+from app.services.optimizer_service import ParameterSweep, expand_grid, sample_random
+from app.services.walkforward_service import (
+    WalkForwardAnalysis,
+    _evaluate_windows,
+    rolling_windows,
+)
+from app.strategies.sma_crossover import SMACrossoverStrategy
+from app.strategies.threshold_strategy import ThresholdStrategy
+
+
+def _make_ohlcv(closes: list[float]) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "open": closes,
+            "high": [c * 1.02 for c in closes],
+            "low": [c * 0.98 for c in closes],
+            "close": closes,
+            "volume": [1000] * len(closes),
+        }
+    )
+
+
+def _wave(n: int = 120) -> list[float]:
+    return [100 + 10 * np.sin(i / 6) for i in range(n)]
+
+
+class TestBacktest:
+    def test_simulate_round_trip(self):
+        close = np.array([100.0, 110.0, 120.0, 90.0])
+        signals = np.array([BUY, HOLD, SELL, HOLD], dtype=np.int8)
+        result = simulate(close, signals)
+        assert result.trades == 1
+        assert result.win_rate == 100.0
+        assert abs(result.total_return - 20.0) < 1e-9
+
+    def test_simulate_fees_reduce_return(self):
+        close = np.array([100.0, 120.0])
+        signals = np.array([BUY, SELL], dtype=np.int8)
+        assert simulate(close, signals, fee_rate=0.01).total_return < 20.0
+
+    def test_threshold_signals(self):
+        strategy = ThresholdStrategy({"buy_price": 95, "sell_price": 105})
+        signals = generate_signals(strategy, _make_ohlcv([100, 94, 100, 106]))
+        assert signals.tolist() == [HOLD, BUY, HOLD, SELL]
+
+    def test_run_backtest_trades_on_wave(self):
+        strategy = SMACrossoverStrategy({"short_period": 3, "long_period": 10})
+        result = run_backtest(strategy, _make_ohlcv(_wave()))
+        assert result.trades > 0
+        assert len(result.equity) == 120
+
+
+class TestOptimizer:
+    def test_expand_grid_full_integer_range(self):
+        grid = expand_grid(SMACrossoverStrategy.parameter_schema())
+        assert len(grid) == 49 * 196
+
+    def test_expand_grid_capped(self):
+        grid = expand_grid(SMACrossoverStrategy.parameter_schema(), max_points=5)
+        assert len(grid) == 25
+
+    def test_sample_random_within_bounds(self):
+        samples = sample_random(SMACrossoverStrategy.parameter_schema(), 20, seed=1)
+        assert all(2 <= s["short_period"] <= 50 for s in samples)
+
+    async def test_sweep_streams_ranked_results(self):
+        frames = {"A": _make_ohlcv(_wave()), "B": _make_ohlcv(_wave()[::-1])}
+        grid = expand_grid(
+            SMACrossoverStrategy.parameter_schema(),
+            ranges={"short_period": [3, 5, 30], "long_period": [10, 20]},
+        )
+        sweep = ParameterSweep("sma_crossover", frames, grid, metric="total_return", max_workers=2)
+        # short_period=30 is invalid for both long periods and gets filtered out
+        assert len(sweep.candidates) == 4
+
+        streamed = [r async for r in sweep.stream()]
+        assert len(streamed) == 4
+        ranked = sweep.ranked()
+        returns = [r.metrics["total_return"] for r in ranked]
+        assert returns == sorted(returns, reverse=True)
+        assert set(ranked[0].per_symbol) == {"A", "B"}
+
+
+class TestWalkForward:
+    def test_rolling_windows(self):
+        windows = rolling_windows(100, train_size=40, test_size=20)
+        assert [(w.train, w.test) for w in windows] == [
+            ((0, 40), (40, 60)),
+            ((20, 60), (60, 80)),
+            ((40, 80), (80, 100)),
+        ]
+        anchored = rolling_windows(100, train_size=40, test_size=20, anchored=True)
+        assert [w.train for w in anchored] == [(0, 40), (0, 60), (0, 80)]
+
+    def test_window_slices_match_standalone_backtests(self, monkeypatch):
+        from app.services import optimizer_service
+
+        frames = {"A": _make_ohlcv(_wave(120))}
+        monkeypatch.setattr(optimizer_service, "_worker_frames", frames)
+        params = {"short_period": 3, "long_period": 10}
+        bounds = {"A": [(0, 60, 60, 90)]}
+        _, train, test = _evaluate_windows("sma_crossover", params, 0.0, bounds)
+
+        signals = generate_signals(SMACrossoverStrategy(params), frames["A"])
+        close = frames["A"]["close"].to_numpy()
+        assert train[0]["A"] == simulate(close[:60], signals[:60]).metrics()
+        assert test[0]["A"] == simulate(close[60:90], signals[60:90]).metrics()
+
+    async def test_walk_forward_reports_out_of_sample(self):
+        dates = pd.bdate_range("2024-01-01", periods=160).strftime("%Y%m%d")
+        frames = {}
+        for symbol, n in (("A", 160), ("B", 140)):
+            df = _make_ohlcv(_wave(n))
+            df["date"] = dates[-n:]  # B는 상장이 늦어 이력이 짧음
+            frames[symbol] = df
+        candidates = [{"short_period": s, "long_period": 12} for s in (2, 3, 5)]
+        analysis = WalkForwardAnalysis(
+            "sma_crossover",
+            frames,
+            candidates,
+            train_size=80,
+            test_size=40,
+            metric="total_return",
+            max_workers=2,
+        )
+        report = await analysis.run()
+        assert len(report.windows) == 2
+        assert report.windows[0].window.test_period == (dates[80], dates[119])
+        for result in report.windows:
+            assert result.best_params in candidates
+            assert set(result.per_symbol) == {"A", "B"}
+        assert sum(n for _, n in report.param_stability) == 2
+        assert report.summary()["windows"] == 2
@@ -0,0 +1,58 @@
+import asyncio
+
+import pytest
+
+from benchmarks.harness import Case, compare, run_case
+
+
+def _report(**medians: float) -> dict:
+    return {"results": [{"key": k, "median": v} for k, v in medians.items()]}
+
+
+class TestBenchmarkHarness:
+    def test_compare_flags_regressions(self):
+        baseline = _report(a=1.0, b=1.0, c=1.0, gone=1.0)
+        current = _report(a=1.1, b=1.5, c=0.5, added=1.0)
+        status = {c.key: c.status for c in compare(baseline, current, tolerance=0.2)}
+        assert status == {
+            "a": "ok",
+            "b": "regression",
+            "c": "improvement",
+            "added": "new",
+            "gone": "missing",
+        }
+
+    async def test_run_case_with_async_setup(self):
+        calls = []
+
+        async def setup(n: int):
+            async def op():
+                calls.append(n)
+                await asyncio.sleep(0)
+
+            return op
+
+        result = await run_case(Case("noop", setup, {"n": 3}), rounds=3)
+        assert result.key == "noop[n=3]"
+        assert result.rounds == 3
+        assert result.number >= 1 and calls
+        assert 0 < result.min <= result.median
+
+    async def test_run_case_tears_down_yielding_setup(self):
+        events = []
+
+        async def setup():
+            events.append("setup")
+            yield lambda: None
+            events.append("teardown")
+
+        def failing():
+            yield None
+            events.append("teardown after error")
+
+        await run_case(Case("noop", setup), rounds=1)
+        assert events == ["setup", "teardown"]
+        # None 은 호출할 수 없으므로 측정이 실패해도 정리는 실행됨
+        with pytest.raises(TypeError):
+            await run_case(Case("broken", failing), rounds=1)
+        assert events[-1] == "teardown after error"
@@ -0,0 +1,155 @@
+import asyncio
+
+from app.engine.clock import Clock
+from app.engine.executor import StrategyExecutor
+from app.engine.ledger import AccountLedger, ledgers
+from app.engine.manager import TradingManager
+from app.engine.replay import EventRecorder, PaperBroker
+from app.engine.trade_writer import TradeWriter
+from app.strategies.registry import get_strategy
+
+
+class _SnapshotBroker(PaperBroker):
+    def __init__(self, cash: float, holdings: list[dict]):
+        self.cash = cash
+        self.holdings = holdings
+        self.snapshots = 0
+        self.holding_calls = 0
+        # 조회 도중 실행할 동작 (체결이 끼어드는 상황 재현)
+        self.during_fetch = []
+
+    async def get_account_snapshot(self) -> dict:
+        self.snapshots += 1
+        snapshot = {"balance": {"dnca_tot_amt": str(self.cash)}, "holdings": list(self.holdings)}
+        if self.during_fetch:
+            await self.during_fetch.pop(0)()
+        return snapshot
+
+    async def get_holdings(self) -> list[dict]:
+        self.holding_calls += 1
+        return self.holdings
+
+
+def _ledger(broker: _SnapshotBroker, user_id: int = 1) -> AccountLedger:
+    return AccountLedger(1, user_id, broker, notifier=EventRecorder(Clock()))
+
+
+class TestAccountLedger:
+    async def test_fills_move_positions_and_cash(self):
+        broker = _SnapshotBroker(
+            1_000_000,
+            [{"pdno": "005930", "prdt_name": "삼성전자", "hldg_qty": "10", "pchs_avg_pric": "70000"}],
+        )
+        ledger = _ledger(broker)
+        await ledger.seed()
+
+        await ledger.apply_fill("005930", "BUY", 10, 80000)
+        await ledger.apply_fill("000660", "BUY", 2, 100000, "SK하이닉스")
+        await ledger.apply_fill("005930", "SELL", 5, 90000)
+        holding = ledger.holding("005930")
+        assert (holding["hldg_qty"], holding["pchs_avg_pric"]) == (15, 75000)
+        assert ledger.cash == 1_000_000 - 800_000 - 200_000 + 450_000
+        assert ledger.buyable_quantity(100000) == 4
+        await ledger.apply_fill("000660", "SELL", 2, 100000)
+        assert ledger.holding("000660") is None
+        assert broker.snapshots == 1
+
+    async def test_reconcile_alerts_on_drift_and_adopts_broker_state(self):
+        broker = _SnapshotBroker(500_000, [{"pdno": "005930", "hldg_qty": 3, "pchs_avg_pric": 70000}])
+        recorder = EventRecorder(Clock())
+        ledger = AccountLedger(1, 42, broker, notifier=recorder)
+        await ledger.seed()
+        assert await ledger.reconcile() == []
+
+        await ledger.apply_fill("005930", "BUY", 1, 70000)
+        drift = await ledger.reconcile()
+        assert {d["stock_code"] for d in drift} == {"005930", None}
+        assert ledger.holding("005930")["hldg_qty"] == 3 and ledger.cash == 500_000
+        assert recorder.events[-1]["type"] == "ledger.drift"
+
+    async def test_fill_during_fetch_is_kept(self):
+        broker = _SnapshotBroker(500_000, [{"pdno": "005930", "hldg_qty": 3, "pchs_avg_pric": 70000}])
+        ledger = _ledger(broker)
+        await ledger.seed()
+
+        async def fill():
+            # 브로커에서는 이미 체결됐지만 먼저 받은 스냅샷에는 없음
+            await ledger.apply_fill("005930", "BUY", 1, 70000)
+            broker.holdings = [{"pdno": "005930", "hldg_qty": 4, "pchs_avg_pric": 70000}]
+            broker.cash = 430_000
+
+        broker.during_fetch.append(fill)
+        assert await ledger.reconcile() == []
+        assert broker.snapshots == 3  # seed + 버린 조회 + 다시 조회
+        assert ledger.holding("005930")["hldg_qty"] == 4 and ledger.cash == 430_000
+
+    async def test_reconcile_skipped_while_fills_keep_arriving(self):
+        broker = _SnapshotBroker(500_000, [])
+        ledger = _ledger(broker)
+        await ledger.seed()
+
+        async def fill():
+            await ledger.apply_fill("005930", "BUY", 1, 10000)
+
+        broker.during_fetch.extend([fill, fill, fill])
+        assert await ledger.reconcile() == []
+        assert ledger.holding("005930")["hldg_qty"] == 3
+        assert ledger.reconciled_at is None
+
+
+class TestLedgerLifetime:
+    class _Executor:
+        def __init__(self, ledger: AccountLedger):
+            self.ledger = ledger
+            self._stop = asyncio.Event()
+
+        def stop(self) -> None:
+            self._stop.set()
+
+        async def run(self) -> None:
+            await self._stop.wait()
+
+    async def test_discarded_when_last_session_on_account_ends(self):
+        ledger = await ledgers.get(1, 1, _SnapshotBroker(100_000, []))
+        manager = TradingManager()
+        executors = [self._Executor(ledger), self._Executor(ledger)]
+        for session_id, executor in enumerate(executors, start=1):
+            manager._sessions[session_id] = executor
+            manager._tasks[session_id] = asyncio.create_task(
+                manager._run_executor(session_id, executor)
+            )
+        try:
+            executors[0].stop()
+            await manager._tasks[1]
+            assert ledgers.peek(1) is ledger
+            executors[1].stop()
+            await manager._tasks[2]
+            assert ledgers.peek(1) is None
+        finally:
+            ledgers.discard(1)
+
+    async def test_executor_reads_holdings_and_records_fills_in_ledger(self):
+        broker = _SnapshotBroker(1_000_000, [{"pdno": "005930", "hldg_qty": 2, "pchs_avg_pric": 70000}])
+        ledger = _ledger(broker)
+        await ledger.seed()
+        executor = StrategyExecutor(
+            session_id=1,
+            user_id=1,
+            broker=broker,
+            strategy=get_strategy("threshold", {"buy_price": 95, "sell_price": 105}),
+            stock_code="005930",
+            notifier=EventRecorder(Clock()),
+            trades=TradeWriter(),
+            ledger=ledger,
+        )
+
+        holding = await executor._holdings(72000)
+        assert (holding["hldg_qty"], holding["prpr"]) == (2, 72000)
+
+        async def submit(stock_code: str, quantity: int) -> dict:
+            return {"order_no": "1", "filled_quantity": quantity, "filled_price": 71000}
+
+        await executor._place_order("BUY", submit, 72000, "test")
+        assert (await executor._holdings(71000))["hldg_qty"] == 3
+        assert ledger.cash == 1_000_000 - 71000
+        assert broker.holding_calls == 0
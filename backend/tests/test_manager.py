@@ -0,0 +1,47 @@
+import asyncio
+
+from app.engine.manager import TradingManager
+
+
+class _Executor:
+    """Stands in for a StrategyExecutor that is mid-order when asked to stop."""
+
+    def __init__(self, hang: bool = False):
+        self.hang = hang
+        self.ledger = None
+        self.finished = False
+        self._stop = asyncio.Event()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    async def run(self) -> None:
+        await self._stop.wait()
+        await asyncio.sleep(3600 if self.hang else 0.01)
+        self.finished = True
+
+
+def _start(manager: TradingManager, session_id: int, executor: _Executor) -> None:
+    manager._sessions[session_id] = executor
+    manager._tasks[session_id] = asyncio.create_task(manager._run_executor(session_id, executor))
+
+
+class TestTradingManager:
+    async def test_stop_all_waits_for_running_cycles(self):
+        manager = TradingManager()
+        executors = [_Executor(), _Executor()]
+        for session_id, executor in enumerate(executors, start=1):
+            _start(manager, session_id, executor)
+
+        await manager.stop_all()
+        assert all(e.finished for e in executors)
+        assert manager.get_active_session_ids() == []
+
+    async def test_stop_all_cancels_after_timeout(self):
+        manager = TradingManager()
+        executor = _Executor(hang=True)
+        _start(manager, 1, executor)
+
+        await manager.stop_all(timeout=0.05)
+        assert not executor.finished
+        assert manager.get_active_session_ids() == []
@@ -0,0 +1,310 @@
+from datetime import date, datetime, time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.market.bars import BarAggregator, BarRing, resample
+from app.market.calendar import TradingCalendar, krx_calendar
+from app.market.recorder import (
+    CANDLE,
+    QUOTE,
+    TickRecorder,
+    quotes_for_replay,
+    read_tick_file,
+    read_ticks,
+)
+from app.market.store import (
+    KST,
+    OHLCV_DTYPE,
+    OHLCVStore,
+    date_to_ts,
+    records_to_array,
+    to_frame,
+)
+from app.services import market_service
+from app.services.market_service import load_daily_history, with_today_bar
+
+
+def _candles(days: list[str], base: float = 100.0) -> list[dict]:
+    return [
+        {"date": d, "open": base + i, "high": base + i, "low": base + i, "close": base + i, "volume": 10}
+        for i, d in enumerate(days)
+    ]
+
+
+class TestOHLCVStore:
+    def test_append_and_read(self, tmp_path):
+        store = OHLCVStore(tmp_path)
+        # 브로커는 최신순으로 반환
+        assert store.ingest("005930", "D", _candles(["20260105", "20260102"])) == 2
+        assert store.ingest("005930", "D", _candles(["20260106"])) == 1
+        arr = store.read("005930", "D")
+        assert isinstance(arr, np.memmap)
+        assert list(to_frame(arr)["date"]) == ["20260102", "20260105", "20260106"]
+
+    def test_duplicates_are_ignored(self, tmp_path):
+        store = OHLCVStore(tmp_path)
+        store.ingest("005930", "D", _candles(["20260102", "20260105"]))
+        assert store.ingest("005930", "D", _candles(["20260105"])) == 0
+        assert len(store.read("005930", "D")) == 2
+
+    def test_gap_fill_merges_in_order(self, tmp_path):
+        store = OHLCVStore(tmp_path)
+        store.ingest("005930", "D", _candles(["20260102", "20260107"]))
+        assert store.find_gaps("005930", date(2026, 1, 2), date(2026, 1, 7)) == [
+            (date(2026, 1, 5), date(2026, 1, 6))
+        ]
+        store.ingest("005930", "D", _candles(["20260105", "20260106"]))
+        assert store.find_gaps("005930", date(2026, 1, 2), date(2026, 1, 7)) == []
+        ts = store.read("005930", "D")["ts"]
+        assert np.all(np.diff(ts) > 0)
+
+    def test_holidays_are_not_gaps(self, tmp_path):
+        # 설 연휴(2/16~18)는 봉이 없어도 빈 구간이 아님
+        store = OHLCVStore(tmp_path)
+        store.ingest("005930", "D", _candles(["20260213", "20260219"]))
+        assert store.find_gaps("005930", date(2026, 2, 13), date(2026, 2, 20)) == [
+            (date(2026, 2, 20), date(2026, 2, 20))
+        ]
+
+    def test_range_query(self, tmp_path):
+        store = OHLCVStore(tmp_path)
+        store.ingest("005930", "D", _candles(["20260102", "20260105", "20260106", "20260107"]))
+        arr = store.read("005930", "D", date_to_ts("20260105"), date_to_ts("20260106"))
+        assert len(arr) == 2
+
+    def test_forming_bar_is_skipped(self, tmp_path):
+        store = OHLCVStore(tmp_path)
+        written = store.ingest(
+            "005930", "D", _candles(["20260105", "20260106"]), completed_before=date_to_ts("20260106")
+        )
+        assert written == 1
+
+
+def _minute_bars(start: str, closes: list[float]) -> np.ndarray:
+    base = date_to_ts(start)
+    arr = np.zeros(len(closes), dtype=OHLCV_DTYPE)
+    arr["ts"] = base + np.arange(len(closes)) * 60
+    arr["open"] = arr["high"] = arr["low"] = arr["close"] = closes
+    arr["volume"] = 1
+    return arr
+
+
+class TestBars:
+    def test_resample_to_five_minutes(self):
+        bars = resample(_minute_bars("202601050900", [1, 5, 2, 3, 4, 6, 7]), 5)
+        assert list(bars["ts"]) == [date_to_ts("202601050900"), date_to_ts("202601050905")]
+        assert list(bars["open"]) == [1, 6]
+        assert list(bars["high"]) == [5, 7]
+        assert list(bars["low"]) == [1, 6]
+        assert list(bars["close"]) == [4, 7]
+        assert list(bars["volume"]) == [5, 2]
+
+    def test_ring_keeps_latest_bars(self):
+        ring = BarRing(capacity=3)
+        for bar in _minute_bars("202601050900", [1, 2, 3, 4, 5]):
+            ring.append(tuple(bar))
+        assert len(ring) == 3
+        assert list(ring.array()["close"]) == [3, 4, 5]
+        assert ring.last_ts() == date_to_ts("202601050904")
+
+    def test_aggregator_closes_bars_on_bucket_change(self):
+        agg = BarAggregator()
+        agg.track("005930", "1m")
+        agg.track("005930", "5m")
+        t0 = date_to_ts("202601050900")
+        assert agg.on_tick("005930", 100, 1000, ts=t0) == []
+        assert agg.on_tick("005930", 105, 1010, ts=t0 + 30) == []
+        assert agg.on_tick("005930", 101, 1030, ts=t0 + 60) == ["1m"]
+        assert agg.on_tick("005930", 99, 1040, ts=t0 + 300) == ["1m", "5m"]
+
+        first = agg.bars("005930", "1m")[0]
+        assert (first["open"], first["high"], first["close"], first["volume"]) == (100, 105, 105, 10)
+        five = agg.frame("005930", "5m")
+        assert list(five["date"]) == ["202601050900"]
+        assert five["high"].iloc[0] == 105 and five["close"].iloc[0] == 101
+        assert agg.last_closed_ts("005930", "5m") == t0
+
+    def test_seed_skips_known_bars(self):
+        agg = BarAggregator()
+        records = [{"date": "202601050901", "close": 2}, {"date": "202601050900", "close": 1}]
+        agg.seed("005930", "1m", records)
+        agg.seed("005930", "1m", records)
+        assert list(agg.frame("005930", "1m")["close"]) == [1, 2]
+
+
+def _quote(code: str, price: float, volume: int) -> dict:
+    return {"stock_code": code, "current_price": price, "volume": volume}
+
+
+class TestTickRecorder:
+    def test_round_trip(self, tmp_path):
+        recorder = TickRecorder(tmp_path, chunk_records=4)
+        recorder.record_quote(_quote("005930", 70000, 10))
+        recorder.record_candles(
+            "005930", "1m", [{"date": "202601050900", "open": 1, "high": 3, "low": 1, "close": 2, "volume": 7}]
+        )
+        recorder.record_quote(_quote("000660", 120000, 5))
+        recorder.close()
+
+        today = datetime.now(KST).date()
+        records = read_ticks(tmp_path, today)
+        assert len(records) == 3
+        assert list(records["kind"]) == [QUOTE, CANDLE, QUOTE]
+        candle = read_ticks(tmp_path, today, kind=CANDLE)[0]
+        assert candle["timeframe"] == b"1m"
+        assert candle["ts"] == date_to_ts("202601050900") * 1000
+        assert len(read_ticks(tmp_path, today, stock_code="005930")) == 2
+
+    def test_grows_past_chunk_and_reopens(self, tmp_path):
+        recorder = TickRecorder(tmp_path, chunk_records=4)
+        for i in range(10):
+            recorder.record_quote(_quote("005930", 100 + i, i))
+        # 닫기 전에도 헤더 카운트로 기록분을 읽을 수 있음
+        path = recorder._path
+        assert len(read_tick_file(path)) == 10
+        recorder.close()
+
+        reopened = TickRecorder(tmp_path, chunk_records=4)
+        reopened.record_quote(_quote("005930", 200, 11))
+        reopened.close()
+        records = read_tick_file(path)
+        assert len(records) == 11
+        assert list(records["close"][-2:]) == [109, 200]
+
+    def test_rotates_full_segment(self, tmp_path):
+        recorder = TickRecorder(tmp_path, chunk_records=2, max_records=3)
+        for i in range(7):
+            recorder.record_quote(_quote("005930", 100 + i, i))
+        recorder.close()
+        segments = sorted(p.name.split(".")[1] for p in tmp_path.glob("*.ticks"))
+        assert segments == ["000", "001", "002"]
+        records = read_ticks(tmp_path, datetime.now(KST).date())
+        assert list(records["close"]) == [100 + i for i in range(7)]
+
+    def test_disabled_recorder_writes_nothing(self, tmp_path):
+        recorder = TickRecorder(tmp_path, enabled=False)
+        recorder.record_quote(_quote("005930", 100, 1))
+        recorder.close()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_quotes_for_replay(self, tmp_path):
+        recorder = TickRecorder(tmp_path)
+        for i, ts in enumerate([1_000_000, 1_000_060]):
+            recorder.record("005930", QUOTE, 100 + i, volume=i, ts_ms=ts * 1000)
+        recorder.record("005930", CANDLE, 1, timeframe="1m", ts_ms=0)
+        recorder.close()
+        frames = quotes_for_replay(read_ticks(tmp_path, datetime.now(KST).date()))
+        assert list(frames) == ["005930"]
+        assert list(frames["005930"]["ts"]) == [1_000_000, 1_000_060]
+        assert list(frames["005930"]["price"]) == [100, 101]
+
+
+def _kst(*args) -> datetime:
+    return datetime(*args, tzinfo=KST)
+
+
+class TestTradingCalendar:
+    def test_regular_session(self):
+        assert krx_calendar.is_open(_kst(2026, 1, 5, 9, 0))
+        assert not krx_calendar.is_open(_kst(2026, 1, 5, 8, 59))
+        assert not krx_calendar.is_open(_kst(2026, 1, 5, 15, 30))
+        assert krx_calendar.next_open(_kst(2026, 1, 5, 10, 0)) == _kst(2026, 1, 5, 10, 0)
+
+    def test_holidays_and_weekends_are_skipped(self):
+        # 설 연휴(2/16~18) 전 금요일 장 마감 후 -> 2/19 개장
+        assert krx_calendar.next_open(_kst(2026, 2, 13, 16, 0)) == _kst(2026, 2, 19, 9, 0)
+        status = krx_calendar.status(_kst(2026, 2, 17, 11, 0))
+        assert status["reason"] == "holiday"
+        assert status["next_open"] == "2/19(목) 09:00"
+        assert krx_calendar.status(_kst(2026, 2, 14, 11, 0))["reason"] == "weekend"
+
+    def test_previous_trading_day(self):
+        assert krx_calendar.previous_trading_day(date(2026, 2, 19)) == date(2026, 2, 13)
+        assert krx_calendar.previous_trading_day(date(2026, 1, 5)) == date(2026, 1, 2)
+
+    def test_delayed_open(self):
+        # 연초 첫 거래일은 10시 개장
+        assert not krx_calendar.is_open(_kst(2026, 1, 2, 9, 30))
+        status = krx_calendar.status(_kst(2026, 1, 2, 9, 30))
+        assert status["reason"] == "before_open"
+        assert status["next_open_at"] == "2026-01-02T10:00:00+09:00"
+
+    def test_custom_early_close(self):
+        day = date(2026, 3, 4)
+        calendar = TradingCalendar(special_sessions={day: (time(9, 0), time(12, 0))})
+        assert calendar.is_open(_kst(2026, 3, 4, 11, 59))
+        assert not calendar.is_open(_kst(2026, 3, 4, 12, 0))
+        assert calendar.status(_kst(2026, 3, 4, 12, 0))["reason"] == "after_close"
+        assert calendar.next_open(_kst(2026, 3, 4, 12, 0)) == _kst(2026, 3, 5, 9, 0)
+
+
+class _QuoteBroker:
+    def __init__(self):
+        self.calls = 0
+
+    async def get_current_price(self, stock_code: str) -> dict:
+        self.calls += 1
+        return {"current_price": 105, "open_price": 100, "high": 108, "low": 99, "volume": 1200}
+
+
+class TestTodayBar:
+    async def _frame(self, now: datetime) -> tuple[list[str], _QuoteBroker]:
+        broker = _QuoteBroker()
+
+        async def get_broker():
+            return broker
+
+        history = to_frame(records_to_array(_candles(["20260102", "20260105"])))
+        frame = await with_today_bar(history, "005930", get_broker, now=now)
+        return list(frame["date"]), broker
+
+    async def test_forming_bar_during_session(self):
+        dates, _ = await self._frame(_kst(2026, 1, 6, 10, 0))
+        assert dates == ["20260102", "20260105", "20260106"]
+
+    async def test_no_bar_before_open_or_on_holidays(self):
+        for now in (_kst(2026, 1, 6, 8, 30), _kst(2026, 2, 17, 11, 0), _kst(2026, 1, 10, 11, 0)):
+            dates, broker = await self._frame(now)
+            assert dates == ["20260102", "20260105"]
+            assert broker.calls == 0
+
+
+class _FlakyRangeBroker:
+    """Fails the first range request, then serves a candle for every weekday."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def get_ohlcv_range(self, stock_code: str, period: str, start: str, end: str) -> list:
+        self.calls += 1
+        if self.calls == 1:
+            raise ConnectionError("broker unavailable")
+        days = pd.bdate_range(start, end).strftime("%Y%m%d")
+        return _candles(list(days))
+
+
+class TestDailyHistoryRefresh:
+    async def test_failed_refresh_is_retried_after_backoff(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(market_service, "ohlcv_store", OHLCVStore(tmp_path))
+        monkeypatch.setattr(market_service, "_refreshed", {})
+        monkeypatch.setattr(market_service, "_retry_at", {})
+        broker = _FlakyRangeBroker()
+
+        async def get_broker():
+            return broker
+
+        with pytest.raises(ConnectionError):
+            await load_daily_history("005930", 5, get_broker)
+        # 대기 시간 안에는 브로커를 다시 부르지 않고 저장된 봉만 돌려줌
+        assert (await load_daily_history("005930", 5, get_broker)).empty
+        assert broker.calls == 1
+
+        market_service._retry_at["005930"] = 0.0
+        frame = await load_daily_history("005930", 5, get_broker)
+        assert len(frame) == 5
+        assert broker.calls == 2
+        # 성공한 뒤에는 그날 다시 묻지 않음
+        await load_daily_history("005930", 10_000, get_broker)
+        assert broker.calls == 2
@@ -0,0 +1,84 @@
+import os
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.database import Base
+from app.models.strategy import Strategy
+from app.models.trade_log import TradeLog
+from app.models.user import User
+from app.tasks.migrate_sqlite import copy_database
+
+
+@pytest.fixture
+async def source_url(tmp_path):
+    url = f"sqlite+aiosqlite:///{tmp_path / 'source.db'}"
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, class_=AsyncSession)() as db:
+        db.add(User(username="old", password_hash="-"))
+        await db.flush()
+        db.add(Strategy(user_id=1, name="s", strategy_type="rsi", parameters={"period": 14}))
+        db.add_all(
+            TradeLog(
+                user_id=1, level="INFO", category="order", message=f"log {i}",
+                metadata_json={"stock_code": "005930", "i": str(i)},
+            )
+            for i in range(5)
+        )
+        await db.commit()
+    await engine.dispose()
+    return url
+
+
+async def _read_back(url: str):
+    engine = create_async_engine(url)
+    try:
+        async with async_sessionmaker(engine, class_=AsyncSession)() as db:
+            strategy = (await db.execute(select(Strategy))).scalar_one()
+            logs = (await db.execute(select(TradeLog).order_by(TradeLog.id))).scalars().all()
+            version = (await db.execute(text("SELECT version_num FROM alembic_version"))).scalar()
+            # 복사 후 새 행이 기존 id 와 부딪히지 않아야 함
+            db.add(TradeLog(user_id=1, level="INFO", category="order", message="new"))
+            await db.flush()
+            return strategy.parameters, [log.metadata_json["i"] for log in logs], version
+    finally:
+        await engine.dispose()
+
+
+class TestMigrateSqlite:
+    async def test_copies_rows_json_and_stamps(self, source_url, tmp_path):
+        target = f"sqlite+aiosqlite:///{tmp_path / 'target.db'}"
+        counts = await copy_database(source_url, target, batch_size=2)
+
+        assert counts["users"] == 1
+        assert counts["trade_logs"] == 5
+        parameters, order, version = await _read_back(target)
+        assert parameters == {"period": 14}
+        assert order == ["0", "1", "2", "3", "4"]
+        assert version == "0003_sqlite_timestamp_precision"
+
+    async def test_refuses_non_empty_target(self, source_url, tmp_path):
+        target = f"sqlite+aiosqlite:///{tmp_path / 'target.db'}"
+        await copy_database(source_url, target)
+        with pytest.raises(ValueError, match="not empty"):
+            await copy_database(source_url, target)
+
+    async def test_into_postgres(self, source_url):
+        url = os.environ.get("TEST_POSTGRES_URL")
+        if not url:
+            pytest.skip("TEST_POSTGRES_URL not set")
+        pytest.importorskip("asyncpg")
+        try:
+            await copy_database(source_url, url)
+            parameters, order, _ = await _read_back(url)
+            assert parameters == {"period": 14}
+            assert len(order) == 5
+        finally:
+            engine = create_async_engine(url)
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.drop_all)
+                await conn.execute(text("DROP TABLE IF EXISTS alembic_version"))
+            await engine.dispose()
@@ -0,0 +1,205 @@
+"""EXPLAIN checks that the hot queries use the indexes of the hot-path migration.
+
+The SQLite cases always run. The Postgres cases run when ``TEST_POSTGRES_URL``
+points at an empty database (``postgresql+asyncpg://...``).
+"""
+
+import os
+from datetime import datetime, timezone
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import cast, func, literal, select, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.database import Base
+from app.core.pagination import encode_cursor, newest_first, next_cursor
+from app.engine.state import SessionState
+from app.models.trade import Trade
+from app.models.trade_log import TradeLog
+from app.models.trade_session import TradeSession
+
+ALEMBIC_INI = os.path.join(os.path.dirname(os.path.dirname(__file__)), "alembic.ini")
+
+TODAY = datetime(2026, 1, 5, tzinfo=timezone.utc)
+
+# 엔드포인트/서비스와 같은 모양의 쿼리 -> 써야 하는 인덱스
+HOT_QUERIES = {
+    "logs": (
+        select(TradeLog).where(TradeLog.user_id == 1).order_by(TradeLog.created_at.desc()).limit(50),
+        "ix_trade_logs_user_created",
+    ),
+    "logs_by_category": (
+        select(TradeLog)
+        .where(TradeLog.user_id == 1, TradeLog.category == "order")
+        .order_by(TradeLog.created_at.desc())
+        .limit(50),
+        "ix_trade_logs_user_category_created",
+    ),
+    "logs_by_level": (
+        select(TradeLog)
+        .where(TradeLog.user_id == 1, TradeLog.level == "ERROR")
+        .order_by(TradeLog.created_at.desc())
+        .limit(50),
+        "ix_trade_logs_user_level_created",
+    ),
+    "logs_after_cursor": (
+        newest_first(
+            select(TradeLog).where(TradeLog.user_id == 1),
+            TradeLog.created_at,
+            TradeLog.id,
+            encode_cursor(datetime(2026, 1, 5, 9, 0), 1000),
+        ).limit(50),
+        "ix_trade_logs_user_created",
+    ),
+    "recent_trades": (
+        select(Trade).where(Trade.user_id == 1).order_by(Trade.created_at.desc()).limit(20),
+        "ix_trades_user_created",
+    ),
+    "today_trade_count": (
+        select(func.count(Trade.id)).where(Trade.user_id == 1, Trade.created_at >= TODAY),
+        "ix_trades_user_created",
+    ),
+    "session_trades": (
+        select(Trade.side, Trade.quantity).where(Trade.session_id == 1),
+        "ix_trades_session_id",
+    ),
+    "active_sessions": (
+        select(TradeSession).where(
+            TradeSession.user_id == 1,
+            TradeSession.status.in_(
+                [SessionState.RUNNING, SessionState.PAUSED, SessionState.PENDING]
+            ),
+        ),
+        "ix_trade_sessions_user_status",
+    ),
+    "recent_sessions": (
+        select(TradeSession)
+        .where(TradeSession.user_id == 1)
+        .order_by(TradeSession.created_at.desc())
+        .limit(50),
+        "ix_trade_sessions_user_created",
+    ),
+}
+
+
+def _config(connection) -> Config:
+    config = Config(ALEMBIC_INI)
+    config.attributes["connection"] = connection
+    return config
+
+
+def _stamp(connection, revision: str) -> None:
+    command.stamp(_config(connection), revision)
+
+
+def _migrate(connection, revision: str) -> None:
+    config = _config(connection)
+    if revision == "base":
+        # create_all 로 만든 DB 는 이미 최신 상태
+        command.stamp(config, "head")
+        command.downgrade(config, revision)
+    else:
+        command.upgrade(config, revision)
+
+
+async def _plan(conn, stmt) -> str:
+    dialect = conn.dialect
+    sql = str(stmt.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+    prefix = "EXPLAIN QUERY PLAN " if dialect.name == "sqlite" else "EXPLAIN "
+    rows = (await conn.execute(text(prefix + sql))).all()
+    return "\n".join(str(row[-1]) for row in rows)
+
+
+@pytest.fixture
+async def sqlite_engine(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'plans.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+class TestSqliteQueryPlans:
+    @pytest.mark.parametrize("name", sorted(HOT_QUERIES))
+    async def test_hot_query_uses_index(self, sqlite_engine, name):
+        stmt, index = HOT_QUERIES[name]
+        async with sqlite_engine.connect() as conn:
+            plan = await _plan(conn, stmt)
+        assert index in plan, plan
+        assert "TEMP B-TREE" not in plan, plan
+
+    async def test_migration_adds_indexes_to_existing_tables(self, sqlite_engine):
+        stmt, index = HOT_QUERIES["logs_by_category"]
+        async with sqlite_engine.begin() as conn:
+            await conn.run_sync(_migrate, "base")
+            assert index not in await _plan(conn, stmt)
+            await conn.run_sync(_migrate, "head")
+            assert index in await _plan(conn, stmt)
+
+
+class TestLegacySqliteTimestamps:
+    async def test_cursor_pages_over_server_default_rows(self, sqlite_engine):
+        async with sqlite_engine.begin() as conn:
+            # 예전 행처럼 created_at 을 서버 기본값(초 단위)으로 채움
+            for i in range(3):
+                await conn.execute(
+                    text(
+                        "INSERT INTO trade_logs (user_id, level, category, message) "
+                        f"VALUES (1, 'INFO', 'engine', 'legacy {i}')"
+                    )
+                )
+            await conn.run_sync(_stamp, "0002_trade_log_metadata_gin")
+            await conn.run_sync(_migrate, "head")
+
+            seen, cursor = [], None
+            while True:
+                stmt = newest_first(
+                    select(TradeLog.id, TradeLog.created_at).where(TradeLog.user_id == 1),
+                    TradeLog.created_at,
+                    TradeLog.id,
+                    cursor,
+                ).limit(1)
+                rows = (await conn.execute(stmt)).all()
+                seen += [row.id for row in rows]
+                cursor = next_cursor(rows, 1)
+                if cursor is None:
+                    break
+        assert seen == [3, 2, 1]
+
+
+@pytest.fixture
+async def postgres_engine():
+    url = os.environ.get("TEST_POSTGRES_URL")
+    if not url:
+        pytest.skip("TEST_POSTGRES_URL not set")
+    pytest.importorskip("asyncpg")
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
+
+
+class TestPostgresQueryPlans:
+    @pytest.mark.parametrize("name", sorted(HOT_QUERIES))
+    async def test_hot_query_uses_index(self, postgres_engine, name):
+        stmt, index = HOT_QUERIES[name]
+        async with postgres_engine.connect() as conn:
+            # 빈 테이블에서는 순차 스캔이 더 싸므로 인덱스를 쓸 수 있는지만 확인
+            await conn.execute(text("SET enable_seqscan = off"))
+            plan = await _plan(conn, stmt)
+        assert index in plan, plan
+
+    async def test_metadata_containment_uses_gin(self, postgres_engine):
+        stmt = select(TradeLog.id).where(
+            TradeLog.metadata_json.op("@>")(cast(literal('{"stock_code": "005930"}'), JSONB))
+        )
+        async with postgres_engine.connect() as conn:
+            await conn.execute(text("SET enable_seqscan = off"))
+            plan = await _plan(conn, stmt)
+        assert "ix_trade_logs_metadata_gin" in plan, plan
@@ -0,0 +1,145 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from app.core.log_sink import DatabaseLogSink
+
+from app.engine.clock import ReplayClock
+from app.engine.datasource import ReplayDataSource
+from app.engine.replay import MarketReplay, ReplaySession
+from app.market.bars import bar_aggregator
+from app.market.store import KST, OHLCVStore, date_to_ts
+from app.strategies.indicators import indicator_cache
+
+
+def _ticks(prices: list[float], start: str = "202601050900") -> pd.DataFrame:
+    base = date_to_ts(start)
+    return pd.DataFrame(
+        {
+            "ts": base + np.arange(len(prices)) * 60,
+            "price": prices,
+            "volume": np.arange(len(prices)) * 100,
+        }
+    )
+
+
+class TestReplay:
+    async def test_data_source_follows_clock(self, tmp_path):
+        store = OHLCVStore(tmp_path)
+        store.ingest(
+            "005930",
+            "D",
+            [
+                {"date": d, "open": 1, "high": 1, "low": 1, "close": 1, "volume": 1}
+                for d in ("20260101", "20260102", "20260105")
+            ],
+        )
+        clock = ReplayClock(datetime(2026, 1, 5, 9, 2, 30, tzinfo=KST), speed=1)
+        source = ReplayDataSource({"005930": _ticks([100, 105, 95, 120])}, clock, store)
+
+        quote = await source.quote("005930")
+        assert quote["current_price"] == 95
+        assert (quote["open_price"], quote["high"], quote["low"]) == (100, 105, 95)
+        # 재생 당일 봉은 미래 데이터이므로 제외
+        history = await source.daily_history("005930", 10)
+        assert list(history["date"]) == ["20260101", "20260102"]
+
+    async def test_replay_drives_executor_and_orders(self, tmp_path):
+        prices = [100.0] * 3 + [90.0] * 3 + [110.0] * 3
+        replay = MarketReplay(
+            [
+                ReplaySession(
+                    strategy_type="threshold",
+                    parameters={"buy_price": 95, "sell_price": 105},
+                    stock_code="005930",
+                )
+            ],
+            {"005930": _ticks(prices)},
+            start=datetime(2026, 1, 5, 9, 0, 30, tzinfo=KST),
+            speed=1000,
+            store=OHLCVStore(tmp_path),
+        )
+        result = await replay.run()
+
+        sides = [o["side"] for o in result.orders]
+        assert "BUY" in sides and "SELL" in sides
+        assert sides.index("BUY") < sides.index("SELL")
+        statuses = [e["payload"].get("status") for e in result.events]
+        assert "evaluated" in statuses and statuses[-1] == "stopped"
+        # 가격이 HOLD 구간 안에 있는 동안은 전략 평가를 건너뜀
+        reasons = [e["payload"].get("signal_reason", "") for e in result.events]
+        assert any("inside hold band" in r for r in reasons)
+        assert all(e["at"].startswith("2026-01-05T09:") for e in result.events)
+        summary = result.summary()
+        assert summary["cycles"] >= 5
+        assert summary["wall_seconds"] < 5
+
+    async def test_sessions_sleep_until_open(self, tmp_path):
+        replay = MarketReplay(
+            [
+                ReplaySession(
+                    strategy_type="threshold",
+                    parameters={"buy_price": 95, "sell_price": 105},
+                    stock_code=code,
+                )
+                for code in ("005930", "000660")
+            ],
+            {code: _ticks([100.0] * 3) for code in ("005930", "000660")},
+            start=datetime(2026, 1, 5, 8, 58, tzinfo=KST),
+            end=datetime(2026, 1, 5, 9, 2, tzinfo=KST),
+            speed=1000,
+            store=OHLCVStore(tmp_path),
+        )
+        result = await replay.run()
+
+        waiting = [e for e in result.events if e["payload"].get("status") == "waiting_market"]
+        # 세션마다 대기 알림은 한 번, 장 상태 방송은 휴장/개장 각 한 번
+        assert len(waiting) == 2
+        assert waiting[0]["payload"]["market_status"]["next_open_at"] == "2026-01-05T09:00:00+09:00"
+        market = [e["payload"]["is_open"] for e in result.events if e["type"] == "market.status"]
+        assert market == [False, True]
+        evaluated = [e for e in result.events if e["payload"].get("status") == "evaluated"]
+        assert evaluated and all(e["at"] >= "2026-01-05T09:00" for e in evaluated)
+
+    async def test_replay_keeps_shared_state_untouched(self, tmp_path):
+        store = OHLCVStore(tmp_path)
+        days = pd.bdate_range("2025-11-03", "2026-01-02").strftime("%Y%m%d")
+        store.ingest(
+            "005930",
+            "D",
+            [
+                {"date": d, "open": 100, "high": 100, "low": 100, "close": 100 + i % 5, "volume": 1}
+                for i, d in enumerate(days)
+            ],
+        )
+        replay = MarketReplay(
+            [
+                ReplaySession(strategy_type="sma_crossover", parameters={}, stock_code="005930"),
+                ReplaySession(
+                    strategy_type="threshold",
+                    parameters={"buy_price": 95, "sell_price": 105},
+                    stock_code="005930",
+                    timeframe="1m",
+                ),
+            ],
+            {"005930": _ticks([100.0] * 5)},
+            start=datetime(2026, 1, 5, 9, 0, 30, tzinfo=KST),
+            speed=1000,
+            store=store,
+        )
+        indicator_cache.clear()
+        persisted = []
+        sink_id = logger.add(persisted.append, filter=DatabaseLogSink.accepts)
+        try:
+            result = await replay.run()
+        finally:
+            logger.remove(sink_id)
+
+        assert result.summary()["cycles"] >= 2
+        assert {e["payload"].get("signal") for e in result.events} >= {"HOLD"}
+        # 재생은 전역 봉 집계기·지표 캐시·trade_logs 를 건드리지 않음
+        assert ("005930", "1m") not in bar_aggregator._series
+        assert indicator_cache.stats()["misses"] == 0
+        assert persisted == []
@@ -1,7 +1,10 @@
+import numpy as np
 import pandas as pd
 import pytest
 
 from app.engine.signals import Signal
+from app.engine.triggers import TriggerIndex
+from app.strategies.composite import CompositeStrategy
 from app.strategies.registry import get_available_strategies, get_strategy
 from app.strategies.sma_crossover import SMACrossoverStrategy
 from app.strategies.rsi_strategy import RSIStrategy
@@ -141,3 +144,324 @@ class TestStateMachine:
         assert not can_transition(SessionState.STOPPED, SessionState.RUNNING)
         assert not can_transition(SessionState.PENDING, SessionState.PAUSED)
         assert not can_transition(SessionState.ERROR, SessionState.RUNNING)
+
+
+class TestBatchEvaluation:
+    def _series(self, n: int = 40) -> list[list[float]]:
+        return [
+            [100.0 - i * 2 for i in range(n)],
+            [100.0 + i * 2 for i in range(n)],
+            [100.0 + (i % 7) * 3 for i in range(n)],
+        ]
+
+    @pytest.mark.parametrize(
+        "cls, params",
+        [
+            (RSIStrategy, [{"rsi_period": 14}, {"rsi_period": 14}, {"rsi_period": 7}]),
+            (
+                SMACrossoverStrategy,
+                [
+                    {"short_period": 5, "long_period": 20},
+                    {"short_period": 3, "long_period": 10},
+                    {"short_period": 5, "long_period": 20},
+                ],
+            ),
+            (
+                ThresholdStrategy,
+                [{"buy_price": 50, "sell_price": 150}] * 3,
+            ),
+        ],
+    )
+    def test_batch_matches_evaluate(self, cls, params):
+        import numpy as np
+
+        series = self._series()
+        signals, reasons = cls.evaluate_batch(
+            np.array(series), params, np.array([s[-1] for s in series])
+        )
+        for closes, p, signal, reason in zip(series, params, signals, reasons):
+            strategy = cls(p)
+            assert strategy.evaluate(closes[-1], _make_ohlcv(closes), None) == signal
+            assert strategy.get_signal_reason() == reason
+
+    @pytest.mark.parametrize(
+        "cls,params",
+        [
+            (RSIStrategy, [{"rsi_period": 14}, {"rsi_period": 7}, {"rsi_period": 14}]),
+            (SMACrossoverStrategy, [{"short_period": 3, "long_period": 10}] * 3),
+        ],
+    )
+    def test_default_batch_loops_evaluate(self, cls, params):
+        import numpy as np
+
+        from app.strategies.base import BaseStrategy
+
+        closes = np.array(self._series())
+        # 기본 구현은 행마다 evaluate 를 돌리므로 벡터화 구현과 결과가 같아야 함
+        assert BaseStrategy.evaluate_batch.__func__(cls, closes, params) == cls.evaluate_batch(
+            closes, params
+        )
+
+    async def test_evaluator_groups_concurrent_requests(self, monkeypatch):
+        import asyncio
+
+        from app.engine.batch import BatchEvaluator
+
+        calls = []
+        original = RSIStrategy.evaluate_batch.__func__
+
+        def counting(cls, closes, params, current_prices=None):
+            calls.append(len(params))
+            return original(cls, closes, params, current_prices)
+
+        monkeypatch.setattr(RSIStrategy, "evaluate_batch", classmethod(counting))
+        evaluator = BatchEvaluator()
+        strategies = [RSIStrategy({"rsi_period": 14}) for _ in range(5)]
+        df = _make_ohlcv([100.0 + i * 2 for i in range(30)])
+
+        signals = await asyncio.gather(
+            *(evaluator.evaluate(s, 160.0, df, None) for s in strategies)
+        )
+        assert calls == [5]
+        assert set(signals) == {Signal.SELL}
+        assert all(s.get_signal_reason().startswith("RSI overbought") for s in strategies)
+
+
+class TestIndicatorCache:
+    def _tagged(self, closes: list[float]) -> pd.DataFrame:
+        df = _make_ohlcv(closes)
+        # 마지막 봉 날짜가 같도록 끝에서부터 날짜를 매김
+        df["date"] = [f"day-{len(closes) - i}" for i in range(len(closes))]
+        df.attrs.update(stock_code="005930", timeframe="D")
+        return df
+
+    def test_sessions_share_indicators(self):
+        from app.strategies.base import DEFAULT_HISTORY
+        from app.strategies.indicators import indicator_cache
+
+        indicator_cache.clear()
+        closes = [100.0 + (i % 9) for i in range(70)]
+        # 실행기처럼 전략마다 필요한 봉 수만큼만 넘김 (61개, 60개)
+        for params in ({"short_period": 5, "long_period": 60}, {"short_period": 5, "long_period": 20}):
+            strategy = SMACrossoverStrategy(params)
+            history = max(DEFAULT_HISTORY, strategy.required_history())
+            strategy.evaluate(closes[-1], self._tagged(closes[-history:]), None)
+        # SMA5 is computed once for both sessions
+        assert indicator_cache.hits == 1
+        assert indicator_cache.misses == 3
+
+    def test_shorter_frames_reuse_the_longest_series(self):
+        from app.strategies.indicators import indicator_cache, sma
+
+        indicator_cache.clear()
+        closes = [100.0 + (i % 7) for i in range(201)]
+        short = sma(self._tagged(closes[-60:]), 5)
+        long = sma(self._tagged(closes), 5)
+        assert indicator_cache.misses == 2  # 더 긴 봉이 오면 한 번 다시 계산
+        again = sma(self._tagged(closes[-60:]), 5)
+        assert indicator_cache.hits == 1
+
+        expected = _make_ohlcv(closes[-60:])["close"].rolling(5).mean()
+        assert (len(short), len(long), len(again)) == (60, 201, 60)
+        assert list(again.index) == list(range(60))
+        assert np.allclose(again, expected, equal_nan=True)
+        assert np.allclose(again, short, equal_nan=True)
+
+    def test_new_bar_misses(self):
+        from app.strategies.indicators import indicator_cache, rsi
+
+        indicator_cache.clear()
+        closes = [100.0 + i for i in range(30)]
+        rsi(self._tagged(closes), 14)
+        rsi(self._tagged(closes), 14)
+        rsi(self._tagged(closes[:-1] + [99.0]), 14)
+        assert indicator_cache.stats()["hits"] == 1
+        assert indicator_cache.stats()["misses"] == 2
+
+    def test_lru_eviction(self):
+        from app.strategies.indicators import IndicatorCache
+
+        cache = IndicatorCache(maxsize=2)
+        for key in ("a", "b", "a", "c"):
+            cache.get_or_compute(key, lambda: key)
+        assert cache.stats()["size"] == 2
+        cache.get_or_compute("b", lambda: "b")
+        assert cache.misses == 4
+
+
+class TestCompositeStrategy:
+    def test_shared_subexpressions_compile_once(self):
+        strategy = CompositeStrategy(
+            {
+                "buy_rule": "rsi(14) < 30 and close > sma(20)",
+                "sell_rule": "30 > rsi(14) or sma(20) > close",
+            }
+        )
+        ops = [step.op for step in strategy.plan.steps]
+        assert ops.count("rsi") == 1
+        assert ops.count("sma") == 1
+        # "close > sma(20)" and "sma(20) > close" are different comparisons,
+        # but "rsi(14) < 30" and "30 > rsi(14)" are the same one
+        assert ops.count("lt") == 3
+        assert strategy.required_history() == 20
+
+    def test_plan_is_shared_between_instances(self):
+        params = {"buy_rule": "close > sma(5)", "sell_rule": "close < sma(5)"}
+        assert CompositeStrategy(params).plan is CompositeStrategy(dict(params)).plan
+
+    def test_buy_and_sell(self):
+        strategy = CompositeStrategy(
+            {"buy_rule": "cross_above(close, sma(5))", "sell_rule": "close < prev(close, 2)"}
+        )
+        rising = _make_ohlcv([100.0] * 10 + [110.0])
+        assert strategy.evaluate(110.0, rising, None) == Signal.BUY
+        assert strategy.get_signal_reason().startswith("Buy rule matched")
+        falling = _make_ohlcv([100.0] * 8 + [105.0, 104.0, 95.0])
+        assert strategy.evaluate(95.0, falling, None) == Signal.SELL
+        flat = _make_ohlcv([100.0] * 11)
+        assert strategy.evaluate(100.0, flat, None) == Signal.HOLD
+        assert "sma(5)=100.00" in strategy.get_signal_reason()
+
+    def test_sessions_with_different_history_on_one_stock(self):
+        from app.strategies.indicators import indicator_cache
+
+        indicator_cache.clear()
+        closes = [100.0 + (i % 11) for i in range(201)]
+
+        def tagged(values: list[float]) -> pd.DataFrame:
+            df = _make_ohlcv(values)
+            df["date"] = [f"day-{len(values) - i}" for i in range(len(values))]
+            df.attrs.update(stock_code="005930", timeframe="D")
+            return df
+
+        long_session = SMACrossoverStrategy({"short_period": 5, "long_period": 200})
+        composite = CompositeStrategy(
+            {"buy_rule": "close > sma(5) and close > sma(200)", "sell_rule": "close < sma(5)"}
+        )
+        short_composite = CompositeStrategy({"buy_rule": "close > sma(5)"})
+        for _ in range(2):  # 두 번째 주기는 캐시에서 읽음
+            long_session.evaluate(closes[-1], tagged(closes), None)
+            composite.evaluate(closes[-1], tagged(closes), None)
+            short_composite.evaluate(closes[-1], tagged(closes[-60:]), None)
+            assert "sma(5)=" in short_composite.get_signal_reason()
+
+    def test_indicator_longer_than_frame_is_aligned(self, monkeypatch):
+        from app.strategies import composite
+
+        df = _make_ohlcv([100.0] * 10 + [110.0])
+        longer = pd.Series([0.0] * 5 + [100.0] * 11)
+        monkeypatch.setitem(composite.INDICATORS, "sma", (lambda _df, _w: longer, 0))
+        strategy = CompositeStrategy({"buy_rule": "close > sma(5)"})
+        assert strategy.evaluate(110.0, df, None) == Signal.BUY
+
+    def test_condition_roots_and_period_bounds(self):
+        strategy = CompositeStrategy(
+            {"buy_rule": "prev(close > sma(200))", "sell_rule": "not (close > 1) or rsi(14) > 70"}
+        )
+        assert strategy.required_history() == 201
+
+    def test_insufficient_data(self):
+        strategy = CompositeStrategy({"buy_rule": "rsi(14) < 30"})
+        assert strategy.evaluate(100.0, _make_ohlcv([100.0] * 10), None) == Signal.HOLD
+        assert "Insufficient data" in strategy.get_signal_reason()
+
+    @pytest.mark.parametrize(
+        "rule",
+        [
+            "",
+            "close >",
+            "__import__('os')",
+            "sma(x) > 1",
+            "close == 1",
+            "foo > 1",
+            "close.real > 1",
+            # 조건이 아닌 식은 매 사이클 참이 되므로 거부
+            "close",
+            "sma(20) - close",
+            "prev(close)",
+            "close > 1 and volume",
+            "not rsi(14)",
+            # 기간 상한
+            "close > sma(100000)",
+            "prev(close > 1, 201)",
+        ],
+    )
+    def test_invalid_rules(self, rule):
+        with pytest.raises(ValueError):
+            CompositeStrategy({"buy_rule": rule})
+
+    def test_registered(self):
+        schema = {s["type_name"]: s for s in get_available_strategies()}["composite"]
+        strategy = get_strategy(
+            "composite",
+            {name: spec["default"] for name, spec in schema["parameter_schema"].items()},
+        )
+        assert isinstance(strategy, CompositeStrategy)
+
+
+def _with_close(df: pd.DataFrame, price: float) -> pd.DataFrame:
+    df = df.copy()
+    df.loc[len(df) - 1, "close"] = price
+    return df
+
+
+class TestSignalBands:
+    def test_threshold_band_is_exact(self):
+        strategy = ThresholdStrategy({"buy_price": 95, "sell_price": 105})
+        low, high = strategy.signal_band(100, _make_ohlcv([100]))
+        assert 95 < low <= 95.0001 and 104.9999 <= high < 105
+        assert strategy.signal_band(90, _make_ohlcv([90])) == (-np.inf, np.nextafter(95, 0))
+
+    @pytest.mark.parametrize(
+        "strategy",
+        [
+            SMACrossoverStrategy({"short_period": 5, "long_period": 20}),
+            RSIStrategy({"rsi_period": 14, "oversold": 30, "overbought": 70}),
+        ],
+    )
+    def test_signal_is_constant_inside_band_and_changes_outside(self, strategy):
+        rng = np.random.default_rng(7)
+        for _ in range(20):
+            df = _make_ohlcv(list(100 + np.cumsum(rng.normal(0, 2, 40))))
+            price = float(df["close"].iloc[-1])
+            signal = strategy.evaluate(price, df, None)
+            band = strategy.signal_band(price, df)
+            if band is None:
+                continue
+            low, high = band
+            for p in np.linspace(max(low, price - 20), min(high, price + 20), 9):
+                assert strategy.evaluate(p, _with_close(df, p), None) == signal
+            for p in (low - 1e-6 * price, high + 1e-6 * price):
+                if np.isfinite(p):
+                    assert strategy.evaluate(p, _with_close(df, p), None) != signal
+
+    def test_composite_has_no_band(self):
+        strategy = CompositeStrategy({"buy_rule": "close < 90", "sell_rule": "close > 110"})
+        assert strategy.signal_band(100, _make_ohlcv([100])) is None
+
+
+class TestTriggerIndex:
+    def test_wakes_only_broken_bands(self):
+        index = TriggerIndex()
+        woken = []
+        for key, (low, high) in enumerate([(90, 110), (95, 105), (99, 101), (50, 150)]):
+            index.set_band("005930", key, low, high, wake=lambda p, k=key: woken.append(k))
+        index.set_band("000660", "other", 0, 1)
+
+        assert index.on_tick("005930", 100) == []
+        assert sorted(index.on_tick("005930", 103)) == [2]
+        assert sorted(index.on_tick("005930", 92)) == [1]
+        assert woken == [2, 1]
+        # 깨어난 구간은 제거되고 나머지는 유지
+        assert len(index) == 3 and 2 not in index
+        assert index.on_tick("005930", 92) == []
+
+    def test_replacing_and_removing_bands(self):
+        index = TriggerIndex()
+        index.set_band("005930", "a", 90, 110)
+        index.set_band("005930", "a", 99, 101)
+        assert index.band("a") == (99, 101)
+        assert index.on_tick("005930", 105) == ["a"]
+        index.set_band("005930", "b", 90, 110)
+        index.remove("b")
+        assert len(index) == 0 and index.on_tick("005930", 0) == []
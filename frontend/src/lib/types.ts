@@ -147,6 +147,7 @@ export interface SessionStatusUpdate {
     is_open: boolean
     reason: string
     next_open: string | null
+    next_open_at?: string | null
     current_time: string
   }
 }
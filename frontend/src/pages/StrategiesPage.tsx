@@ -127,7 +127,7 @@ export default function StrategiesPage() {
                         {(schema as any).description || key}
                       </label>
                       <input
-                        type="number"
+                        type={(schema as any).type === 'string' ? 'text' : 'number'}
                         value={params[key] || ''}
                         onChange={(e) =>
                           setParams((prev) => ({ ...prev, [key]: e.target.value }))
@@ -133,9 +133,12 @@ function SessionCard({
                 <span>
                   {status.market_status.reason === 'weekend'
                     ? '주말 - 장 휴무'
-                    : status.market_status.reason === 'before_open'
-                      ? '장 시작 전'
-                      : '장 마감'}
+                    : status.market_status.reason === 'holiday'
+                      ? '휴장일'
+                      : status.market_status.reason === 'before_open'
+                        ? '장 시작 전'
+                        : '장 마감'}
+                  {status.market_status.next_open && ` · 개장 ${status.market_status.next_open}`}
                 </span>
               </div>
             )}